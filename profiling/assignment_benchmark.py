@@ -0,0 +1,66 @@
+"""
+Benchmark validated property assignment on model entity instances, both by assigning
+properties directly and by loading the linked-art example record from tests/data.
+
+Usage: python profiling/assignment_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+import semanticpy
+
+from semanticpy import Model
+
+
+def main(iterations: int = 200):
+    model = Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    artefact = model.HumanMadeObject(ident="https://example.org/object/1")
+    name = model.Name(content="Example")
+    typed = model.Type(ident="http://vocab.getty.edu/aat/300404670", label="Title")
+
+    def assign():
+        artefact._label = "Example Object"
+        artefact.identified_by = name
+        artefact.classified_as = typed
+
+    count = iterations * 1000
+
+    elapsed = timeit.timeit(assign, number=count)
+
+    print(
+        "assignment: %.3f µs per property (%d assignments)"
+        % (elapsed / (count * 3) * 1e6, count * 3)
+    )
+
+    elapsed = timeit.timeit(lambda: Model.open(filepath), number=iterations)
+
+    print("open(): %.3f ms per record (%d records)" % (elapsed / iterations * 1e3, iterations))
+
+    def unplanned():
+        Model._assignments.clear()
+        Model.open(filepath)
+
+    elapsed = timeit.timeit(unplanned, number=iterations)
+
+    print(
+        "open() without assignment plans: %.3f ms per record (%d records)"
+        % (elapsed / iterations * 1e3, iterations)
+    )
+
+    for range in ["crm:E55_Type", "crm:E33_E41_Linguistic_Appellation"]:
+        elapsed = timeit.timeit(lambda: Model._find_type(range=range), number=count)
+
+        print("_find_type(%s): %.3f µs" % (range, elapsed / count * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
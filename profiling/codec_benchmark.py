@@ -0,0 +1,67 @@
+"""
+Benchmark the available JSON codec backends on the example records in tests/data, by
+parsing each record, loading it into the model via Model.open(), and serializing it.
+
+Usage: python profiling/codec_benchmark.py [iterations]
+"""
+
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+from semanticpy.codec import Codec
+
+
+def main(iterations: int = 200):
+    Model.factory(profile="linked-art", globals={})
+
+    # The extended examples require model extensions, so only the standard ones are used
+    filepaths = sorted(
+        filepath
+        for filepath in glob.glob(
+            os.path.join(os.path.dirname(__file__), "..", "tests", "data", "examples", "*.json")
+        )
+        if not "extended" in filepath
+    )
+
+    contents = [open(filepath, "rb").read() for filepath in filepaths]
+
+    print("%d example records, %d bytes in total" % (len(contents), sum(len(content) for content in contents)))
+
+    for name in Codec.available():
+        codec = Codec.named(name)
+
+        Model.configure(codec=codec)
+
+        records = [Model.open(filepath) for filepath in filepaths]
+
+        documents = [codec.loads(content) for content in contents]
+
+        results = {
+            "loads": timeit.timeit(lambda: [codec.loads(content) for content in contents], number=iterations),
+            "dumps": timeit.timeit(lambda: [codec.dumps(document, indent=2) for document in documents], number=iterations),
+            "open()": timeit.timeit(lambda: [Model.open(filepath) for filepath in filepaths], number=iterations),
+            "json()": timeit.timeit(lambda: [record.json(indent=2) for record in records], number=iterations),
+            "json(compact)": timeit.timeit(lambda: [record.json(compact=True) for record in records], number=iterations),
+        }
+
+        print(
+            "%-8s %s"
+            % (
+                name,
+                "  ".join(
+                    "%s: %.1f µs" % (label, elapsed / (iterations * len(contents)) * 1e6)
+                    for label, elapsed in results.items()
+                ),
+            )
+        )
+
+    Model.teardown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
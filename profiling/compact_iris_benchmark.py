@@ -0,0 +1,63 @@
+"""
+Benchmark compacting the IRIs of a generated linked-art record into prefixed IRIs via
+properties(), and loading the record's data with its IRIs compacted via create(), with a
+varying number of registered prefixes, compared with serializing and loading the record
+with its IRIs left as-is.
+
+Usage: python profiling/compact_iris_benchmark.py [names] [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import ModelRegistry
+
+
+def main(names: int = 500, iterations: int = 20):
+    for prefixes in [1, 10, 100]:
+        registry = ModelRegistry(profile="linked-art")
+
+        for index in range(prefixes - 1):
+            registry.prefix("prefix%d" % (index), "https://example.org/%d/" % (index))
+
+        # Register a shorter namespace which also matches the identifiers, so that the
+        # longest matching namespace must be found
+        registry.prefix("getty", "http://vocab.getty.edu/")
+        registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+        record = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+
+        for index in range(names):
+            name = registry.Name(content="Example Object Name %d" % (index))
+            name.classified_as = registry.Type(
+                ident="http://vocab.getty.edu/aat/%d" % (300404670 + index % 20)
+            )
+            record.identified_by = name
+
+        data: dict = record.properties()
+
+        for label, statement in [
+            ("properties()", lambda: record.properties()),
+            (
+                "properties(compact_iris=True)",
+                lambda: record.properties(compact_iris=True),
+            ),
+            ("create()", lambda: registry.create(data, trusted=True)),
+            (
+                "create(compact_iris=True)",
+                lambda: registry.create(data, trusted=True, compact_iris=True),
+            ),
+        ]:
+            elapsed = min(timeit.repeat(statement, number=iterations, repeat=5))
+
+            print(
+                "%-30s with %3d prefixes: %7.2f ms per call"
+                % (label, prefixes, elapsed / iterations * 1e3)
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
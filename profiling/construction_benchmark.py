@@ -0,0 +1,47 @@
+"""
+Benchmark constructing model entity instances, both the small Type, Name and Identifier
+nodes that make up much of a record, and by loading the linked-art example record from
+tests/data, which constructs each of the record's nodes.
+
+Usage: python profiling/construction_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def main(iterations: int = 200):
+    model = Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    count = iterations * 500
+
+    constructions = {
+        "Type()": lambda: model.Type(),
+        "Type(ident, label)": lambda: model.Type(
+            ident="http://vocab.getty.edu/aat/300404670", label="Title"
+        ),
+        "Name(content)": lambda: model.Name(content="Example"),
+        "Identifier(content)": lambda: model.Identifier(content="1983.1"),
+    }
+
+    for name, construct in constructions.items():
+        elapsed = timeit.timeit(construct, number=count)
+
+        print("%s: %.3f µs per instance (%d instances)" % (name, elapsed / count * 1e6, count))
+
+    elapsed = timeit.timeit(lambda: Model.open(filepath), number=iterations)
+
+    print("open(): %.3f ms per record (%d records)" % (elapsed / iterations * 1e3, iterations))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
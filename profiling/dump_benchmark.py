@@ -0,0 +1,98 @@
+"""
+Benchmark writing a large generated linked-art record to a file, comparing generating its
+JSON via json() and then writing the string, as save() formerly did, with streaming it
+via dump(), in both the indented and compact forms; each method is measured in its own
+process, reporting the throughput and the increase in peak memory, both traced by Python
+and as the process's peak resident set size (RSS), over that held once the record is
+built.
+
+Usage: python profiling/dump_benchmark.py [names]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def build(names: int):
+    model = Model.factory(profile="linked-art", globals={})
+
+    record = model.HumanMadeObject(ident="https://data.example.org/object/1")
+    record._label = "Example Object"
+
+    for index in range(names):
+        name = model.Name(content="Example Object Name %d" % (index))
+        name.classified_as = model.Type(ident="http://vocab.getty.edu/aat/300404670")
+        name.referred_to_by = statement = model.LinguisticObject()
+        statement.content = "A statement about the example object's name %d" % (index)
+        record.identified_by = name
+
+    return record
+
+
+def measure(method: str, compact: bool, names: int):
+    record = build(names)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "record.json")
+
+        def write():
+            with open(filepath, "w", encoding="utf-8") as handle:
+                if method == "json":
+                    handle.write(record.json(compact=compact))
+                else:
+                    record.dump(handle, compact=compact)
+
+        # Measure the throughput and peak RSS first, as the traced run is slower, and the
+        # process's peak RSS is a high-water mark which only the first write can raise
+        resident = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        started = time.perf_counter()
+        write()
+        elapsed = time.perf_counter() - started
+
+        resident = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - resident
+
+        size = os.path.getsize(filepath)
+
+        tracemalloc.start()
+        write()
+        traced = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(
+        "%-5s %-8s %8.2f MB in %6.3f s (%6.2f MB/s), peak traced +%7.2f MB, peak RSS +%7.2f MB"
+        % (
+            method,
+            "compact" if compact else "indented",
+            size / 1e6,
+            elapsed,
+            size / 1e6 / elapsed,
+            traced / 1e6,
+            resident / 1e3,
+        )
+    )
+
+
+def main(names: int = 10000):
+    for compact in [False, True]:
+        for method in ["json", "dump"]:
+            subprocess.run(
+                [sys.executable, __file__, "--measure", method, str(compact), str(names)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        measure(sys.argv[2], sys.argv[3] == "True", int(sys.argv[4]))
+    else:
+        main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,50 @@
+"""
+Benchmark comparing two separately loaded copies of the linked-art example record from
+tests/data via equals(), strictly and not, and filtering a list of the record's nodes.
+
+Usage: python profiling/equality_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+from semanticpy.types import Nodes
+
+
+def main(iterations: int = 200):
+    Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    record = Model.open(filepath)
+    another = Model.open(filepath)
+
+    nodes = Nodes([*another.identified_by, *another.classified_as])
+
+    def strict():
+        assert record.equals(another, strict=True)
+
+    def loose():
+        assert record.equals(another)
+
+    def contains():
+        assert record.classified_as[-1] in nodes
+
+    for label, function in [
+        ("equals(strict=True)", strict),
+        ("equals()", loose),
+        ("Nodes.__contains__()", contains),
+    ]:
+        elapsed = min(timeit.repeat(function, number=iterations, repeat=5))
+
+        print("%-25s %9.2f µs per call" % (label + ":", elapsed / iterations * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,89 @@
+"""
+Benchmark exporting generated linked-art records to a JSON Lines file via the export
+module's jsonl() function, with a varying number of worker processes, with and without
+compression, compared with serializing the records via json() in a loop, and report the
+export's throughput statistics.
+
+Usage: python profiling/export_benchmark.py [records] [workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+import semanticpy.export
+
+from semanticpy import ModelRegistry
+
+
+def main(records: int = 20000, workers: int = None):
+    registry = ModelRegistry(profile="linked-art")
+
+    def generate():
+        for index in range(records):
+            record = registry.HumanMadeObject(
+                ident="https://data.example.org/object/%d" % (index)
+            )
+            record._label = "Example Object %d" % (index)
+
+            for number in range(5):
+                name = registry.Name(content="Example Name %d.%d" % (index, number))
+                name.classified_as = registry.Type(
+                    ident="http://vocab.getty.edu/aat/%d" % (300404670 + number)
+                )
+                record.identified_by = name
+
+            yield record
+
+    # As the records are generated as they are exported, time generating them alone
+    started = time.perf_counter()
+
+    for record in generate():
+        pass
+
+    generating = time.perf_counter() - started
+
+    print("generating the records: %.2f s" % (generating))
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "records.jsonl")
+
+        started = time.perf_counter()
+
+        with open(filepath, "w") as handle:
+            for record in generate():
+                handle.write(record.json(compact=True) + "\n")
+
+        print(
+            "json() in a loop:               %.2f s"
+            % (time.perf_counter() - started - generating)
+        )
+
+        for count in sorted({1, 2, workers or os.cpu_count() or 1}):
+            for compress in [False, True]:
+                stats = semanticpy.export.jsonl(
+                    generate(),
+                    filepath,
+                    workers=count,
+                    compress=compress,
+                    overwrite=True,
+                )
+
+                print(
+                    "jsonl(workers=%d, compress=%-5s): %.2f s, %8.0f records/s, %6.2f MB/s, %6.2f MB written"
+                    % (
+                        count,
+                        compress,
+                        stats["seconds"] - generating,
+                        stats["records"] / (stats["seconds"] - generating),
+                        stats["bytes"] / (stats["seconds"] - generating) / 1e6,
+                        stats["written"] / 1e6,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
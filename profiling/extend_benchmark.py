@@ -0,0 +1,85 @@
+"""
+Benchmark extending the linked-art model with a dozen model subclasses, each registering
+a handful of model-wide properties, totalling forty properties, by calling Model.extend()
+for each subclass, and by making the same calls within a Model.extending() block.
+
+Usage: python profiling/extend_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def extensions() -> list[tuple[type, dict]]:
+    """Create the extension subclasses and their model-wide properties afresh, as each
+    subclass can only be registered with the model once."""
+
+    extensions = []
+
+    for index in range(12):
+        subclass = type(
+            "Extension%d" % (index),
+            (Model,),
+            {
+                "_properties": {
+                    "note": {"individual": True, "range": "xsd:string"},
+                },
+            },
+        )
+
+        properties = {
+            "_extension_%d_%d" % (index, number): {
+                "individual": number % 2 == 0,
+                "range": "xsd:string",
+                "sorting": 9000 + number,
+            }
+            for number in range(4 if index < 4 else 3)
+        }
+
+        extensions.append((subclass, properties))
+
+    return extensions
+
+
+def measure(iterations: int, batched: bool) -> float:
+    timings = []
+
+    for iteration in range(iterations):
+        Model.teardown()
+
+        Model.factory(profile="linked-art", globals={})
+
+        prepared = extensions()
+
+        started = time.perf_counter()
+
+        if batched is True:
+            with Model.extending():
+                for subclass, properties in prepared:
+                    Model.extend(subclass, properties=properties, globals={})
+        else:
+            for subclass, properties in prepared:
+                Model.extend(subclass, properties=properties, globals={})
+
+        timings.append(time.perf_counter() - started)
+
+    Model.teardown()
+
+    return sorted(timings)[len(timings) // 2]
+
+
+def main(iterations: int = 50):
+    for batched in [False, True]:
+        print(
+            "extend(batched: %s): %.2f ms for 12 subclasses and 40 properties"
+            % (batched, measure(iterations, batched) * 1e3)
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
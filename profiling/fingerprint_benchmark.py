@@ -0,0 +1,58 @@
+"""
+Benchmark fingerprinting the linked-art example record from tests/data, comparing the
+initial calculation, repeated calls served from the cached fingerprints, recalculation
+after modifying a single nested node, and serializing the record via properties().
+
+Usage: python profiling/fingerprint_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def main(iterations: int = 200):
+    Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    records = [Model.open(filepath) for index in range(iterations * 5)]
+
+    def uncached():
+        records.pop().fingerprint()
+
+    record = Model.open(filepath)
+
+    record.fingerprint()
+
+    def cached():
+        record.fingerprint()
+
+    nested = record.identified_by[0]
+
+    def modified():
+        nested._label = "Modified"
+        record.fingerprint()
+
+    def properties():
+        record.properties()
+
+    for label, function in [
+        ("fingerprint() uncached", uncached),
+        ("fingerprint() cached", cached),
+        ("fingerprint() after modifying a nested node", modified),
+        ("properties()", properties),
+    ]:
+        elapsed = min(timeit.repeat(function, number=iterations, repeat=5))
+
+        print("%-45s %9.2f µs per call" % (label + ":", elapsed / iterations * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,48 @@
+"""
+Benchmark repeatedly serializing a large generated linked-art record via json() after
+modifying a single nested node before each call, as well as serializing it unmodified.
+
+Usage: python profiling/incremental_benchmark.py [names] [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def main(names: int = 2000, iterations: int = 20):
+    model = Model.factory(profile="linked-art", globals={})
+
+    record = model.HumanMadeObject(ident="https://data.example.org/object/1")
+    record._label = "Example Object"
+
+    for index in range(names):
+        name = model.Name(content="Example Object Name %d" % (index))
+        name.classified_as = model.Type(ident="http://vocab.getty.edu/aat/300404670")
+        record.identified_by = name
+
+    modified = [0]
+
+    def modify():
+        modified[0] += 1
+        record.identified_by[modified[0] % names].content = "Modified %d" % (modified[0])
+
+    for compact in [False, True]:
+        for label, function in [
+            ("unmodified", lambda: record.json(compact=compact)),
+            ("after one modification", lambda: modify() or record.json(compact=compact)),
+        ]:
+            elapsed = min(timeit.repeat(function, number=iterations, repeat=5))
+
+            print(
+                "json(compact=%s) %-24s %9.2f ms per call"
+                % (compact, label + ":", elapsed / iterations * 1e3)
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,47 @@
+"""
+Benchmark loading and serializing the linked-art example record from tests/data with the
+library's instrumentation disabled, which is the default, and enabled, and report the
+operation counters and timings that the instrumentation gathered.
+
+Usage: python profiling/instrumentation_benchmark.py [iterations]
+"""
+
+import os
+import pprint
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+import semanticpy
+
+from semanticpy import Model
+
+
+def main(iterations: int = 200):
+    Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    def roundtrip():
+        Model.open(filepath).json()
+
+    for enabled in [False, True]:
+        semanticpy.instrument(enabled=enabled)
+
+        semanticpy.stats(reset=True)
+
+        elapsed = timeit.timeit(roundtrip, number=iterations)
+
+        print(
+            "open() and json() with instrumentation %s: %.3f ms per record"
+            % ("enabled" if enabled else "disabled", elapsed / iterations * 1e3)
+        )
+
+    pprint.pprint(semanticpy.stats(), sort_dicts=False)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,75 @@
+"""
+Measure the memory held per model node, both for bare Type nodes and for the nodes of
+the linked-art example record from tests/data, reporting the traced bytes per node.
+
+Usage: python profiling/node_memory.py [count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+from semanticpy.types import Node
+
+
+def nodes(node: Node) -> list[Node]:
+    """Return the node and all of the nodes nested within it."""
+
+    found: list[Node] = [node]
+
+    for value in node._data.values():
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, Node):
+                found += nodes(item)
+
+    return found
+
+
+def measure(create: callable, count: int) -> tuple[list, int]:
+    """Call create() count times, returning the created values and the traced bytes."""
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    created = [create() for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    return created, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def report(label: str, found: list[Node], size: int):
+    print("%s:" % (label))
+    print("  nodes:                 %d" % (len(found)))
+    print("  traced bytes per node: %.1f" % (size / len(found)))
+
+
+def main(count: int = 2000):
+    model = Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    def typed() -> Node:
+        node = model.Type()
+
+        # Look up a special attribute, as the serializers do, so that the measurement
+        # includes any state that such lookups allocate on the node
+        node._reference
+
+        return node
+
+    created, size = measure(typed, count)
+
+    report("Type()", created, size)
+
+    records, size = measure(lambda: Model.open(filepath), count // 20)
+
+    report("open() record", [node for record in records for node in nodes(record)], size)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,43 @@
+"""
+Benchmark serializing a generated linked-art record whose nodes have prefixed identifiers
+via properties(), with a varying number of registered prefixes.
+
+Usage: python profiling/prefix_benchmark.py [names] [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import ModelRegistry
+
+
+def main(names: int = 500, iterations: int = 20):
+    for prefixes in [1, 10, 100]:
+        registry = ModelRegistry(profile="linked-art")
+
+        for index in range(prefixes - 1):
+            registry.prefix("prefix%d" % (index), "https://example.org/%d/" % (index))
+
+        # Register the prefix used by the identifiers last, as the most costly to find
+        registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+        record = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+
+        for index in range(names):
+            name = registry.Name(content="Example Object Name %d" % (index))
+            name.classified_as = registry.Type(ident="aat:%d" % (300404670 + index % 20))
+            record.identified_by = name
+
+        elapsed = min(timeit.repeat(record.properties, number=iterations, repeat=5))
+
+        print(
+            "properties() with %3d prefixes: %7.2f ms per call"
+            % (prefixes, elapsed / iterations * 1e3)
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
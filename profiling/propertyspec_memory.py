@@ -0,0 +1,113 @@
+"""
+Compare the memory held by entity class property specifications for the linked-art
+profile when each class holds its own dictionary copy of every inherited property
+specification (as Model.factory() previously built them) against the shared, interned
+PropertySpec instances now held by the classes.
+
+Usage: python profiling/propertyspec_memory.py [profile]
+"""
+
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+import semanticpy
+
+from semanticpy.types import PropertySpec
+
+
+def footprint(specs: list[object]) -> tuple[int, int]:
+    """Return the count of distinct specification objects and their shallow size."""
+
+    unique = {id(spec): spec for spec in specs}
+
+    return len(unique), sum(sys.getsizeof(spec) for spec in unique.values())
+
+
+def copies(profile: dict) -> dict[str, dict[str, dict]]:
+    """Build the per-class dictionary copies of each property specification in the way
+    that Model.factory() previously did, walking the superclass chain of each entity."""
+
+    entities: dict[str, dict] = profile["entities"]
+
+    def inherited(name: str) -> dict[str, dict]:
+        entity = entities[name]
+
+        properties = {prop: dict(props) for prop, props in profile["properties"].items()}
+
+        superclasses = entity.get("superclasses") or []
+
+        if isinstance(superclasses, str):
+            superclasses = [superclasses]
+
+        for superclass in superclasses:
+            properties.update(
+                {prop: dict(props) for prop, props in inherited(superclass).items()}
+            )
+
+        properties.update(
+            {prop: dict(props) for prop, props in (entity.get("properties") or {}).items()}
+        )
+
+        return properties
+
+    return {name: inherited(name) for name in entities}
+
+
+def main(profile: str = "linked-art"):
+    filepath = os.path.join(
+        os.path.dirname(semanticpy.__file__), "profiles", "%s.json" % (profile)
+    )
+
+    with open(filepath, "r") as handle:
+        data = json.load(handle)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tables = copies(data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    copied = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    specs = [props for table in tables.values() for props in table.values()]
+
+    count, size = footprint(specs)
+
+    print("Per-class dictionary copies:")
+    print("  class/property entries: %d" % (len(specs)))
+    print("  distinct spec objects:  %d" % (count))
+    print("  shallow spec size:      %d bytes" % (size))
+    print("  traced allocations:     %d bytes" % (copied))
+
+    del tables, specs
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    model = semanticpy.Model.factory(profile=profile, globals={})
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    specs = [
+        props
+        for name, entity in model.items()
+        for props in entity._properties.values()
+        if isinstance(props, PropertySpec)
+    ]
+
+    count, size = footprint(specs)
+
+    factored = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    print("Shared PropertySpec instances:")
+    print("  class/property entries: %d" % (len(specs)))
+    print("  distinct spec objects:  %d" % (count))
+    print("  shallow spec size:      %d bytes" % (size))
+    print("  traced factory() total: %d bytes (including the classes themselves)" % (factored))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,40 @@
+"""
+Benchmark serializing the linked-art example record from tests/data via properties() and
+json(), with the entity classes' own sorting and with a custom sorting.
+
+Usage: python profiling/serialization_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def main(iterations: int = 200):
+    Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    record = Model.open(filepath)
+
+    sorting = ["id", "type", "_label", "identified_by", "classified_as", "content"]
+
+    for label, function in [
+        ("properties()", lambda: record.properties()),
+        ("properties(sorting=...)", lambda: record.properties(sorting=sorting)),
+        ("json()", lambda: record.json()),
+        ("json(compact=True)", lambda: record.json(compact=True)),
+    ]:
+        elapsed = min(timeit.repeat(function, number=iterations, repeat=5))
+
+        print("%-25s %9.2f µs per call" % (label + ":", elapsed / iterations * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
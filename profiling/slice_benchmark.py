@@ -0,0 +1,69 @@
+"""
+Benchmark building the linked-art model through Model.factory() from the whole profile
+and from slices of its entities, reporting the number of entity classes built and the
+memory allocated while building them.
+
+Usage: python profiling/slice_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+SLICES = [
+    None,
+    ["HumanMadeObject", "Type", "Name", "Identifier"],
+    ["Name", "Identifier"],
+]
+
+
+def measure(iterations: int, **kwargs) -> tuple[float, int, int]:
+    timings = []
+
+    for iteration in range(iterations):
+        Model.teardown()
+
+        started = time.perf_counter()
+
+        Model.factory(profile="linked-art", globals={}, **kwargs)
+
+        timings.append(time.perf_counter() - started)
+
+    Model.teardown()
+
+    tracemalloc.start()
+
+    entities = Model.factory(profile="linked-art", globals={}, **kwargs)
+
+    allocated = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    count = len(set(id(entity) for name, entity in entities))
+
+    Model.teardown()
+
+    return sorted(timings)[len(timings) // 2], count, allocated
+
+
+def main(iterations: int = 50):
+    with tempfile.TemporaryDirectory() as directory:
+        for cache in [False, directory]:
+            for entities in SLICES:
+                elapsed, count, allocated = measure(iterations, cache=cache, entities=entities)
+
+                print(
+                    "factory(cache: %s, entities: %s): %.2f ms, %d classes, %d KiB"
+                    % (bool(cache), entities, elapsed * 1e3, count, allocated // 1024)
+                )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
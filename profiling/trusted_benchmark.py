@@ -0,0 +1,53 @@
+"""
+Benchmark loading the linked-art example record from tests/data, both with each of the
+record's assignments validated, which is the default, and in trusted mode, which stores
+the record's values without validating each assignment, along with the cost of
+validating a record loaded in trusted mode afterwards via validate().
+
+Usage: python profiling/trusted_benchmark.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import Model
+
+
+def main(iterations: int = 200):
+    Model.factory(profile="linked-art", globals={})
+
+    filepath = os.path.join(
+        os.path.dirname(__file__), "..", "tests", "data", "examples", "object.json"
+    )
+
+    with open(filepath, "r") as handle:
+        document = handle.read()
+
+    record = Model.open(filepath)
+
+    data = record.properties()
+
+    loads = {
+        "open()": lambda: Model.open(filepath),
+        "open(trusted=True)": lambda: Model.open(filepath, trusted=True),
+        "create(data)": lambda: Model.create(data),
+        "create(data, trusted=True)": lambda: Model.create(data, trusted=True),
+        "Model(json=...)": lambda: Model(data=Model._json().loads(document)),
+        "Model(json=..., trusted=True)": lambda: Model(
+            data=Model._json().loads(document), trusted=True
+        ),
+        "validate()": lambda: record.validate(),
+    }
+
+    for label, load in loads.items():
+        # Report the fastest of several runs, as the least affected by other activity
+        elapsed = min(timeit.repeat(load, number=iterations, repeat=5))
+
+        print("%s: %.3f ms per record" % (label, elapsed / iterations * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
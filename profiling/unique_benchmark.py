@@ -0,0 +1,59 @@
+"""
+Benchmark appending distinct Type nodes to a multiple-value property in the "Unique"
+appending mode, where each appended node is checked against those already held by the
+property, for an increasing number of nodes, along with re-appending a duplicate node.
+
+Usage: python profiling/unique_benchmark.py [nodes]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import ModelRegistry, AppendingMode
+
+
+def main(nodes: int = 800):
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.configure(appending=AppendingMode.Unique)
+
+    types = [
+        registry.Type(ident="http://vocab.getty.edu/aat/%d" % (300000000 + index))
+        for index in range(nodes)
+    ]
+
+    count: int = 100
+
+    while count <= nodes:
+        artefact = registry.HumanMadeObject()
+
+        started = time.perf_counter()
+
+        for index in range(count):
+            artefact.classified_as = types[index]
+
+        elapsed = time.perf_counter() - started
+
+        assert len(artefact.classified_as) == count
+
+        started = time.perf_counter()
+
+        artefact.classified_as = registry.Type(ident=types[0].id)
+
+        duplicate = time.perf_counter() - started
+
+        assert len(artefact.classified_as) == count
+
+        print(
+            "%d unique appends: %.2f ms (%.1f µs per append); duplicate check: %.1f µs"
+            % (count, elapsed * 1e3, elapsed / count * 1e6, duplicate * 1e6)
+        )
+
+        count *= 2
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,65 @@
+"""
+Benchmark assembling a large record, holding many Name and Type nodes, with each of its
+assignments validated as it is made, which is the default, and in the deferred
+validation mode, where the whole record is validated once afterwards via validate().
+
+Usage: python profiling/validation_benchmark.py [nodes] [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from semanticpy import ModelRegistry, ValidationMode
+
+
+def main(nodes: int = 500, iterations: int = 20):
+    registry = ModelRegistry(profile="linked-art")
+
+    def build():
+        artefact = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+        artefact._label = "Example Object"
+
+        for index in range(nodes):
+            name = registry.Name(content="Name %d" % (index))
+            name.classified_as = registry.Type(
+                ident="http://vocab.getty.edu/aat/300404670", label="Title"
+            )
+            name.referred_to_by = registry.LinguisticObject(content="Note %d" % (index))
+
+            artefact.identified_by = name
+
+        return artefact
+
+    def deferred():
+        registry.configure(validation=ValidationMode.Deferred)
+
+        try:
+            artefact = build()
+        finally:
+            registry.configure(validation=ValidationMode.Immediate)
+
+        assert artefact.validate() == []
+
+    record = build()
+
+    modes = {
+        "immediate validation": build,
+        "deferred validation, validated once": deferred,
+        "validate() alone": lambda: record.validate(),
+    }
+
+    for label, mode in modes.items():
+        # Report the fastest of several runs, as the least affected by other activity
+        elapsed = min(timeit.repeat(mode, number=iterations, repeat=5))
+
+        print(
+            "%s: %.3f ms per record of %d names"
+            % (label, elapsed / iterations * 1e3, nodes)
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
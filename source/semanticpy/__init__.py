@@ -1,20 +1,34 @@
 from __future__ import annotations
 
-import json
 import os
 import copy
+import contextlib
 import datetime
+import functools
+import hashlib
+import pickle
+import tempfile
 import requests
 
 from semanticpy.logging import logger
 from semanticpy.errors import SemanticPyError
+from semanticpy.instrumentation import instrumentation, instrument, stats
 from semanticpy.types import (
     Node,
     Nodes,
     Namespace,
+    Placeholder,
+    PropertySpec,
+    Violation,
     readonlydict,
 )
-from semanticpy.enumerations import OverwriteMode, AppendingMode
+from semanticpy.enumerations import (
+    OverwriteMode,
+    AppendingMode,
+    UnknownMode,
+    ValidationMode,
+    ViolationType,
+)
 
 with open(os.path.join(os.path.dirname(__file__), "version.txt")) as file:
     __version__ = file.read().strip()
@@ -27,15 +41,52 @@ class Model(Node):
     _context: str = None
     _entities: Namespace[str, Model] = Namespace()
     _property: list[str] = []
-    _properties: dict[str, dict] = {}
+    _properties: dict[str, PropertySpec] = {}
     _hidden: list[str] = []
+    _special: list[str] = Node._special + [
+        "_hidden",
+        "_reference",
+        "_referenced",
+        "_cloned",
+        "_loading",
+    ]
     _globals: dict[str, object] = None
     _prefixes: dict[str, str] = {}
+    _expansions: dict[str, str] = {}
+    _namespaces: dict[str, str] = {}
+    _compactions: dict[str, str] = {}
+    _iri_ranges: tuple[str] = ("xsd:anyURI", "rdfs:Class")
+    _primitives: dict[str, type | tuple[type]] = {
+        "rdfs:Literal": (str, int, float),
+        "rdfs:Class": str,
+        "xsd:anyURI": str,
+        "xsd:string": str,
+        "xsd:dateTime": (str, datetime.datetime),
+    }
+    _extensions: dict[str, PropertySpec] = {}
+    _assignments: dict[type, dict[str, tuple[str, tuple[type], bool]]] = {}
+    _ranges: dict[str | type, Model | Placeholder] = {}
+    _range_memo: dict[str | tuple[str] | type, tuple[type]] = {}
+    _constructions: dict[type, tuple[dict, dict]] = {}
+    _storages: dict[type, dict[str, tuple[str, bool] | None]] = {}
+    _plans: dict[type | tuple, tuple] = {}
+    _sliced: dict[str, Placeholder] = {}
+    _detached: dict[str, type] = {}
+    _batched: dict[str, PropertySpec] = {}
+    _batching: int = 0
+    _unknown_mode: UnknownMode = None
     _loading: bool = False
 
     @classmethod
     def factory(
-        cls, profile: str, context: str = None, globals: dict = None
+        cls,
+        profile: str,
+        context: str = None,
+        globals: dict = None,
+        cache: bool | str = False,
+        lazy: bool = False,
+        entities: list[str] = None,
+        unknown: UnknownMode | str = None,
     ) -> Namespace:
         if not isinstance(cls._entities, Namespace):
             raise TypeError(
@@ -64,8 +115,254 @@ class Model(Node):
                 "The 'globals' argument must be None or reference a dictionary!"
             )
 
+        if cache is False:
+            pass
+        elif cache is True:
+            cache = os.path.join(
+                os.environ.get("XDG_CACHE_HOME")
+                or os.path.join(os.path.expanduser("~"), ".cache"),
+                "semanticpy",
+            )
+        elif not (isinstance(cache, str) and len(cache := cache.strip()) > 0):
+            raise TypeError(
+                "The 'cache' argument must be a boolean or a string containing the path of a cache directory!"
+            )
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        if entities is None:
+            pass
+        elif not (
+            isinstance(entities, list)
+            and len(entities) > 0
+            and all(isinstance(name, str) for name in entities)
+        ):
+            raise TypeError(
+                "The 'entities' argument must be None or a non-empty list of entity name strings!"
+            )
+
+        if unknown is None:
+            pass
+        else:
+            if isinstance(unknown, str):
+                unknown = UnknownMode.reconcile(name=unknown, caselessly=True)
+
+            if isinstance(unknown, UnknownMode):
+                cls._unknown_mode = unknown
+            else:
+                raise TypeError(
+                    "The 'unknown' argument, if specified, must reference an UnknownMode enumeration option or the string name of the desired option!"
+                )
+
         glo = globals if isinstance(globals, dict) else cls._globals
 
+        profile = cls._locate(profile)
+
+        logger.debug("%s.factory() Loading profile => %s", cls.__name__, profile)
+
+        with open(profile, "rb") as handle:
+            contents: bytes = handle.read()
+
+        compiled: dict[str, object] = None
+        cachepath: str = None
+        selected: set[str] = None
+
+        # If caching has been enabled, attempt to load the compiled profile from the
+        # cache, where the cache entry is keyed on the profile contents and the library
+        # version, so that any changes to either will result in the profile recompiling
+        if isinstance(cache, str):
+            cachepath = cls._cache_path(profile, contents, cache)
+
+            compiled = cls._cache_load(cachepath)
+
+        if compiled is None:
+            cls._profile = cls._parse(profile, contents, context)
+
+            # If a slice of the profile's entities was specified, and the compiled profile
+            # is not being cached, only the entities needed for the slice are compiled
+            if entities is not None and cachepath is None:
+                selected = cls._slice(
+                    cls._profile["entities"],
+                    entities,
+                    cls._profile.get("properties"),
+                )
+
+            compiled = cls._compile(
+                profile=cls._profile, source=profile, entities=selected
+            )
+
+            if isinstance(cachepath, str):
+                cls._cache_save(cachepath, compiled)
+        else:
+            logger.debug(
+                "%s.factory() Loaded compiled profile => %s", cls.__name__, cachepath
+            )
+
+            cls._profile = compiled["profile"]
+
+        if entities is not None and selected is None:
+            selected = cls._slice(compiled["entities"], entities)
+
+        context = cls._resolve_context(compiled["profile"], context, profile)
+
+        # The entity definitions and their linearized inheritance order, which are taken
+        # from the profile if only a slice of the profile's entities has been compiled
+        if selected is not None and cachepath is None:
+            definitions: dict[str, dict] = cls._profile["entities"]
+            order: list[str] = cls._linearize(definitions)
+        else:
+            definitions: dict[str, dict] = compiled["entities"]
+            order: list[str] = list(definitions)
+
+        resolver = functools.partial(
+            cls._resolve,
+            compiled=compiled,
+            context=context,
+            glo=glo,
+            profile=cls._profile,
+            source=profile,
+        )
+
+        if selected is not None:
+            logger.debug(
+                "%s.factory() Slicing profile => %d of %d entities",
+                cls.__name__,
+                len(selected),
+                len(definitions),
+            )
+
+        for name in order:
+            entity: dict[str, object] = definitions[name]
+
+            # If the entity was excluded from the specified slice of the profile, note a
+            # placeholder for it, through which it is built on demand if it is needed to
+            # check a property's range, or, if the unknown mode allows, when it is met
+            # while loading data; the placeholder is not added to the namespace or to the
+            # globals scope, so the excluded entities otherwise remain unknown
+            if not (selected is None or name in selected):
+                if name in cls._entities:
+                    continue
+
+                placeholder = Placeholder(
+                    key=name,
+                    resolver=resolver,
+                    name=entity["id"],
+                    typed=entity["type"],
+                )
+
+                for key in [name] + cls._synonyms(entity):
+                    cls._sliced[key] = placeholder
+
+                cls._index(placeholder, [name] + cls._synonyms(entity))
+
+            # In lazy mode, add placeholders to the namespace for each entity, which will
+            # only be materialized into their entity classes when they are first accessed
+            elif lazy is True:
+                if name in cls._entities:
+                    continue
+
+                placeholder = Placeholder(
+                    key=name,
+                    resolver=resolver,
+                    name=entity["id"],
+                    typed=entity["type"],
+                )
+
+                for key in [name] + cls._synonyms(entity):
+                    cls._entities[key] = placeholder
+
+                    if isinstance(glo, dict):
+                        glo[key] = placeholder
+
+                cls._index(placeholder, [name] + cls._synonyms(entity))
+
+            elif class_type := cls._materialize(name, compiled, context, glo):
+                cls._entities[name] = class_type
+
+                # setattr(cls, name, class_type)
+
+                if isinstance(glo, dict):
+                    glo[name] = class_type
+            else:
+                raise SemanticPyError("Failed to create entity type '%s'!" % (name))
+
+        return cls._entities
+
+    @classmethod
+    def install(
+        cls,
+        profile: dict[str, object],
+        entities: dict[str, tuple[type, list[str]]],
+        ranges: dict[str | tuple[str], tuple[type]] = None,
+        version: str = None,
+        globals: dict = None,
+    ) -> Namespace:
+        """Register the entity classes of a model module generated from a profile by the
+        `semanticpy compile-profile` command, in place of building the classes through
+        the factory() method; the generated module's factory() function calls this."""
+
+        if not isinstance(profile, dict):
+            raise TypeError("The 'profile' argument must reference a dictionary!")
+
+        if not isinstance(entities, dict):
+            raise TypeError("The 'entities' argument must reference a dictionary!")
+
+        if ranges is None:
+            ranges = {}
+        elif not isinstance(ranges, dict):
+            raise TypeError(
+                "The 'ranges' argument must be None or reference a dictionary!"
+            )
+
+        if not (globals is None or isinstance(globals, dict)):
+            raise TypeError(
+                "The 'globals' argument must be None or reference a dictionary!"
+            )
+
+        if not version == __version__:
+            logger.warning(
+                "%s.install() The model module was compiled by version %s of the library, rather than the current version, %s; please compile the profile again!",
+                cls.__name__,
+                version,
+                __version__,
+            )
+
+        glo = globals if isinstance(globals, dict) else cls._globals
+
+        cls._profile = profile
+
+        for name, (class_type, synonyms) in entities.items():
+            if not (isinstance(class_type, type) and issubclass(class_type, cls)):
+                raise TypeError(
+                    "The '%s' entity must reference a subclass of %s!"
+                    % (name, cls.__name__)
+                )
+
+            # As with factory(), entities which have already been registered are reused
+            if isinstance(existing := cls._entities.get(name, resolve=False), type):
+                if isinstance(glo, dict):
+                    glo[name] = existing
+            else:
+                cls._register(class_type, name, synonyms, glo)
+
+        # Seed the memoized range types, where each of the range's model types are those
+        # registered with the model, which may not be so if some were registered earlier
+        for range, types in ranges.items():
+            if all(
+                cls._entities.get(typed.__name__, resolve=False) is typed
+                for typed in types
+                if issubclass(typed, Model)
+            ):
+                cls._range_memo.setdefault(range, types)
+
+        return cls._entities
+
+    @classmethod
+    def _locate(cls, profile: str) -> str:
+        """Determine the path of the named profile, which may either be the path of a
+        profile file, or the name of one of the profiles provided with the library."""
+
         if not os.path.exists(profile):
             if not profile.endswith(".json"):
                 profile += ".json"
@@ -82,31 +379,54 @@ class Model(Node):
                 "The specified profile (%s) is not a file!" % (profile)
             )
 
-        logger.debug("%s.factory() Loading profile => %s", cls.__name__, profile)
+        return profile
 
-        with open(profile, "r") as handle:
-            if contents := handle.read():
-                try:
-                    cls._profile = json.loads(contents)
-                except json.decoder.JSONDecodeError as e:
-                    raise SemanticPyError(
-                        "The specified profile (%s) is invalid or incomplete (%s)!"
-                        % (
-                            profile,
-                            str(e),
-                        ),
-                    )
+    @classmethod
+    def _parse(cls, profile: str, contents: bytes, context: str = None) -> dict:
+        """Parse and validate the contents of the profile loaded from the noted path."""
 
-        if not isinstance(cls._profile, dict):
+        try:
+            parsed: dict[str, object] = (
+                cls._json().loads(contents) if contents else None
+            )
+        except ValueError as e:
+            raise SemanticPyError(
+                "The specified profile (%s) is invalid or incomplete (%s)!"
+                % (
+                    profile,
+                    str(e),
+                ),
+            )
+
+        if not isinstance(parsed, dict):
             raise SemanticPyError(
                 "The specified profile (%s) is invalid or incomplete!" % (profile)
             )
 
+        if context is None and not isinstance(parsed.get("context"), str):
+            raise SemanticPyError(
+                "The specified profile (%s) does not contain a valid 'context' property!"
+                % (profile),
+            )
+
+        if not isinstance(parsed.get("entities"), dict):
+            raise SemanticPyError(
+                "The specified profile (%s) does not contain a valid 'entities' property!"
+                % (profile),
+            )
+
+        return parsed
+
+    @classmethod
+    def _resolve_context(cls, profile: dict, context: str, source: str) -> str:
+        """Determine the context URL for the model, which is the specified context, if
+        any, or otherwise the context URL defined by the profile."""
+
         if context is None:
-            if not isinstance(context := cls._profile.get("context"), str):
+            if not isinstance(context := profile.get("context"), str):
                 raise SemanticPyError(
                     "The specified profile (%s) does not contain a valid 'context' property!"
-                    % (profile),
+                    % (source),
                 )
         elif not (isinstance(context, str) and len(context := context.strip()) > 0):
             raise SemanticPyError(
@@ -117,101 +437,57 @@ class Model(Node):
                 "The 'context' argument must contain a URL for a valid JSON-LD context document!"
             )
 
-        if not isinstance(entities := cls._profile.get("entities"), dict):
-            raise SemanticPyError(
-                "The specified profile (%s) does not contain a valid 'entities' property!"
-                % (profile),
-            )
+        return context
 
-        def _class_factory(name: str) -> type:
-            # If the named class already exists, return immediately
-            if isinstance(class_type := cls._entities.get(name, default=None), type):
-                if issubclass(class_type, Model):
-                    return class_type
-                else:
-                    raise TypeError(
-                        "The %s.%s attribute is not a subclass of %s as expected! Ensure this attribute has not been set on the class accidentally!"
-                        % (
-                            cls.__name__,
-                            name,
-                            cls.__name__,
-                        )
-                    )
+    @classmethod
+    def _compile(
+        cls, profile: dict, source: str, entities: set[str] = None
+    ) -> dict[str, object]:
+        """Compile the profile's entities, or the specified subset of its entities, into
+        their resolved per-entity metadata, from which the entity classes can be built
+        without reference to the profile; any subset must include its superclasses."""
 
-            if not (entity := entities.get(name)):
-                raise SemanticPyError(
-                    "The specified entity type (%s) has not been defined in the profile!"
-                    % (name)
-                )
+        # Validate the top-level properties, which are available on every entity, once
+        properties: dict[str, dict] = cls._validate_specifications(
+            profile.get("properties") or {}
+        )
 
-            bases: tuple = ()
-            properties: dict[str, object] = {}
+        compiled: dict[str, dict] = {}
 
-            for prop, props in (cls._profile.get("properties") or {}).items():
-                properties[prop] = cls._validate_properties(props, prop)
+        # Compile each entity in linearized inheritance order, so that the properties of
+        # each entity's superclasses have been merged before the entity itself is merged
+        for name in cls._linearize(profile["entities"]):
+            if not (entities is None or name in entities):
+                continue
 
-            if superclasses := entity.get("superclasses"):
-                if isinstance(superclasses, str):
-                    superclasses = [superclasses]
+            entity: dict[str, object] = profile["entities"][name]
 
-                for superclass_name in superclasses:
-                    if superclass := _class_factory(superclass_name):
-                        bases += (superclass,)
+            bases: list[str] = cls._superclasses(entity)
 
-                        for prop, props in (superclass._properties or {}).items():
-                            properties[prop] = cls._validate_properties(props, prop)
-                    else:
-                        raise SemanticPyError(
-                            "Failed to find or create (base) superclass: %s!"
-                            % (superclass_name),
-                        )
+            merged: dict[str, dict] = dict(properties)
 
-            if self_properties := entity.get("properties"):
-                for prop, props in self_properties.items():
-                    properties[prop] = cls._validate_properties(props, prop)
+            for superclass_name in bases:
+                merged.update(compiled[superclass_name]["properties"])
 
-            if len(bases) == 0:
-                bases += (cls,)
+            merged.update(cls._validate_specifications(entity.get("properties") or {}))
 
             accepted: bool = False
             multiple: list[str] = []
             hidden: list[str] = []
             sorting: dict[str, int] = {}
 
-            # properties_sorted = {}
-            # for key in sorted(properties.keys()):
-            #     properties_sorted[key] = properties[key]
-            # properties = properties_sorted
-
-            aliases: dict[str, dict[str, object]] = {}
-
-            for prop, props in properties.items():
-                # Copy the props dictionary so that it can be modified in isolation
-                properties[prop] = dict(props)
-
+            for prop, props in merged.items():
                 # Determine if at least one property on the model is marked as accepted
                 if props.get("accepted", True) is True:
                     accepted = True
 
                 # Assemble the list of properties on the model that accept multiple values
                 if props.get("individual", False) is False:
-                    if not prop in multiple:
-                        multiple.append(prop)
+                    multiple.append(prop)
 
                 # Assemble the list of properties on the model that are hidden
                 if props.get("hidden", False) is True:
-                    if not prop in hidden:
-                        hidden.append(prop)
-
-                # If the property has an alias, map the alias name to the property data
-                if isinstance(alias := props.pop("alias", None), str):
-                    if alias in aliases:
-                        if not aliases[alias] is props:
-                            raise SemanticPyError(
-                                f"An alias for '{alias}' already exists for the '{name}' entity!"
-                            )
-                    else:
-                        aliases[alias] = props
+                    hidden.append(prop)
 
                 sorting[prop] = props.get("sorting") or 10000
 
@@ -219,76 +495,445 @@ class Model(Node):
                 raise SemanticPyError(
                     "No accepted properties have been defined in the %s profile for %s!"
                     % (
-                        profile,
+                        source,
                         name,
                     ),
                 )
 
-            if len(aliases) > 0:
-                properties.update(aliases)
-
-            attributes = {
-                "_context": context,
-                "_type": entity.get("type"),
-                "_name": entity.get("id"),
-                "_multiple": multiple,
-                "_sorting": sorting,
-                "_hidden": hidden,
-                "_property": None,
-                "_properties": properties,
+            # If the class has a synonym, note it so that it can be mapped into the
+            # namespace too; this is useful for supporting backwards compatibility if
+            # classes are renamed allowing existing code to produce compliant output
+            if synonym := entity.get("synonym"):
+                if isinstance(synonym, list):
+                    synonyms = synonym
+                elif isinstance(synonym, str):
+                    synonyms = [synonym]
+                else:
+                    raise TypeError(
+                        "The `synonym` must be provided as a list of strings or a string!"
+                    )
+
+                for _synonym in synonyms:
+                    if not isinstance(_synonym, str):
+                        raise TypeError(
+                            "Entity class synonyms must be defined as strings!"
+                        )
+
+            compiled[name] = {
+                "type": entity.get("type"),
+                "id": entity.get("id"),
+                "superclasses": bases,
+                "synonym": synonym or None,
+                "multiple": multiple,
+                "sorting": sorting,
+                "hidden": hidden,
+                "properties": merged,
             }
 
-            if class_type := type(name, bases, attributes):
-                # Add the class to the Model's namespace so that it can be accessed elsewhere
+        return {
+            "profile": {
+                key: value for key, value in profile.items() if key != "entities"
+            },
+            "entities": compiled,
+        }
 
-                # setattr(cls, name, class_type)
-                cls._entities[name] = class_type
+    @classmethod
+    def _linearize(cls, entities: dict[str, dict]) -> list[str]:
+        """Determine the linearized inheritance order of the profile's entities, where
+        each entity is preceded by all of its superclasses, in the order defined."""
 
-                if isinstance(glo, dict):
-                    # Add the class to global namespace so that it can be accessed elsewhere
-                    glo[name] = class_type
+        order: list[str] = []
+        visiting: list[str] = []
+        seen: set[str] = set()
 
-                # If the class has a synonym, map it into the global namespace too; this
-                # is useful for supporting backwards compatibility if classes are renamed
-                # allowing existing code to produce output compliant with the latest model
-                if synonym := entities.get(name).get("synonym"):
-                    if isinstance(synonym, list):
-                        _synonyms = synonym
-                    elif isinstance(synonym, str):
-                        _synonyms = [synonym]
-                    else:
-                        raise TypeError(
-                            "The `synonym` must be provided as a list of strings or a string!"
-                        )
+        def _visit(name: str):
+            if name in visiting:
+                raise SemanticPyError(
+                    "The specified entity type (%s) inherits from itself via: %s!"
+                    % (name, " > ".join(visiting[visiting.index(name) :] + [name]))
+                )
 
-                    for _synonym in _synonyms:
-                        if not isinstance(_synonym, str):
-                            raise TypeError(
-                                "Entity class synonyms must be defined as strings!"
-                            )
+            if not isinstance(entity := entities.get(name), dict):
+                raise SemanticPyError(
+                    "The specified entity type (%s) has not been defined in the profile!"
+                    % (name)
+                )
 
-                        class_type._synonym = synonym
+            visiting.append(name)
 
-                        # setattr(cls, synonym, class_type)
-                        cls._entities[synonym] = class_type
+            for superclass_name in cls._superclasses(entity):
+                if not superclass_name in seen:
+                    _visit(superclass_name)
 
-                        if isinstance(glo, dict):
-                            glo[synonym] = class_type
+            visiting.pop()
 
-                return class_type
+            seen.add(name)
+            order.append(name)
 
         for name in entities:
-            if class_type := _class_factory(name):
-                cls._entities[name] = class_type
+            if not name in seen:
+                _visit(name)
 
-                # setattr(cls, name, class_type)
+        return order
 
-                if isinstance(glo, dict):
-                    glo[name] = class_type
+    @classmethod
+    def _superclasses(cls, entity: dict[str, object]) -> list[str]:
+        """Return the list of superclass names defined for the profile entity, if any."""
+
+        if not (superclasses := entity.get("superclasses")):
+            return []
+        elif isinstance(superclasses, str):
+            return [superclasses]
+        elif isinstance(superclasses, list):
+            return superclasses
+        else:
+            raise TypeError(
+                "The `superclasses` must be provided as a list of strings or a string!"
+            )
+
+    @classmethod
+    def _validate_specifications(
+        cls, properties: dict[str, dict]
+    ) -> dict[str, dict[str, object]]:
+        """Validate a profile's property specifications, mapping any aliases so that the
+        property can be referenced via its name or its alias, returning the specifications
+        keyed by property name followed by any aliases."""
+
+        if not isinstance(properties, dict):
+            raise TypeError("The profile 'properties' must be defined as a dictionary!")
+
+        specifications: dict[str, dict] = {}
+        aliases: dict[str, dict] = {}
+
+        for prop, props in properties.items():
+            props = cls._validate_properties(props, prop)
+
+            # If the property has an alias, map the alias name to the property data
+            if isinstance(alias := props.get("alias"), str):
+                props = props.replace(alias=None)
+
+                if alias in aliases or alias in properties:
+                    raise SemanticPyError(
+                        f"An alias for '{alias}' already exists for the '{prop}' property!"
+                    )
+
+                aliases[alias] = props
+
+            specifications[prop] = props
+
+        return {**specifications, **aliases}
+
+    @classmethod
+    def _materialize(
+        cls,
+        name: str,
+        compiled: dict[str, object],
+        context: str,
+        glo: dict[str, object] = None,
+        register: bool = True,
+    ) -> type:
+        """Build the named entity class, and any of its superclasses, from the compiled
+        profile, or return the existing entity class if it has already been built; if
+        'register' is False, the class is built without being registered with the model,
+        so that it is not added to the namespace or to the globals scope."""
+
+        # If the named class already exists, return immediately
+        if isinstance(
+            class_type := cls._entities.get(name, default=None, resolve=False), type
+        ):
+            if issubclass(class_type, Model):
+                return class_type
             else:
-                raise SemanticPyError("Failed to create entity type '%s'!" % (name))
+                raise TypeError(
+                    "The %s.%s attribute is not a subclass of %s as expected! Ensure this attribute has not been set on the class accidentally!"
+                    % (
+                        cls.__name__,
+                        name,
+                        cls.__name__,
+                    )
+                )
 
-        return cls._entities
+        if not isinstance(entity := compiled["entities"].get(name), dict):
+            raise SemanticPyError(
+                "The specified entity type (%s) has not been defined in the profile!"
+                % (name)
+            )
+
+        # If the class was built without being registered, such as to check a property's
+        # range, register it, and any of its unregistered superclasses, only when needed
+        if isinstance(class_type := cls._detached.get(name), type):
+            if register is True:
+                for superclass_name in entity["superclasses"]:
+                    cls._materialize(superclass_name, compiled, context, glo)
+
+                del cls._detached[name]
+
+                cls._register(class_type, name, cls._synonyms(entity), glo)
+
+            return class_type
+
+        bases: tuple = ()
+
+        for superclass_name in entity["superclasses"]:
+            if superclass := cls._materialize(
+                superclass_name, compiled, context, glo, register
+            ):
+                bases += (superclass,)
+            else:
+                raise SemanticPyError(
+                    "Failed to find or create (base) superclass: %s!"
+                    % (superclass_name),
+                )
+
+        if len(bases) == 0:
+            bases += (cls,)
+
+        attributes = {
+            "_context": context,
+            "_type": entity["type"],
+            "_name": entity["id"],
+            "_multiple": entity["multiple"],
+            "_sorting": entity["sorting"],
+            "_hidden": entity["hidden"],
+            "_property": None,
+            "_properties": entity["properties"],
+        }
+
+        if synonym := entity["synonym"]:
+            attributes["_synonym"] = synonym
+
+        if class_type := type(name, bases, attributes):
+            if register is True:
+                cls._register(class_type, name, cls._synonyms(entity), glo)
+            else:
+                cls._detached[name] = class_type
+
+            return class_type
+
+    @classmethod
+    def _register(
+        cls,
+        class_type: type,
+        name: str,
+        synonyms: list[str] = None,
+        glo: dict[str, object] = None,
+    ) -> None:
+        """Register the named entity class with the model and the range index."""
+
+        # Add the class to the Model's namespace so that it can be accessed elsewhere
+
+        # setattr(cls, name, class_type)
+        cls._entities[name] = class_type
+
+        if isinstance(glo, dict):
+            # Add the class to global namespace so that it can be accessed elsewhere
+            glo[name] = class_type
+
+        # If the class has a synonym, map it into the global namespace too; this
+        # is useful for supporting backwards compatibility if classes are renamed
+        # allowing existing code to produce output compliant with the latest model
+        for synonym in synonyms or []:
+            # setattr(cls, synonym, class_type)
+            cls._entities[synonym] = class_type
+
+            if isinstance(glo, dict):
+                glo[synonym] = class_type
+
+        cls._index(class_type, [name] + (synonyms or []))
+
+        # Apply any model-wide properties registered through Model.extend() so that
+        # classes materialized after the model was extended support them as well
+        if cls._extensions:
+            cls._extend_entity(class_type, cls._extension(cls._extensions))
+
+    @classmethod
+    def _resolve(
+        cls,
+        name: str,
+        compiled: dict[str, object],
+        context: str,
+        glo: dict[str, object] = None,
+        profile: dict[str, object] = None,
+        source: str = None,
+        register: bool = True,
+    ) -> type:
+        """Materialize the named entity class on behalf of a lazy mode placeholder, or a
+        placeholder for an entity excluded from the slice of the profile that was built;
+        if 'register' is False the class is built without being registered."""
+
+        logger.debug("%s._resolve(name: %s)", cls.__name__, name)
+
+        # If only a slice of the profile's entities was compiled, compile the remainder of
+        # the profile's entities the first time that an excluded entity is needed
+        if not name in compiled["entities"] and isinstance(profile, dict):
+            for key, entity in cls._compile(profile, source)["entities"].items():
+                compiled["entities"].setdefault(key, entity)
+
+        return cls._materialize(name, compiled, context, glo, register)
+
+    @classmethod
+    def _synonyms(cls, entity: dict[str, object]) -> list[str]:
+        """Return the list of synonyms noted for the entity, if any."""
+
+        if isinstance(synonym := entity.get("synonym"), list):
+            return synonym
+        elif isinstance(synonym, str):
+            return [synonym]
+        else:
+            return []
+
+    @classmethod
+    def _slice(
+        cls,
+        entities: dict[str, dict],
+        selection: list[str],
+        properties: dict[str, dict] = None,
+    ) -> set[str]:
+        """Determine the names of the entities needed for the specified selection of the
+        profile's entities, comprising the selected entities, the entities referenced by
+        the ranges of their properties, and all of their superclasses; the entities may
+        either be those defined in the profile, or those compiled from the profile."""
+
+        # Note the entity that each reference resolves to, as per the range index
+        references: dict[str, str] = {}
+
+        for name, entity in entities.items():
+            for reference in [entity.get("id"), entity.get("type"), name]:
+                if isinstance(reference, str):
+                    references.setdefault(reference, name)
+
+            for synonym in cls._synonyms(entity):
+                references.setdefault(synonym, name)
+
+        ranges: dict[str, dict[str, object]] = {}
+
+        def _ranges(name: str) -> dict[str, object]:
+            """Determine the ranges of the entity's properties, including those that it
+            inherits, as they are merged when the profile is compiled."""
+
+            if not name in ranges:
+                merged: dict[str, object] = {
+                    prop: props.get("range")
+                    for prop, props in (properties or {}).items()
+                    if isinstance(props, dict)
+                }
+
+                for superclass_name in cls._superclasses(entities[name]):
+                    merged.update(_ranges(superclass_name))
+
+                for prop, props in (entities[name].get("properties") or {}).items():
+                    if isinstance(props, (dict, PropertySpec)):
+                        merged[prop] = props.get("range")
+
+                ranges[name] = merged
+
+            return ranges[name]
+
+        selected: set[str] = set()
+
+        def _select(name: str):
+            if not name in entities:
+                raise SemanticPyError(
+                    "The specified entity type (%s) has not been defined in the profile!"
+                    % (name)
+                )
+
+            if not name in selected:
+                selected.add(name)
+
+                for superclass_name in cls._superclasses(entities[name]):
+                    _select(superclass_name)
+
+        for reference in selection:
+            if not (name := references.get(reference)):
+                raise SemanticPyError(
+                    "The specified entity type (%s) has not been defined in the profile!"
+                    % (reference)
+                )
+
+            _select(name)
+
+            for range in _ranges(name).values():
+                if isinstance(range, str):
+                    range = [range]
+                elif not isinstance(range, (list, tuple)):
+                    continue
+
+                for _range in range:
+                    if isinstance(_range, str) and _range in references:
+                        _select(references[_range])
+
+        return selected
+
+    @classmethod
+    def _cache_path(cls, profile: str, contents: bytes, directory: str) -> str:
+        """Determine the path of the compiled profile cache file for the given profile,
+        keyed on a content hash of the profile and the current library version."""
+
+        digest = hashlib.sha256(__version__.encode() + b"\0" + contents).hexdigest()
+
+        name = os.path.splitext(os.path.basename(profile))[0]
+
+        return os.path.join(
+            os.path.abspath(os.path.expanduser(directory)),
+            "%s-%s-%s.pickle" % (name, __version__, digest[0:32]),
+        )
+
+    @classmethod
+    def _cache_load(cls, filepath: str) -> dict[str, object] | None:
+        """Load a compiled profile from the cache, if available, or return None."""
+
+        if not os.path.isfile(filepath):
+            return None
+
+        try:
+            with open(filepath, "rb") as handle:
+                compiled = pickle.load(handle)
+        except Exception as exception:
+            logger.warning(
+                "%s.factory() Unable to load the compiled profile cache (%s): %s",
+                cls.__name__,
+                filepath,
+                exception,
+            )
+
+            return None
+
+        if not (
+            isinstance(compiled, dict)
+            and compiled.get("version") == __version__
+            and isinstance(compiled.get("profile"), dict)
+            and isinstance(compiled.get("entities"), dict)
+        ):
+            return None
+
+        return compiled
+
+    @classmethod
+    def _cache_save(cls, filepath: str, compiled: dict[str, object]) -> None:
+        """Save a compiled profile to the cache, replacing any existing cache file
+        atomically; failure to save the cache is logged but is otherwise non-fatal."""
+
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(filepath), suffix=".tmp", delete=False
+            ) as handle:
+                pickle.dump(
+                    {**compiled, "version": __version__},
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            os.replace(handle.name, filepath)
+        except Exception as exception:
+            logger.warning(
+                "%s.factory() Unable to save the compiled profile cache (%s): %s",
+                cls.__name__,
+                filepath,
+                exception,
+            )
 
     @classmethod
     def teardown(cls, globals: dict = None):
@@ -314,13 +959,46 @@ class Model(Node):
             if isinstance(glo, dict) and key in glo:
                 del glo[key]
 
+        # Clear any model-wide properties registered through Model.extend()
+        cls._extensions.clear()
+        cls._batched.clear()
+
+        # Clear the assignment and construction plans for the model's entity classes
+        cls._assignments.clear()
+        cls._constructions.clear()
+        cls._storages.clear()
+        cls._plans.clear()
+
+        # Discard the cached fingerprints and serializations of the model's nodes
+        cls._generation[0] += 1
+
+        # Clear the range index and the memoized range types for the entity classes
+        cls._ranges.clear()
+        cls._range_memo.clear()
+
+        # Clear the placeholders noted for entities excluded from a slice of the profile
+        cls._sliced.clear()
+        cls._detached.clear()
+
         # Reset the configuration to the defaults
         cls._overwrite_mode = None
         cls._appending_mode = None
+        cls._validation_mode = None
+        cls._deferred = False
+        cls._unknown_mode = None
+        cls._codec = None
 
     @classmethod
-    def open(cls, filepath: str, extensions: bool = False) -> Model:
-        """Support opening and loading model instances from stored JSON-LD files"""
+    def open(
+        cls,
+        filepath: str,
+        extensions: bool = False,
+        trusted: bool = False,
+        compact_iris: bool = False,
+    ) -> Model:
+        """Support opening and loading model instances from stored JSON-LD files; if the
+        'compact_iris' argument is set to True, IRIs starting with the URI of a registered
+        prefix are held as prefixed IRIs in the loaded entities."""
 
         # cls.factory(profile=profile, context=context, globals=globals)
 
@@ -331,6 +1009,12 @@ class Model(Node):
                 "The 'filepath' argument must be a valid non-empty string!"
             )
 
+        if not isinstance(trusted, bool):
+            raise TypeError("The 'trusted' argument must have a boolean value!")
+
+        if not isinstance(compact_iris, bool):
+            raise TypeError("The 'compact_iris' argument must have a boolean value!")
+
         if not cls._entities:
             raise RuntimeError(
                 "Please ensure that the Model.factory() method has been called to initialize the models!"
@@ -342,7 +1026,9 @@ class Model(Node):
             try:
                 if isinstance(response := requests.get(filepath), object):
                     if response.status_code == 200:
-                        if not isinstance(data := response.json(), dict):
+                        if not isinstance(
+                            data := cls._json().loads(response.content), dict
+                        ):
                             raise ValueError(
                                 "The specified file does not contain valid JSON data!"
                             )
@@ -370,8 +1056,8 @@ class Model(Node):
                     "The specified filepath (%s) does not exist!" % (filepath)
                 )
 
-            with open(filepath, "r") as handle:
-                if not isinstance(data := json.load(handle), dict):
+            with open(filepath, "rb") as handle:
+                if not isinstance(data := cls._json().loads(handle.read()), dict):
                     raise ValueError(
                         "The specified file does not contain valid JSON data!"
                     )
@@ -387,10 +1073,15 @@ class Model(Node):
 
                 if typed := data.get("type"):
                     if entity := cls.entity(typed):
-                        if instance := entity(
-                            data=readonlydict(data),
-                            extensions=extensions,
-                        ):
+                        with instrumentation.span("load", type=entity.__name__):
+                            instance = entity(
+                                data=readonlydict(data),
+                                extensions=extensions,
+                                trusted=trusted,
+                                compact_iris=compact_iris,
+                            )
+
+                        if instance:
                             return instance
                         else:
                             raise ValueError(
@@ -412,8 +1103,15 @@ class Model(Node):
             raise ValueError("No data could be loaded from the specified file!")
 
     @classmethod
-    def _validate_properties(cls, properties: dict, property: str) -> dict:
-        """Helper method to validate property specification dictionaries"""
+    def _validate_properties(
+        cls, properties: dict | PropertySpec, property: str
+    ) -> PropertySpec:
+        """Helper method to validate property specification dictionaries, returning the
+        interned immutable specification for the property"""
+
+        # Specifications are validated on creation, so may be used as they are
+        if isinstance(properties, PropertySpec):
+            return properties
 
         if not isinstance(properties, dict):
             raise TypeError(
@@ -421,6 +1119,9 @@ class Model(Node):
                 % (property)
             )
 
+        # Validate a copy so that the provided dictionary is not modified by defaulting
+        properties = dict(properties)
+
         if "accepted" in properties:
             if not isinstance(properties["accepted"], bool):
                 raise TypeError(
@@ -461,6 +1162,13 @@ class Model(Node):
         else:
             properties["sorting"] = 10000
 
+        if "hidden" in properties:
+            if not isinstance(properties["hidden"], bool):
+                raise TypeError(
+                    "The 'hidden' property for '%s' must have a boolean value!"
+                    % (property)
+                )
+
         if "alias" in properties:
             if not isinstance(properties["alias"], str):
                 raise TypeError("The 'alias' property must have a string value!")
@@ -481,7 +1189,7 @@ class Model(Node):
                     "The 'namespace' property value cannot contain the ':' character!"
                 )
 
-        return properties
+        return PropertySpec.create(properties)
 
     @classmethod
     def extend(
@@ -527,7 +1235,7 @@ class Model(Node):
                 subclass._property: list[str] = []
 
             for prop, props in properties.items():
-                props: dict[str, object] = cls._validate_properties(props, prop)
+                props: PropertySpec = cls._validate_properties(props, prop)
 
                 if isinstance(canonical := props.get("canonical"), str):
                     subclass._canonical[prop] = canonical
@@ -544,29 +1252,24 @@ class Model(Node):
                     if individual is False and not prop in subclass._multiple:
                         subclass._multiple.append(prop)
 
-                for class_name, entity in cls._entities.items():
-                    entity._properties[prop] = cls._validate_properties(props, prop)
-
-                    if isinstance(canonical := props.get("canonical"), str):
-                        entity._canonical[prop] = canonical
-
-                    if isinstance(namespace := props.get("namespace"), str):
-                        entity._namespace[prop] = namespace
+                # Note the property so that it is applied to any entity classes that
+                # are materialized later, such as those from a lazily factored model
+                cls._extensions[prop] = props
 
-                    # If a property supports being specified via an alias, map that here
-                    if isinstance(alias := props.get("alias"), str):
-                        entity._properties[alias] = {**props, **{"alias": prop}}
+                # Within an extending() block, the property is applied to the entity
+                # classes along with the block's other properties when the block exits
+                if cls._batching > 0:
+                    cls._batched[prop] = props
+                    continue
 
-                    # If the property is namespaced, add its reference here
-                    if isinstance(namespace := props.get("namespace"), str):
-                        entity._properties[namespace + ":" + prop] = {**props}
+                extension = cls._extension({prop: props})
 
-                    if isinstance(sorting := props.get("sorting"), int):
-                        entity._sorting[prop] = sorting
+                for class_name, entity in cls._entities.items():
+                    # Placeholders receive the property when they are materialized
+                    if isinstance(entity, Placeholder):
+                        continue
 
-                    if isinstance(individual := props.get("individual"), bool):
-                        if individual is False and not prop in entity._multiple:
-                            entity._multiple.append(prop)
+                    cls._extend_entity(entity, extension)
 
         # If any subclass-level properties have been defined, apply them to the subclass
         if hasattr(subclass, "_properties"):
@@ -574,7 +1277,9 @@ class Model(Node):
                 raise TypeError("The '_properties' attribute must be a dictionary!")
 
             for prop, props in subclass._properties.items():
-                props = cls._validate_properties(props, prop)
+                subclass._properties[prop] = props = cls._validate_properties(
+                    props, prop
+                )
 
                 if isinstance(canonical := props.get("canonical"), str):
                     if not canonical in subclass._canonical:
@@ -625,6 +1330,21 @@ class Model(Node):
                         if not prop in subclass._properties:
                             subclass._properties[prop] = props
 
+        # As extending the model may change the properties of its entity classes, discard
+        # any assignment plans, which will be compiled again as properties are assigned,
+        # and any memoized range types, as the extension may be referenced as a range;
+        # within an extending() block, these are discarded once when the block exits
+        if cls._batching == 0:
+            cls._assignments.clear()
+            cls._constructions.clear()
+            cls._storages.clear()
+            cls._plans.clear()
+            cls._range_memo.clear()
+
+            # As the extension may change how nodes are serialized, such as the canonical
+            # names, sort order or hidden properties, discard the nodes' caches
+            cls._generation[0] += 1
+
         if not name in cls._entities:
             # raise RuntimeError(
             #     "The extended entity '%s' has the same name as an existing entity!" % (subclass.__name__)
@@ -637,6 +1357,108 @@ class Model(Node):
                 # Add the class to global namespace so that it can be accessed elsewhere
                 glo[name] = subclass
 
+            cls._index(subclass, [name])
+
+    @classmethod
+    @contextlib.contextmanager
+    def extending(cls):
+        """Context manager to support extending the model with many model subclasses and
+        model-wide properties at once; within the block, each call to extend() validates
+        and registers its extension as usual, but the model-wide properties are applied
+        to the model's entity classes in a single pass when the block exits, and the
+        assignment plans and memoized range types are only discarded once. Blocks can
+        be nested, in which case the outermost block applies the properties."""
+
+        cls._batching += 1
+
+        try:
+            yield cls
+        finally:
+            cls._batching -= 1
+
+            if cls._batching == 0:
+                if cls._batched:
+                    extension = cls._extension(cls._batched)
+
+                    cls._batched.clear()
+
+                    # Apply the properties to each entity class, including any registered
+                    # within the block, visiting each class once, even those with synonyms
+                    extended: set[type] = set()
+
+                    for class_name, entity in cls._entities.items():
+                        # Placeholders receive the properties when they are materialized
+                        if isinstance(entity, Placeholder) or entity in extended:
+                            continue
+
+                        extended.add(entity)
+
+                        cls._extend_entity(entity, extension)
+
+                cls._assignments.clear()
+                cls._constructions.clear()
+                cls._storages.clear()
+                cls._plans.clear()
+                cls._range_memo.clear()
+
+                cls._generation[0] += 1
+
+    @classmethod
+    def _extension(
+        cls, properties: dict[str, PropertySpec]
+    ) -> tuple[dict, dict, dict, dict, list]:
+        """Helper method to resolve model-wide properties into the updates that apply them
+        to an entity class, so that each is resolved once rather than once per class."""
+
+        specifications: dict[str, PropertySpec] = {}
+        canonicals: dict[str, str] = {}
+        namespaces: dict[str, str] = {}
+        sortings: dict[str, int] = {}
+        multiple: list[str] = []
+
+        for prop, props in properties.items():
+            specifications[prop] = props = cls._validate_properties(props, prop)
+
+            if isinstance(canonical := props.get("canonical"), str):
+                canonicals[prop] = canonical
+
+            if isinstance(namespace := props.get("namespace"), str):
+                namespaces[prop] = namespace
+
+            # If a property supports being specified via an alias, map that here
+            if isinstance(alias := props.get("alias"), str):
+                specifications[alias] = props.replace(alias=prop)
+
+            # If the property is namespaced, add its reference here
+            if isinstance(namespace, str):
+                specifications[namespace + ":" + prop] = props
+
+            if isinstance(sorting := props.get("sorting"), int):
+                sortings[prop] = sorting
+
+            if props.get("individual") is False:
+                multiple.append(prop)
+
+        return (specifications, canonicals, namespaces, sortings, multiple)
+
+    @classmethod
+    def _extend_entity(
+        cls, entity: Model, extension: tuple[dict, dict, dict, dict, list]
+    ):
+        """Helper method to apply model-wide properties, as resolved by _extension(), to
+        the specified entity class"""
+
+        specifications, canonicals, namespaces, sortings, multiple = extension
+
+        entity._properties.update(specifications)
+        entity._canonical.update(canonicals)
+        entity._namespace.update(namespaces)
+        entity._sorting.update(sortings)
+
+        for prop in multiple:
+            if not prop in entity._multiple:
+                entity._multiple.append(prop)
+
     @classmethod
     def prefix(cls, prefix: str, uri: str) -> None:
         if not isinstance(prefix, str):
@@ -666,6 +1488,16 @@ class Model(Node):
 
         cls._prefixes[prefix] = uri
 
+        # Index the prefix by its URI for compacting IRIs, preferring the first prefix
+        # registered for a URI, and discard the compacted IRIs, as a longer namespace
+        # may now match some of them
+        cls._namespaces.setdefault(uri, prefix)
+        cls._compactions.clear()
+
+        # As identifiers using the prefix are now expanded when serialized, discard the
+        # cached fingerprints and serializations of the model's nodes
+        cls._generation[0] += 1
+
     @classmethod
     def entity(cls, name: str = None, property: str = None) -> Model | None:
         """Helper method to return the referenced entity type from the model."""
@@ -673,6 +1505,22 @@ class Model(Node):
         if isinstance(name, str):
             if name in cls._entities:
                 return cls._entities[name]
+            elif isinstance(placeholder := cls._sliced.get(name), Placeholder):
+                # The entity was excluded from the slice of the profile used to build the
+                # model, so build it on demand or raise an error, as per the unknown mode
+                if cls._unknown_mode is UnknownMode.Build:
+                    logger.debug(
+                        "%s.entity(name: %s) Building excluded entity on demand",
+                        cls.__name__,
+                        name,
+                    )
+
+                    return placeholder.resolve()
+                else:
+                    raise SemanticPyError(
+                        "The '%s' entity type was excluded from the model as it was not part of the profile slice specified via the factory() method's 'entities' argument; add the entity type to the slice, or set the 'unknown' argument to UnknownMode.Build to build excluded entity types on demand!"
+                        % (name)
+                    )
         elif isinstance(property, str):
             for name, entity in cls._entities.items():
                 if isinstance(entity._property, list):
@@ -690,11 +1538,16 @@ class Model(Node):
         data: dict,
         property: str = None,
         extensions: bool = False,
+        trusted: bool = False,
+        compact_iris: bool = False,
     ) -> Model:
         """Support creating a model entity from its data (dictionary) representation."""
 
         model: Model = None
 
+        if instrumentation.enabled:
+            instrumentation.count("creations")
+
         if not isinstance(data, dict):
             raise TypeError("The 'data' argument must have a dictionary value!")
 
@@ -710,6 +1563,12 @@ class Model(Node):
         if not isinstance(extensions, bool):
             raise TypeError("The 'extensions' argument must have a boolean value!")
 
+        if not isinstance(trusted, bool):
+            raise TypeError("The 'trusted' argument must have a boolean value!")
+
+        if not isinstance(compact_iris, bool):
+            raise TypeError("The 'compact_iris' argument must have a boolean value!")
+
         # Attempt to determine the entity type from the assigned 'type' string value
         if isinstance(typed := data.get("type"), str):
             if not isinstance(entity := cls.entity(name=typed), type):
@@ -717,7 +1576,15 @@ class Model(Node):
                     "The '%s' entity type cannot be mapped to a model entity!" % (typed)
                 )
 
-            if not isinstance(model := entity(data=data, extensions=extensions), Model):
+            if not isinstance(
+                model := entity(
+                    data=data,
+                    extensions=extensions,
+                    trusted=trusted,
+                    compact_iris=compact_iris,
+                ),
+                Model,
+            ):
                 raise ValueError(
                     "The '%s' entity type could not be instantiated!" % (typed)
                 )
@@ -725,7 +1592,10 @@ class Model(Node):
         # Alternatively, for untyped model extensions, attempt to determine the entity
         # type from the property name that the entity has been assigned to in data
         elif isinstance(entity := cls.entity(property=property), type):
-            if not isinstance(model := entity(data=data), Model):
+            if not isinstance(
+                model := entity(data=data, trusted=trusted, compact_iris=compact_iris),
+                Model,
+            ):
                 raise ValueError(
                     "The '%s' entity type could not be instantiated!" % (typed)
                 )
@@ -741,8 +1611,19 @@ class Model(Node):
         return model
 
     # TODO: Should 'load' be a "private" method?
-    def load(self, data: dict, model: Model, extensions: bool = False) -> None:
-        """Support loading data into the model entity from its dictionary representation."""
+    def load(
+        self,
+        data: dict,
+        model: Model,
+        extensions: bool = False,
+        trusted: bool = False,
+        compact_iris: bool = False,
+    ) -> None:
+        """Support loading data into the model entity from its dictionary representation;
+        in trusted mode the values are stored without validating each assignment, with
+        nested entities still being mapped to their entity classes by their type; if the
+        'compact_iris' argument is set to True, the values of the properties holding IRIs
+        are compacted into prefixed IRIs where their namespaces have been registered."""
 
         if not isinstance(data, dict):
             raise ValueError("The 'data' argument must be provided as a dictionary!")
@@ -756,11 +1637,61 @@ class Model(Node):
         if not isinstance(extensions, bool):
             raise TypeError("The 'extensions' argument must have a boolean value!")
 
-        self._loading = True
+        if not isinstance(trusted, bool):
+            raise TypeError("The 'trusted' argument must have a boolean value!")
+
+        if not isinstance(compact_iris, bool):
+            raise TypeError("The 'compact_iris' argument must have a boolean value!")
+
+        identifiers: frozenset[str] = model._plan()[3] if compact_iris else frozenset()
+
+        object.__setattr__(self, "_loading", True)
 
         for property, value in data.items():
-            if isinstance(value, dict):
-                value = self.create(value, property=property, extensions=extensions)
+            if property in identifiers:
+                value = model._compact(value)
+
+            # In trusted mode, values are stored directly under the property's resolved
+            # name, while any special attributes are still assigned via __setattr__
+            if trusted is True and (storage := model._storage(property)):
+                name, multiple = storage
+
+                items: list[object] = []
+
+                for item in value if isinstance(value, list) else [value]:
+                    if isinstance(item, dict):
+                        item = self.create(
+                            item,
+                            property=property,
+                            extensions=extensions,
+                            trusted=trusted,
+                            compact_iris=compact_iris,
+                        )
+
+                    items.append(item)
+
+                # A property accepting a single value that holds several values keeps all
+                # of them, rather than only its last value, so that validate() can report
+                # the cardinality violation
+                if multiple is False and isinstance(value, list) and len(items) > 1:
+                    model._assign(
+                        name, [item for item in items if not item is None], multiple
+                    )
+
+                    continue
+
+                for item in items:
+                    if item is None:
+                        delattr(model, name)
+                    else:
+                        model._assign(name, item, multiple)
+            elif isinstance(value, dict):
+                value = self.create(
+                    value,
+                    property=property,
+                    extensions=extensions,
+                    compact_iris=compact_iris,
+                )
 
                 setattr(model, property, value)
             elif isinstance(value, list):
@@ -770,13 +1701,182 @@ class Model(Node):
                             item,
                             property=property,
                             extensions=extensions,
+                            compact_iris=compact_iris,
                         )
 
                     setattr(model, property, item)
             else:
                 setattr(model, property, value)
 
-        self._loading = False
+        object.__setattr__(self, "_loading", False)
+
+    def _storage(self, name: str) -> tuple[str, bool] | None:
+        """Resolve the name that the named property's values are stored under, via its
+        canonical name or alias, and whether the property holds multiple values, for
+        trusted loading; special attributes resolve to None. The resolutions are held
+        per entity class, and are discarded when the model changes."""
+
+        if (storages := self._storages.get(self.__class__)) is None:
+            storages = self._storages[self.__class__] = {}
+        elif name in storages:
+            return storages[name]
+
+        if name.startswith("_") and name in self._special:
+            storages[name] = None
+        else:
+            prop: PropertySpec = self._properties.get(name) or {}
+
+            final: str = prop.get("canonical") or prop.get("alias") or name
+
+            storages[name] = (final, final in self._multiple)
+
+        return storages[name]
+
+    def validate(self, raises: bool = False) -> list[Violation]:
+        """Validate the properties assigned to the model entity and to the entities nested
+        within it in a single pass, returning a Violation for each property that is not
+        accepted, each value that is not of the property's range types, and each single
+        valued property that holds several values, noting the path to each from this
+        entity; if 'raises' is True, a SemanticPyError is raised listing the violations
+        instead. This supports validating entities loaded in trusted mode, or assembled
+        in the deferred validation mode, once rather than on every assignment."""
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        violations: list[Violation] = []
+
+        validated: set[int] = set()
+
+        # The acceptance, cardinality and range types of each property of each entity
+        # class are determined once, from the class' property table, as they are met
+        checks: dict[tuple[type, str], tuple[bool, bool, tuple[type]]] = {}
+
+        def _check(node: Model, name: str) -> tuple[bool, bool, tuple[type]]:
+            prop: PropertySpec = node._properties.get(name) or {}
+
+            accepted: bool = (
+                name.startswith("@")
+                or name in node._special
+                or prop.get("accepted") is True
+            )
+
+            types: tuple[type] = None
+
+            if accepted and (range := prop.get("range")):
+                types = node._range_types(range=range, property=name)
+
+            return (accepted, prop.get("individual") is True, types)
+
+        def _violation(
+            kind: ViolationType,
+            node: Model,
+            name: str,
+            value: object,
+            path: tuple[str | int],
+            message: str,
+        ):
+            # Paths are held as tuples of property names and list indices while walking
+            # the graph, and are only formatted, such as 'identified_by[0].content', for
+            # the properties which fail validation
+            location: str = ""
+
+            for component in path:
+                if isinstance(component, int):
+                    location += "[%d]" % (component)
+                elif location:
+                    location += "." + component
+                else:
+                    location = component
+
+            violations.append(
+                Violation(
+                    kind=kind,
+                    path=location,
+                    entity=node.__class__.__name__,
+                    property=name,
+                    value=value,
+                    message=message,
+                )
+            )
+
+        def _validate(node: Model, path: tuple[str | int]):
+            # Nodes may be referenced from several places within the graph, or cyclically,
+            # so each node is only validated once, at the first path it is reached by
+            if id(node) in validated:
+                return
+
+            validated.add(id(node))
+
+            for name, value in node._data.items():
+                if (check := checks.get((node.__class__, name))) is None:
+                    check = checks[(node.__class__, name)] = _check(node, name)
+
+                accepted, individual, types = check
+
+                if not accepted:
+                    _violation(
+                        ViolationType.Acceptance,
+                        node,
+                        name,
+                        value,
+                        path + (name,),
+                        "The '%s' property is not in the list of accepted properties for %s!"
+                        % (name, node.__class__.__name__),
+                    )
+
+                    continue
+
+                if isinstance(value, list):
+                    if individual and len(value) > 1:
+                        _violation(
+                            ViolationType.Cardinality,
+                            node,
+                            name,
+                            value,
+                            path + (name,),
+                            "The '%s' property of %s accepts a single value, but holds %d values!"
+                            % (name, node.__class__.__name__, len(value)),
+                        )
+
+                    items = enumerate(value)
+                else:
+                    items = ((None, value),)
+
+                for index, item in items:
+                    if types and not isinstance(item, types):
+                        _violation(
+                            ViolationType.Range,
+                            node,
+                            name,
+                            item,
+                            path + ((name,) if index is None else (name, index)),
+                            "The value of type '%s' must be of type %s!"
+                            % (
+                                type(item),
+                                (", ".join(["'%s'" % (x) for x in types])),
+                            ),
+                        )
+
+                    if isinstance(item, Model):
+                        _validate(
+                            item,
+                            path + ((name,) if index is None else (name, index)),
+                        )
+
+        _validate(self, ())
+
+        if raises is True and violations:
+            raise SemanticPyError(
+                "The %s entity failed validation with %d violation(s):\n%s"
+                % (
+                    self.__class__.__name__,
+                    len(violations),
+                    "\n".join([" - %s" % (violation) for violation in violations]),
+                )
+            )
+
+        return violations
 
     def save(self, filepath: str, overwrite: bool = False, **kwargs) -> str:
         """Support saving the current Model entity to a JSON-LD file."""
@@ -803,28 +1903,67 @@ class Model(Node):
                     f"The 'filepath' specifies a path, '{filepath}', for a file that already exists; set 'overwrite' to 'True' to allow the file to be overwritten!"
                 )
 
-        with open(filepath, "w+", encoding="utf-8") as handle:
-            handle.write(self.json(**kwargs))
+        with instrumentation.span("save", type=self.__class__.__name__):
+            with open(filepath, "w+", encoding="utf-8") as handle:
+                self.dump(handle, **kwargs)
 
             return handle.name
 
+    @classmethod
+    def _construction(cls) -> tuple[dict, dict]:
+        """Determine the construction plan for instances of the class, comprising the
+        instance attributes that the Node initializer would set from the settings, and
+        the resolved name and multiplicity of each of the essential model properties
+        that can be assigned without validation, as their string values are known to
+        satisfy the properties' ranges; the plan is discarded when the model changes."""
+
+        # Enable support for the essential model properties
+        for prop in ["id", "type", "_label"]:
+            if not prop in cls._properties:
+                cls._properties[prop] = PropertySpec(
+                    accepted=True,
+                    individual=True,
+                    range="xsd:string",
+                )
+
+        attributes: dict[str, object] = {}
+
+        settings: dict[str, object] = cls._settings.get("properties", {})
+
+        for name in ["_canonical", "_namespace", "_multiple", "_sorting"]:
+            if not getattr(cls, name) and (value := settings.get(name[1:])):
+                attributes[name] = value
+
+        assignments: dict[str, tuple[str, bool]] = {}
+
+        for name in ["type", "id", "_label"]:
+            prop: PropertySpec = cls._properties[name]
+
+            if not prop.get("accepted") is True:
+                continue
+
+            final: str = prop.get("canonical") or prop.get("alias") or name
+
+            if range := prop.get("range"):
+                try:
+                    types = cls._range_types(range=range, property=final)
+                except (TypeError, ValueError, RuntimeError):
+                    continue
+
+                if not issubclass(str, types):
+                    continue
+
+            assignments[name] = (final, final in cls._multiple)
+
+        cls._constructions[cls] = (attributes, assignments)
+
+        return cls._constructions[cls]
+
     def __new__(cls, *args, **kwargs):
-        # The '_special' list variable is defined in the base class and holds a list of
-        # special class attribute names
-
-        cls._special += [
-            attr
-            for attr in [
-                "_hidden",
-                "_reference",
-                "_referenced",
-                "_cloned",
-                "_loading",
-            ]
-            if attr not in cls._special
-        ]
-
-        if cls is Model:
+        # Instances of the base model class, or the base class of a ModelRegistry, which
+        # are the only model classes to hold their own entity namespace, are created as
+        # the model entity noted by the data's 'type' property, if any data was provided
+        if "_entities" in cls.__dict__:
             if isinstance(data := kwargs.get("data"), dict):
                 if isinstance(type := data.get("type"), str):
                     if issubclass(entity := cls.entity(type), Model):
@@ -847,36 +1986,51 @@ class Model(Node):
         label: str = None,
         data: dict[str, object] = None,
         extensions: bool = False,
+        trusted: bool = False,
+        compact_iris: bool = False,
         **kwargs,
     ):
-        super().__init__(
-            # TODO: Determine if setting data via the superclass' constructor is optimal
-            # data=data,
-        )
-
         if not isinstance(extensions, bool):
             raise TypeError("The 'extensions' argument must have a boolean value!")
 
-        self._annotations: dict[str, object] = {}
+        if not isinstance(trusted, bool):
+            raise TypeError("The 'trusted' argument must have a boolean value!")
 
-        # Enable support for the essential model properties
-        for prop in ["id", "type", "_label"]:
-            if not prop in self._properties:
-                self._properties[prop] = {
-                    "accepted": True,
-                    "individual": True,
-                    "range": "xsd:string",
-                }
+        if not isinstance(compact_iris, bool):
+            raise TypeError("The 'compact_iris' argument must have a boolean value!")
+
+        # Initialize the instance from the class' construction plan, which holds the
+        # instance attributes that the Node initializer would set, and the resolved
+        # assignments of the essential model properties, so that neither needs to be
+        # determined again for each instance of the class
+        if (construction := self._constructions.get(self.__class__)) is None:
+            construction = self._construction()
 
-        self.type: str = self.__class__.__name__
+        attributes, assignments = construction
 
+        object.__setattr__(self, "_data", {})
+
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+        # In trusted mode, values are only validated by validate(), so the document's
+        # identifier and label, if invalid, are left to be stored as they are loaded
         if isinstance(data, dict):
             if ident is None:
                 ident = data.get("id")
 
+                if compact_iris is True:
+                    ident = self._compact(ident)
+
+                if trusted is True and not isinstance(ident, str):
+                    ident = None
+
             if label is None:
                 label = data.get("_label")
 
+                if trusted is True and not isinstance(label, str):
+                    label = None
+
         if ident is None:
             pass
         elif not isinstance(ident, str):
@@ -884,8 +2038,6 @@ class Model(Node):
                 "The 'ident' (identity) argument, if specified, must have a string value!"
             )
 
-        self.id: str = ident or None
-
         if label is None:
             pass
         elif not isinstance(label, str):
@@ -893,7 +2045,15 @@ class Model(Node):
                 "The 'label' (identity) argument, if specified, must have a string value!"
             )
 
-        self._label: str = label or None
+        for name, value in [
+            ("type", self.__class__.__name__),
+            ("id", ident or None),
+            ("_label", label or None),
+        ]:
+            if not (assignment := assignments.get(name)):
+                self.__setattr__(name, value)
+            elif not value is None:
+                self._assign(assignment[0], value, assignment[1])
 
         # If a 'json' keyword argument has been specified, attempt to parse the value as
         # a JSON serialized string so long as the 'data' argument has not been specified
@@ -905,7 +2065,7 @@ class Model(Node):
 
             if data is None:
                 try:
-                    data = json.loads(jsons)
+                    data = self._json().loads(jsons)
                 except Exception as exception:
                     raise ValueError(
                         "The 'json' argument does not contain a valid JSON string: %s!"
@@ -919,7 +2079,13 @@ class Model(Node):
         if data is None:
             pass
         elif isinstance(data, dict):
-            self.load(data=data, model=self, extensions=extensions)
+            self.load(
+                data=data,
+                model=self,
+                extensions=extensions,
+                trusted=trusted,
+                compact_iris=compact_iris,
+            )
         else:
             raise TypeError(
                 "The 'data' argument, if specified, must have a dictionary value!"
@@ -939,26 +2105,74 @@ class Model(Node):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(ident = {self.id}, label = {self._label})>"
 
-    def __getstate__(self) -> dict:
-        """Support serializing deep copies of instances of this class"""
-
-        return self.__dict__.copy()
-
     def __setstate__(self, state: dict) -> None:
         """Support restoring from deep copies of instances of this class"""
 
         self.__dict__.update(state)
 
+    def _canonical_items(self) -> list[tuple[str, object]]:
+        """Return the entity's properties as they would be serialized, with any prefixed
+        IRIs expanded, and omitting any hidden properties, for fingerprinting and
+        comparison."""
+
+        items: list[tuple[str, object]] = super()._canonical_items()
+
+        if isinstance(self._hidden, list):
+            items = [(key, value) for key, value in items if not key in self._hidden]
+
+        identifiers: frozenset[str] = self._plan()[3]
+
+        for index, (key, value) in enumerate(items):
+            if key in identifiers:
+                items[index] = (key, self._expand(value))
+
+        return items
+
     def __setattr__(self, name: str, value: object) -> None:
         logger.debug(
-            "%s.%s(name: %s, value: %s) called",
+            "%s.__setattr__(name: %s, value: %s) called",
             self.__class__.__name__,
-            self.__setattr__.__name__,
             name,
             value,
         )
 
-        prop: dict[str, object] = self._properties.get(name) or {}
+        # In the deferred validation mode, values are stored without being validated, as
+        # in trusted loading, so that the entity graph may be validated once it is built
+        if self._deferred is True and (storage := self._storage(name)):
+            if value is None:
+                super().__delattr__(storage[0])
+            else:
+                self._assign(storage[0], value, storage[1])
+
+            return
+
+        # If the class' assignment plan holds the property, the assignment only needs to
+        # check the value's type against the property's already resolved range types
+        if value is not None and (
+            plan := self._assignments.get(self.__class__, {}).get(name)
+        ):
+            final, types, multiple = plan
+
+            if instrumentation.enabled and types:
+                instrumentation.count("validations")
+
+            if types is None or isinstance(value, types):
+                return self._assign(final, value, multiple)
+
+            raise TypeError(
+                "Cannot set value of type '%s' on '%s'; must be of type %s!"
+                % (
+                    type(value),
+                    final,
+                    (", ".join(["'%s'" % (x) for x in types])),
+                )
+            )
+
+        planned: str = name
+
+        types: tuple[type] = None
+
+        prop: PropertySpec = self._properties.get(name) or {}
 
         if canonical := prop.get("canonical"):
             name = canonical
@@ -1011,41 +2225,10 @@ class Model(Node):
             return super().__delattr__(name)
         else:
             if range := prop.get("range"):
-                types: tuple = ()
-
-                if isinstance(range, str):
-                    ranges = [range]
-                elif isinstance(range, list):
-                    ranges = range
-                elif issubclass(range, Model):
-                    ranges = [range]
-                else:
-                    raise TypeError(
-                        "The 'range' property must be defined as a string, list, or a Model class type, not %s!"
-                        % (range)
-                    )
-
-                for range in ranges:
-                    if not (isinstance(range, str) or issubclass(range, Model)):
-                        raise TypeError(
-                            "The 'range' property can only contain valid type names or Model class types!"
-                        )
-
-                    if not (typed := self._find_type(range=range)) is None:
-                        if isinstance(typed, tuple):
-                            types += tuple(typed)
-                        else:
-                            types += (typed,)
-                    else:
-                        raise ValueError(
-                            "The '%s' range for the '%s' property cannot be reconciled to a known range type!"
-                            % (range, name)
-                        )
+                if instrumentation.enabled:
+                    instrumentation.count("validations")
 
-                if len(types) == 0:
-                    raise RuntimeError(
-                        "Unable to find associated types for any of the specified ranges!"
-                    )
+                types = self._range_types(range=range, property=name)
 
                 if not isinstance(value, types):
                     raise TypeError(
@@ -1066,26 +2249,109 @@ class Model(Node):
                     domain,
                 )
 
+            # Plan the assignment of accepted properties, so that later assignments to
+            # the property on this class can skip resolving its name and range types
+            if prop.get("accepted") is True and not (
+                name.startswith("_") and name in self._special
+            ):
+                self._assignments.setdefault(self.__class__, {})[planned] = (
+                    name,
+                    types,
+                    name in self._multiple,
+                )
+
         return super().__setattr__(name, value)
 
-    def _find_type(self, range: str | Model) -> type | tuple[type] | None:
+    @classmethod
+    def _find_type(cls, range: str | Model) -> type | tuple[type] | None:
+        if instrumentation.enabled:
+            instrumentation.count("lookups")
+
+        if isinstance(range, str) and range in cls._primitives:
+            return cls._primitives[range]
+
+        if (entity := cls._ranges.get(range)) is None:
+            return None
+
+        # If the entity is lazily materialized, materialize it on first use, unless the
+        # entity was excluded from the slice of the profile and has not been built, as
+        # the excluded entity must remain unknown, so its class is built without being
+        # registered, so that it is not added to the namespace or to the globals scope
+        if isinstance(entity, Placeholder):
+            if cls._sliced.get(entity._key) is entity and not entity.resolved:
+                entity = entity._resolver(entity._key, register=False)
+            else:
+                entity = entity.resolve()
+
+        return entity
+
+    @classmethod
+    def _range_types(
+        cls, range: str | list[str] | tuple[str] | Model, property: str
+    ) -> tuple[type]:
+        """Resolve the specified range, or list of ranges, to the tuple of types that
+        values assigned to the property must be instances of; the resolved types are
+        memoized until the model is next extended or torn down."""
+
+        if isinstance(range, list):
+            range = tuple(range)
+
+        if types := cls._range_memo.get(range):
+            return types
+
+        types: tuple[type] = ()
+
         if isinstance(range, str):
-            if range == "rdfs:Literal":
-                return (str, int, float)
-            elif range == "rdfs:Class":
-                return str
-            elif range == "xsd:string":
-                return str
-            elif range == "xsd:dateTime":
-                return (str, datetime.datetime)
-
-        for key, entity in self._entities.items():
-            if isinstance(range, str):
-                if entity._name == range:
-                    return entity
-            elif issubclass(range, Model):
-                if entity is range:
-                    return entity
+            ranges = [range]
+        elif isinstance(range, tuple):
+            ranges = range
+        elif issubclass(range, Model):
+            ranges = [range]
+        else:
+            raise TypeError(
+                "The 'range' property must be defined as a string, list, or a Model class type, not %s!"
+                % (range)
+            )
+
+        for _range in ranges:
+            if not (isinstance(_range, str) or issubclass(_range, Model)):
+                raise TypeError(
+                    "The 'range' property can only contain valid type names or Model class types!"
+                )
+
+            if not (typed := cls._find_type(range=_range)) is None:
+                if isinstance(typed, tuple):
+                    types += tuple(typed)
+                else:
+                    types += (typed,)
+            else:
+                raise ValueError(
+                    "The '%s' range for the '%s' property cannot be reconciled to a known range type!"
+                    % (_range, property)
+                )
+
+        if len(types) == 0:
+            raise RuntimeError(
+                "Unable to find associated types for any of the specified ranges!"
+            )
+
+        cls._range_memo[range] = types
+
+        return types
+
+    @classmethod
+    def _index(cls, entity: Model | Placeholder, names: list[str] = None) -> None:
+        """Add the entity class, or the placeholder for a lazily materialized class, to
+        the range index under its IRI, its type code, the specified names, and in the
+        case of classes, the class itself; where several entities share a reference
+        the first entity to be indexed under the reference is retained."""
+
+        for reference in [entity._name, entity._type] + (names or []):
+            if isinstance(reference, str):
+                cls._ranges.setdefault(reference, entity)
+
+        if isinstance(entity, type):
+            cls._ranges.setdefault(entity, entity)
 
     @property
     def name(self) -> str:
@@ -1219,29 +2485,90 @@ class Model(Node):
 
         return self._referenced is True
 
-    def _serialize(
+    def _serialization(
         self,
-        source: object = None,
-        sorting: list[str] | dict[str, int] = None,
-    ) -> object:
-        """Support serializing the current model instance into JSON-LD."""
+    ) -> tuple[dict[str, str], dict[str, int], frozenset[str], frozenset[str]]:
+        """Compile the serialization plan for the entity class, noting its hidden
+        properties, and its properties holding IRIs, whose prefixes are expanded, being
+        its 'id' property and those whose ranges are IRI types, under each of the names
+        that their values may be stored under."""
+
+        names, positions, hidden, identifiers = super()._serialization()
+
+        if isinstance(self._hidden, list):
+            hidden = frozenset(self._hidden)
+
+        iris: set[str] = {"id"}
+
+        for name, prop in self._properties.items():
+            range = prop.get("range")
+
+            for _range in range if isinstance(range, (list, tuple)) else [range]:
+                if isinstance(_range, str) and _range in self._iri_ranges:
+                    iris.update(
+                        key
+                        for key in [name, prop.get("canonical"), prop.get("alias")]
+                        if isinstance(key, str)
+                    )
+
+        return (names, positions, hidden, frozenset(iris))
+
+    def _expand(self, value: object) -> object:
+        """Expand the prefix of the IRI, or of each IRI in a list of IRIs, into its URI,
+        if the prefix is registered, by looking up the part of the IRI that precedes its
+        first colon; as the same IRIs tend to recur across documents, expanded IRIs are
+        memoized, which also allows the documents to share the expanded strings."""
+
+        if isinstance(value, str):
+            if not (expanded := self._expansions.get(value)) is None:
+                return expanded
+
+            prefix, separator, suffix = value.partition(":")
+
+            if separator and not (uri := self.__class__._prefixes.get(prefix)) is None:
+                # Bound the memo, which would otherwise grow with each distinct IRI
+                if len(self._expansions) >= 65536:
+                    self._expansions.clear()
 
-        if isinstance(source, dict):
-            source = dict(source)
+                expanded = self._expansions[value] = uri + suffix
 
-            if isinstance(identifier := source.get("id"), str):
-                for prefix, uri in self.__class__._prefixes.items():
-                    if identifier.startswith(prefix + ":"):
-                        source["id"] = identifier.replace(prefix + ":", uri)
+                return expanded
+        elif isinstance(value, list):
+            return [self._expand(item) for item in value]
 
-        data: object = super()._serialize(source=source, sorting=sorting)
+        return value
 
-        if isinstance(self._hidden, list) and isinstance(data, dict):
-            for prop in self._hidden:
-                if prop in data:
-                    del data[prop]
+    def _compact(self, value: object) -> object:
+        """Compact the IRI, or each IRI in a list of IRIs, into a prefixed IRI using the
+        prefix registered for the longest namespace that the IRI starts with, if any; as
+        the registered namespaces end with a slash, the namespaces are found by looking
+        up the IRI up to each of its slashes in turn, from its last slash; as with the
+        expanded IRIs, compacted IRIs are memoized."""
 
-        return data
+        if isinstance(value, str):
+            if not (compacted := self._compactions.get(value)) is None:
+                return compacted
+
+            namespaces: dict[str, str] = self.__class__._namespaces
+
+            if namespaces:
+                index: int = len(value) - 1
+
+                while (index := value.rfind("/", 0, index)) > 0:
+                    if not (prefix := namespaces.get(value[: index + 1])) is None:
+                        # Bound the memo, which would otherwise grow with each distinct IRI
+                        if len(self._compactions) >= 65536:
+                            self._compactions.clear()
+
+                        compacted = self._compactions[value] = (
+                            prefix + ":" + value[index + 1 :]
+                        )
+
+                        return compacted
+        elif isinstance(value, list):
+            return [self._compact(item) for item in value]
+
+        return value
 
     def properties(
         self,
@@ -1249,6 +2576,9 @@ class Model(Node):
         callback: callable = None,
         attribute: str | int = None,
         unpack: bool = False,
+        nested: bool = True,
+        cached: bool = False,
+        compact_iris: bool = False,
     ) -> dict[str, object]:
         """Support obtaining a dictionary representation of the properties assigned to
         the current model instance."""
@@ -1258,13 +2588,16 @@ class Model(Node):
                 sorting=sorting,
                 callback=callback,
                 attribute=attribute,
+                nested=nested,
+                cached=cached,
+                compact_iris=compact_iris,
             )
             or {}
         )
 
         # If a context has been specified, prepend the @context property
         if context := (self._context or self._profile.get("context")):
-            properties = {**{"@context": context}, **properties}
+            properties = {**{"@context": self._expand(context)}, **properties}
 
         return properties.items() if unpack is True else properties
 
@@ -1274,7 +2607,7 @@ class Model(Node):
         if name is None:
             return copy.copy(self._properties)
         elif info := self._properties.get(name):
-            return copy.copy(info)
+            return dict(info)
         else:
             return default
 
@@ -1323,32 +2656,32 @@ class Model(Node):
                 node = node._reference
 
             if not isinstance(node, Model):
-                logger.debug(">>> node is invalid: %s" % (type(node)))
+                logger.debug(">>> node is invalid: %s", type(node))
                 return nodes
 
             if node in nodes:  # node seen before, so return, preventing an endless loop
-                logger.debug(">>> node seen before: %s" % (node))
+                logger.debug(">>> node seen before: %s", node)
                 return nodes
 
-            logger.debug("> node:           %s" % (node))
-            logger.debug("> id:             %s" % (node.id))
-            logger.debug("> is_parent:      %s" % (node is parent))
-            logger.debug("> is_blank:       %s" % (node.is_blank))
-            logger.debug("> is_clone:       %s" % (node.is_cloned))
-            logger.debug("> is_reference:   %s" % (node.is_reference))
-            logger.debug("> was_referenced: %s" % (node.was_referenced))
+            logger.debug("> node:           %s", node)
+            logger.debug("> id:             %s", node.id)
+            logger.debug("> is_parent:      %s", node is parent)
+            logger.debug("> is_blank:       %s", node.is_blank)
+            logger.debug("> is_clone:       %s", node.is_cloned)
+            logger.debug("> is_reference:   %s", node.is_reference)
+            logger.debug("> was_referenced: %s", node.was_referenced)
 
             included: bool = True
 
             if node is parent and not self is parent:
-                logger.debug(">>> node is parent: %s" % (node.id))
+                logger.debug(">>> node is parent: %s", node.id)
                 included = False
 
             if included is True and blank is False:
                 if node.is_blank is True:
                     logger.debug(
-                        ">>> node is blank (blank nodes excluded by arguments): %s"
-                        % (node)
+                        ">>> node is blank (blank nodes excluded by arguments): %s",
+                        node,
                     )
                     included = False
 
@@ -1356,32 +2689,32 @@ class Model(Node):
                 if node.id and parent.id:
                     if len(node.id) > len(parent.id) and node.id.startswith(parent.id):
                         logger.debug(
-                            ">>> node is embedded (starts with parent.id; embedded excluded by arguments): %s"
-                            % (node.id)
+                            ">>> node is embedded (starts with parent.id; embedded excluded by arguments): %s",
+                            node.id,
                         )
                         included = False
 
             if included is True and referenced is False:
                 if node.was_referenced is True:
                     logger.debug(
-                        ">>> node was referenced by another node (references excluded by arguments): %s"
-                        % (node.id)
+                        ">>> node was referenced by another node (references excluded by arguments): %s",
+                        node.id,
                     )
                     included = False
 
             if included is True and callable(filter):
                 if filter(node, self) is False:
                     logger.debug(
-                        ">>> node was filtered out by custom filter callback logic: %s"
-                        % (node.id)
+                        ">>> node was filtered out by custom filter callback logic: %s",
+                        node.id,
                     )
                     included = False
 
             if included is True:
-                logger.debug(">>> node was included: %s" % (node.id))
+                logger.debug(">>> node was included: %s", node.id)
                 nodes += [node]
             else:
-                logger.debug(">>> node not included: %s" % (node.id))
+                logger.debug(">>> node not included: %s", node.id)
 
             for key, value in node.data.items():
                 if isinstance(value, Model):
@@ -1411,15 +2744,211 @@ class Model(Node):
         return nodes
 
 
+class ModelRegistry(object):
+    """SemanticPy Model Registry Class, which owns an independent model, comprising its
+    own entity namespace, prefixes, extensions and configuration, so that models built
+    from several profiles may be used side by side within the same process"""
+
+    # The mutable class-level state of the Model (and Node) classes, which is copied for
+    # each registry, so that changes made to one registry's model do not affect another
+    _copied: tuple[str] = (
+        "_property",
+        "_properties",
+        "_hidden",
+        "_canonical",
+        "_namespace",
+        "_multiple",
+        "_sorting",
+        "_special",
+        "_settings",
+    )
+
+    # The class-level prefixes, extensions and caches of the Model class, which begin
+    # empty for each registry
+    _emptied: tuple[str] = (
+        "_prefixes",
+        "_expansions",
+        "_namespaces",
+        "_compactions",
+        "_extensions",
+        "_assignments",
+        "_ranges",
+        "_range_memo",
+        "_constructions",
+        "_storages",
+        "_plans",
+        "_sliced",
+        "_detached",
+        "_batched",
+    )
+
+    def __init__(
+        self,
+        profile: str = None,
+        context: str = None,
+        globals: dict = None,
+        cache: bool | str = False,
+        lazy: bool = False,
+        name: str = None,
+    ):
+        if name is None:
+            name = Model.__name__
+        elif not (isinstance(name, str) and name.isidentifier()):
+            raise TypeError(
+                "The 'name' argument, if specified, must be a valid class name string!"
+            )
+
+        attributes: dict[str, object] = {
+            "__doc__": "SemanticPy Registry Model Class",
+            "_entities": Namespace(),
+            "_profile": None,
+            "_context": None,
+            "_globals": None,
+            "_loading": False,
+            "_overwrite_mode": None,
+            "_appending_mode": None,
+            "_validation_mode": None,
+            "_deferred": False,
+            "_unknown_mode": None,
+            "_codec": None,
+            "_batching": 0,
+            "_generation": [0],
+        }
+
+        for attribute in self._copied:
+            attributes[attribute] = copy.copy(getattr(Model, attribute))
+
+        for attribute in self._emptied:
+            attributes[attribute] = {}
+
+        self._model: type[Model] = type(name, (Model,), attributes)
+
+        if profile is None:
+            pass
+        else:
+            self.factory(
+                profile=profile,
+                context=context,
+                globals=globals,
+                cache=cache,
+                lazy=lazy,
+            )
+
+    def __repr__(self) -> str:
+        return "<%s(model: %s, entities: %d)>" % (
+            self.__class__.__name__,
+            self._model.__name__,
+            len(self._model._entities),
+        )
+
+    def __getattr__(self, name: str) -> Model:
+        """Support accessing the registry's entity classes as registry attributes."""
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if (entity := self._model._entities.get(name)) is None:
+            raise AttributeError(
+                "The '%s' entity has not been registered with the registry!" % (name)
+            )
+
+        return entity
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._model._entities
+
+    @property
+    def model(self) -> type[Model]:
+        """The registry's base model class, from which its entity classes descend."""
+
+        return self._model
+
+    @property
+    def entities(self) -> Namespace:
+        """The registry's entity namespace."""
+
+        return self._model._entities
+
+    def factory(self, profile: str, **kwargs) -> Namespace:
+        """Build the registry's model from the profile; see Model.factory()."""
+
+        return self._model.factory(profile=profile, **kwargs)
+
+    def teardown(self, globals: dict = None) -> None:
+        """Tear down the registry's model; see Model.teardown()."""
+
+        return self._model.teardown(globals=globals)
+
+    def configure(self, **kwargs) -> None:
+        """Configure the registry's model; see Model.configure()."""
+
+        return self._model.configure(**kwargs)
+
+    def extend(self, subclass: Model, **kwargs) -> None:
+        """Extend the registry's model; see Model.extend()."""
+
+        if not (isinstance(subclass, type) and issubclass(subclass, self._model)):
+            raise TypeError(
+                "The 'subclass' argument must reference a subclass of the registry's model class, %s.model!"
+                % (self.__class__.__name__)
+            )
+
+        return self._model.extend(subclass, **kwargs)
+
+    def extending(self) -> contextlib.AbstractContextManager:
+        """Batch extensions of the registry's model; see Model.extending()."""
+
+        return self._model.extending()
+
+    def prefix(self, prefix: str, uri: str) -> None:
+        """Register an identifier prefix with the registry; see Model.prefix()."""
+
+        return self._model.prefix(prefix, uri)
+
+    def entity(self, name: str = None, property: str = None) -> Model | None:
+        """Obtain a registered entity class; see Model.entity()."""
+
+        return self._model.entity(name=name, property=property)
+
+    def open(
+        self,
+        filepath: str,
+        extensions: bool = False,
+        trusted: bool = False,
+        compact_iris: bool = False,
+    ) -> Model:
+        """Open a JSON-LD document using the registry's model; see Model.open()."""
+
+        return self._model.open(
+            filepath,
+            extensions=extensions,
+            trusted=trusted,
+            compact_iris=compact_iris,
+        )
+
+    def create(self, data: dict, **kwargs) -> Model:
+        """Create a model entity from its data using the registry; see Model.create()."""
+
+        return self._model.create(data, **kwargs)
+
+
 __all__ = [
     # Classes
     "Node",
     "Nodes",
     "Namespace",
     "Model",
+    "ModelRegistry",
+    "Violation",
     # Enumerations
     "OverwriteMode",
     "AppendingMode",
+    "UnknownMode",
+    "ValidationMode",
+    "ViolationType",
     # Exceptions
     "SemanticPyError",
+    # Functions
+    "instrument",
+    "stats",
 ]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from semanticpy import __version__
+from semanticpy.errors import SemanticPyError
+from semanticpy.logging import logger
+
+logger = logger.getChild(__name__)
+
+
+def compile_profile(arguments: argparse.Namespace) -> int:
+    """Compile a profile into a static model module, written to the output path or to
+    standard output if no output path was specified."""
+
+    from semanticpy.compiler import generate
+
+    source: str = generate(profile=arguments.profile, context=arguments.context)
+
+    if arguments.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(arguments.output, "w", encoding="utf-8") as handle:
+            handle.write(source)
+
+    return 0
+
+
+def main(arguments: list[str] = None) -> int:
+    """The entry point for the `semanticpy` command line interface."""
+
+    parser = argparse.ArgumentParser(
+        prog="semanticpy",
+        description="SemanticPy command line tools.",
+    )
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="%(prog)s " + __version__,
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser(
+        "compile-profile",
+        help="compile a profile into a Python module of static model classes",
+    )
+
+    command.add_argument(
+        "profile",
+        help="the name of a profile provided with the library, or a profile's path",
+    )
+
+    command.add_argument(
+        "-o",
+        "--output",
+        help="the path of the Python module to write; defaults to standard output",
+    )
+
+    command.add_argument(
+        "-c",
+        "--context",
+        help="the JSON-LD context URL to use in place of the profile's context",
+    )
+
+    command.set_defaults(handler=compile_profile)
+
+    arguments = parser.parse_args(arguments)
+
+    try:
+        return arguments.handler(arguments)
+    except (SemanticPyError, TypeError, ValueError) as exception:
+        parser.exit(status=1, message="semanticpy: error: %s\n" % (exception))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
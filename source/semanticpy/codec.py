@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import datetime
+import json
+
+from typing import Iterator
+
+from semanticpy.logging import logger
+from semanticpy.errors import SemanticPyError
+
+logger = logger.getChild(__name__)
+
+
+class Codec(object):
+    """Base JSON codec class, defining the interface through which the library parses
+    profiles and documents, and serializes documents; codec subclasses register their
+    backend's name, so that they may be configured by name, such as 'orjson'"""
+
+    name: str = None
+
+    # Whether the codec can encode documents incrementally via iterencode()
+    streaming: bool = False
+
+    _codecs: dict[str, type[Codec]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if isinstance(cls.name, str):
+            Codec._codecs[cls.name] = cls
+
+    def __repr__(self) -> str:
+        return "<%s(name: %s)>" % (self.__class__.__name__, self.name)
+
+    @classmethod
+    def named(cls, name: str) -> Codec:
+        """Create an instance of the named codec, such as 'json', 'orjson' or 'msgspec',
+        raising an error if the codec is unknown or its backend is not installed."""
+
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must have a string value!")
+
+        if not (codec := cls._codecs.get(name.strip().lower())):
+            raise ValueError(
+                "The '%s' codec is unknown; the supported codecs are: '%s'!"
+                % (name, "', '".join(cls._codecs))
+            )
+
+        return codec()
+
+    @classmethod
+    def available(cls) -> list[str]:
+        """Return the names of the codecs whose backends are installed."""
+
+        available: list[str] = []
+
+        for name in cls._codecs:
+            try:
+                cls.named(name)
+            except SemanticPyError:
+                continue
+
+            available.append(name)
+
+        return available
+
+    def default(self, value: object) -> object:
+        """Encode values that JSON does not natively support, such as the date-time
+        values that 'xsd:dateTime' properties accept, as JSON compatible values."""
+
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+
+        raise TypeError(
+            "Object of type %s is not JSON serializable" % (type(value).__name__)
+        )
+
+    def loads(self, data: str | bytes) -> object:
+        """Parse the JSON string or bytes, raising a ValueError if the data is invalid."""
+
+        raise NotImplementedError
+
+    def dumps(self, value: object, indent: int = None) -> str:
+        """Serialize the value to a JSON string, indenting it if an indent is specified."""
+
+        raise NotImplementedError
+
+    def iterencode(
+        self,
+        value: object,
+        indent: int = None,
+        default: callable = None,
+    ) -> Iterator[str]:
+        """Serialize the value to JSON incrementally, yielding the encoded chunks as they
+        are produced, which join to the same string that dumps() returns; values that
+        cannot be encoded natively are passed to the default callable, if specified, or
+        to the codec's default() method otherwise, and the values that they return are
+        encoded in turn, as they are reached. Only supported by streaming codecs."""
+
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    """JSON codec class using the standard library's json module, the default codec"""
+
+    name: str = "json"
+
+    streaming: bool = True
+
+    def loads(self, data: str | bytes) -> object:
+        return json.loads(data)
+
+    def dumps(self, value: object, indent: int = None) -> str:
+        return json.dumps(
+            value,
+            indent=indent,
+            ensure_ascii=False,
+            sort_keys=False,
+            default=self.default,
+        )
+
+    def iterencode(
+        self,
+        value: object,
+        indent: int = None,
+        default: callable = None,
+    ) -> Iterator[str]:
+        return json.JSONEncoder(
+            indent=indent,
+            ensure_ascii=False,
+            sort_keys=False,
+            default=default or self.default,
+        ).iterencode(value)
+
+
+class OrjsonCodec(Codec):
+    """JSON codec class using the optional orjson library; orjson only supports an indent
+    of two spaces, so output with any other indent is serialized by the json module, and
+    its compact output omits the spaces that the json module places after separators"""
+
+    name: str = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as exception:
+            raise SemanticPyError(
+                "The '%s' codec requires the orjson library to be installed!"
+                % (self.name)
+            ) from exception
+
+        self._orjson = orjson
+
+        self._fallback = JSONCodec()
+
+    def loads(self, data: str | bytes) -> object:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: object, indent: int = None) -> str:
+        if indent is None:
+            option = 0
+        elif indent == 2:
+            option = self._orjson.OPT_INDENT_2
+        else:
+            return self._fallback.dumps(value, indent=indent)
+
+        return self._orjson.dumps(
+            value,
+            default=self.default,
+            option=option,
+        ).decode("utf-8")
+
+
+class MsgspecCodec(Codec):
+    """JSON codec class using the optional msgspec library; its compact output omits the
+    spaces that the json module places after separators"""
+
+    name: str = "msgspec"
+
+    def __init__(self):
+        try:
+            import msgspec
+        except ImportError as exception:
+            raise SemanticPyError(
+                "The '%s' codec requires the msgspec library to be installed!"
+                % (self.name)
+            ) from exception
+
+        self._msgspec = msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=self.default)
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: str | bytes) -> object:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as exception:
+            raise ValueError(str(exception)) from exception
+
+    def dumps(self, value: object, indent: int = None) -> str:
+        encoded: bytes = self._encoder.encode(value)
+
+        if not indent is None:
+            encoded = self._msgspec.json.format(encoded, indent=indent)
+
+        return encoded.decode("utf-8")
+
+
+__all__ = [
+    "Codec",
+    "JSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+]
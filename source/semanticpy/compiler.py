@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+import pprint
+
+from semanticpy import Model, __version__
+from semanticpy.logging import logger
+from semanticpy.types import PropertySpec
+
+logger = logger.getChild(__name__)
+
+# The names of the Python types that the built-in primitive ranges resolve to, as noted
+# in the Model's table of primitive ranges, as they are referenced by the generated code
+PRIMITIVES: dict[str, tuple[str]] = {
+    range: tuple(
+        (
+            typed.__qualname__
+            if typed.__module__ == "builtins"
+            else "%s.%s" % (typed.__module__, typed.__qualname__)
+        )
+        for typed in (types if isinstance(types, tuple) else (types,))
+    )
+    for range, types in Model._primitives.items()
+}
+
+
+def literal(value: object, indent: int = 0) -> str:
+    """Format the value as a Python literal, indenting any continuation lines."""
+
+    return pprint.pformat(value, width=88 - indent, sort_dicts=False).replace(
+        "\n", "\n" + " " * indent
+    )
+
+
+def generate(profile: str, context: str = None) -> str:
+    """Compile the named profile, or the profile at the specified path, into the source
+    code of a Python module holding static class definitions for each of the profile's
+    entities; calling the module's factory() function registers the classes with the
+    Model, just as Model.factory() would after building the classes from the profile."""
+
+    if not (isinstance(profile, str) and len(profile := profile.strip()) > 0):
+        raise TypeError("The 'profile' argument must have a non-empty string value!")
+
+    if not (context is None or isinstance(context, str)):
+        raise TypeError("The 'context' argument, if specified, must be a string!")
+
+    source: str = Model._locate(profile)
+
+    logger.debug("generate(profile: %s) Compiling profile => %s", profile, source)
+
+    with open(source, "rb") as handle:
+        parsed: dict[str, object] = Model._parse(source, handle.read(), context)
+
+    compiled: dict[str, object] = Model._compile(profile=parsed, source=source)
+
+    context = Model._resolve_context(compiled["profile"], context, source)
+
+    entities: dict[str, dict] = compiled["entities"]
+
+    # Note the reference that each entity would be indexed under for range resolution,
+    # in the order that Model.factory() would index the entities, where the first entity
+    # indexed under each reference is the entity that the reference resolves to
+    references: dict[str, str] = {}
+
+    for name, entity in entities.items():
+        for reference in [entity["id"], entity["type"], name] + Model._synonyms(entity):
+            if isinstance(reference, str):
+                references.setdefault(reference, name)
+
+    # Note each distinct specification so that each is created once, and then shared
+    specifications: dict[PropertySpec, str] = {}
+
+    for name, entity in entities.items():
+        for props in entity["properties"].values():
+            if not props in specifications:
+                specifications[props] = "_S%d" % (len(specifications))
+
+    lines: list[str] = [
+        '"""',
+        "SemanticPy model module compiled from the '%s' profile."
+        % (os.path.splitext(os.path.basename(source))[0]),
+        "",
+        "This module was generated by `semanticpy compile-profile` and should not be edited;",
+        "compile the profile again instead. Call factory() to register the model's classes.",
+        '"""',
+        "",
+        "import datetime",
+        "",
+        "from semanticpy import Model",
+        "from semanticpy.types import Namespace, PropertySpec",
+        "",
+        "VERSION = %r" % (__version__),
+        "",
+        "CONTEXT = %r" % (context),
+        "",
+        "PROFILE = %s" % (literal(compiled["profile"])),
+        "",
+    ]
+
+    for props, variable in specifications.items():
+        lines.append(
+            "%s = PropertySpec(%s)"
+            % (
+                variable,
+                ", ".join(["%s=%r" % (field, value) for field, value in props.items()]),
+            )
+        )
+
+    for name, entity in entities.items():
+        lines += [
+            "",
+            "",
+            "class %s(%s):"
+            % (name, ", ".join(entity["superclasses"]) or Model.__name__),
+            "    _context = CONTEXT",
+            "    _type = %r" % (entity["type"]),
+            "    _name = %r" % (entity["id"]),
+            "    _multiple = %s" % (literal(entity["multiple"], 4)),
+            "    _sorting = %s" % (literal(entity["sorting"], 4)),
+            "    _hidden = %s" % (literal(entity["hidden"], 4)),
+            "    _property = None",
+            "    _properties = {",
+        ]
+
+        for prop, props in entity["properties"].items():
+            lines.append("        %r: %s," % (prop, specifications[props]))
+
+        lines.append("    }")
+
+        if synonym := entity["synonym"]:
+            lines.append("    _synonym = %r" % (synonym))
+
+    lines += [
+        "",
+        "",
+        "ENTITIES = {",
+    ]
+
+    for name, entity in entities.items():
+        lines.append("    %r: (%s, %r)," % (name, name, Model._synonyms(entity)))
+
+    lines += [
+        "}",
+        "",
+        "RANGES = {",
+    ]
+
+    # Resolve the distinct ranges of the properties to their tuples of types, omitting
+    # any ranges that cannot be resolved, which will raise an error when they are used
+    ranges: dict[str | tuple[str], tuple[str]] = {}
+
+    for props in specifications:
+        if not isinstance(range := props.get("range"), (str, tuple)):
+            continue
+
+        types: tuple[str] = ()
+
+        for _range in [range] if isinstance(range, str) else range:
+            if _range in PRIMITIVES:
+                types += PRIMITIVES[_range]
+            elif _range in references:
+                types += (references[_range],)
+            else:
+                types = ()
+                break
+
+        if types:
+            ranges[range] = types
+
+    for range, types in ranges.items():
+        lines.append("    %r: (%s,)," % (range, ", ".join(types)))
+
+    lines += [
+        "}",
+        "",
+        "",
+        "def factory(globals: dict = None) -> Namespace:",
+        '    """Register the model\'s entity classes, as Model.factory() would."""',
+        "",
+        "    return Model.install(",
+        "        profile=PROFILE,",
+        "        entities=ENTITIES,",
+        "        ranges=RANGES,",
+        "        version=VERSION,",
+        "        globals=globals,",
+        "    )",
+        "",
+    ]
+
+    return "\n".join(lines)
@@ -39,3 +39,49 @@ class AppendingMode(Enumeration):
     Unique = auto(
         description="Only append values to multiple-value properties that have not previously been appended to the same property."
     )
+
+
+class UnknownMode(Enumeration):
+    """This enumeration defines the behaviours for entity types which were excluded from
+    the model when the profile was sliced, in terms of how the library should handle the
+    types when they are met, such as when loading data through the open() method."""
+
+    Error = auto(
+        description="Raise an exception when an entity type excluded from the model is met.",
+        default=True,
+    )
+
+    Build = auto(
+        description="Build entity types excluded from the model on demand when they are met."
+    )
+
+
+class ValidationMode(Enumeration):
+    """This enumeration defines the validation mode behaviours for property assignments,
+    in terms of when the library should validate the values assigned to properties."""
+
+    Immediate = auto(
+        description="Validate each value as it is assigned, raising an exception for any invalid assignment.",
+        default=True,
+    )
+
+    Deferred = auto(
+        description="Store values without validating each assignment, so that the whole entity graph may be validated at once via the validate() method."
+    )
+
+
+class ViolationType(Enumeration):
+    """This enumeration defines the types of violation that the validate() method reports
+    for the properties assigned to entities."""
+
+    Acceptance = auto(
+        description="The property is not in the list of the entity's accepted properties."
+    )
+
+    Range = auto(
+        description="The value is not of one of the types in the property's range."
+    )
+
+    Cardinality = auto(
+        description="The property accepts a single value, but holds several values."
+    )
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import gzip
+import io
+import itertools
+import multiprocessing
+import os
+import pickle
+import time
+
+from typing import Iterable
+
+from semanticpy import Model
+from semanticpy.logging import logger
+from semanticpy.instrumentation import instrumentation
+
+logger = logger.getChild(__name__)
+
+# The model classes which existed when the worker processes were forked, indexed by their
+# identities, which the worker processes inherit, to resolve the classes of the records
+# that they are sent, as the classes built by the model factory, and those defined within
+# functions, cannot be found by pickle via the modules that they note
+_classes: dict[int, type[Model]] = {}
+
+
+def _index() -> dict[int, type[Model]]:
+    """Index the Model class and all of its subclasses by their identities."""
+
+    classes: dict[int, type[Model]] = {}
+
+    subclasses: list[type[Model]] = [Model]
+
+    while subclasses:
+        if not id(subclass := subclasses.pop()) in classes:
+            classes[id(subclass)] = subclass
+            subclasses.extend(subclass.__subclasses__())
+
+    return classes
+
+
+def _resolve(identity: int, name: str = None) -> type[Model]:
+    """Resolve the indexed model class, or the named entity class of its model."""
+
+    return _classes[identity] if name is None else _classes[identity].entity(name)
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle records for the worker processes, referencing their model classes via the
+    index, or for entity classes created since the worker processes were forked, such
+    as lazily materialized entity classes, by their name, via an indexed superclass."""
+
+    def reducer_override(self, value: object) -> object:
+        if isinstance(value, type) and issubclass(value, Model):
+            if _classes.get(id(value)) is value:
+                return (_resolve, (id(value),))
+
+            for base in value.__mro__[1:]:
+                if _classes.get(id(base)) is base:
+                    if base.entity(value.__name__) is value:
+                        return (_resolve, (id(base), value.__name__))
+
+                    break
+
+        return NotImplemented
+
+
+def _encode(
+    records: bytes | list[Model],
+    compact_iris: bool,
+    sorting: list[str] | dict[str, int],
+    level: int,
+) -> tuple[int, int, bytes]:
+    """Serialize a batch of records, if need be unpickling them first, into JSON Lines,
+    returning the number of records, the length of the encoded lines, and the encoded
+    lines, compressed as a gzip member if a compression level is specified."""
+
+    if isinstance(records, bytes):
+        records = pickle.loads(records)
+
+    lines: list[str] = [
+        record.json(compact=True, sorting=sorting, compact_iris=compact_iris)
+        for record in records
+    ]
+
+    block: bytes = ("\n".join(lines) + "\n").encode("utf-8")
+
+    length: int = len(block)
+
+    # As concatenated gzip members form a valid gzip file, each batch is compressed by
+    # the worker process that serialized it, rather than by the writing process
+    if level > 0:
+        block = gzip.compress(block, compresslevel=level, mtime=0)
+
+    return (len(records), length, block)
+
+
+def jsonl(
+    records: Iterable[Model],
+    path: str,
+    workers: int = None,
+    compress: bool | int = False,
+    batch: int = 100,
+    overwrite: bool = False,
+    compact_iris: bool = False,
+    sorting: list[str] | dict[str, int] = None,
+) -> dict[str, int | float]:
+    """Export the records to a JSON Lines file, holding each record's compact JSON on its
+    own line, in the order of the records; the records are serialized in batches by a
+    pool of worker processes, and the serialized batches are written as they complete,
+    while only a bounded number of batches are held in memory; if 'compress' is True, or
+    a compression level, the file is gzip-compressed, with each batch being compressed
+    by its worker process. Returns the export's throughput statistics."""
+
+    global _classes
+
+    if not isinstance(path, str):
+        raise TypeError("The 'path' argument must have a string value!")
+    elif not len(path := path.strip()) > 0:
+        raise ValueError("The 'path' argument must have a non-empty string value!")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif not (isinstance(workers, int) and workers > 0):
+        raise TypeError(
+            "The 'workers' argument, if specified, must have a positive integer value!"
+        )
+
+    if compress is False:
+        level = 0
+    elif compress is True:
+        level = 6
+    elif isinstance(compress, int) and 1 <= compress <= 9:
+        level = compress
+    else:
+        raise TypeError(
+            "The 'compress' argument must have a boolean value, or an integer compression level between 1 and 9!"
+        )
+
+    if not (isinstance(batch, int) and batch > 0):
+        raise TypeError("The 'batch' argument must have a positive integer value!")
+
+    if not isinstance(overwrite, bool):
+        raise TypeError("The 'overwrite' argument must have a boolean value!")
+
+    if not isinstance(compact_iris, bool):
+        raise TypeError("The 'compact_iris' argument must have a boolean value!")
+
+    path = os.path.abspath(os.path.expanduser(path))
+
+    if os.path.exists(path):
+        if not os.path.isfile(path):
+            raise ValueError(
+                f"The 'path' specifies a path, '{path}', for a file-system object that is not a file!"
+            )
+        elif overwrite is False:
+            raise ValueError(
+                f"The 'path' specifies a path, '{path}', for a file that already exists; set 'overwrite' to 'True' to allow the file to be overwritten!"
+            )
+
+    # The worker processes must be forked, so that they share the model classes built by
+    # the current process, including any extensions; if forking is not supported by the
+    # platform, the records are serialized by the current process instead
+    if workers > 1 and not "fork" in multiprocessing.get_all_start_methods():
+        logger.warning(
+            "Forked worker processes are not supported by the platform; the records will be exported by the current process!"
+        )
+
+        workers = 1
+
+    logger.debug(
+        "export.jsonl(path: %s, workers: %s, compress: %s, batch: %s)",
+        path,
+        workers,
+        level,
+        batch,
+    )
+
+    records = iter(records)
+
+    statistics: dict[str, int | float] = {
+        "records": 0,
+        "bytes": 0,
+        "written": 0,
+        "workers": workers,
+        "seconds": 0.0,
+        "records_per_second": 0.0,
+        "bytes_per_second": 0.0,
+    }
+
+    def batches() -> Iterable[list[Model]]:
+        while chunk := list(itertools.islice(records, batch)):
+            for record in chunk:
+                if not isinstance(record, Model):
+                    raise TypeError(
+                        "The 'records' argument must only reference Model instances!"
+                    )
+
+            yield chunk
+
+    def pickled(chunk: list[Model]) -> bytes:
+        buffer = io.BytesIO()
+
+        _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(chunk)
+
+        return buffer.getvalue()
+
+    def write(handle: io.BufferedIOBase, encoded: tuple[int, int, bytes]) -> None:
+        count, length, block = encoded
+
+        handle.write(block)
+
+        statistics["records"] += count
+        statistics["bytes"] += length
+        statistics["written"] += len(block)
+
+    started: float = time.perf_counter()
+
+    # The file is written alongside its final path, and only replaces any existing file
+    # once the export completes, so that a failed export does not leave a partial file
+    temporary: str = "%s.%d.tmp" % (path, os.getpid())
+
+    try:
+        with instrumentation.span("export", format="jsonl"):
+            with open(temporary, "wb") as handle:
+                if workers == 1:
+                    for chunk in batches():
+                        write(handle, _encode(chunk, compact_iris, sorting, level))
+                else:
+                    # Index the model classes before the worker processes are forked
+                    _classes = _index()
+
+                    with concurrent.futures.ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("fork"),
+                    ) as executor:
+                        pending: collections.deque[concurrent.futures.Future] = (
+                            collections.deque()
+                        )
+
+                        # Keep a bounded number of batches in flight, writing the oldest
+                        # batch once it completes, so that the records' order is kept
+                        for chunk in batches():
+                            pending.append(
+                                executor.submit(
+                                    _encode,
+                                    pickled(chunk),
+                                    compact_iris,
+                                    sorting,
+                                    level,
+                                )
+                            )
+
+                            if len(pending) >= workers * 2:
+                                write(handle, pending.popleft().result())
+
+                        while pending:
+                            write(handle, pending.popleft().result())
+
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+        raise
+    finally:
+        _classes = {}
+
+    if instrumentation.enabled:
+        instrumentation.count("bytes", statistics["written"])
+
+    statistics["seconds"] = seconds = time.perf_counter() - started
+
+    if seconds > 0:
+        statistics["records_per_second"] = statistics["records"] / seconds
+        statistics["bytes_per_second"] = statistics["bytes"] / seconds
+
+    logger.debug("export.jsonl(path: %s) => %s", path, statistics)
+
+    return statistics
+
+
+__all__ = [
+    "jsonl",
+]
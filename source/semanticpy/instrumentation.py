@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import contextlib
+import time
+
+from semanticpy.logging import logger
+
+logger = logger.getChild(__name__)
+
+
+class Instrumentation(object):
+    """The Instrumentation class tracks counters and timings for the library's operations,
+    such as assignments, validations, type lookups, entity creations, serialized nodes and
+    bytes written, and optionally forwards timed spans to a tracing hook; while disabled,
+    which is the default, the instrumented code paths only check the 'enabled' flag."""
+
+    # The counters that are tracked, in the order that they are reported
+    counters: tuple[str] = (
+        "assignments",
+        "validations",
+        "lookups",
+        "creations",
+        "serializations",
+        "bytes",
+    )
+
+    # The no-op context manager returned by span() while the instrumentation is disabled
+    _disabled: contextlib.nullcontext = contextlib.nullcontext()
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.hook: callable = None
+        self._counters: dict[str, int] = dict.fromkeys(self.counters, 0)
+        self._timings: dict[str, dict[str, int | float]] = {}
+
+    def __repr__(self) -> str:
+        return "<%s(enabled: %s, hook: %s)>" % (
+            self.__class__.__name__,
+            self.enabled,
+            self.hook,
+        )
+
+    def configure(self, enabled: bool = True, hook: callable = None) -> None:
+        """Enable or disable the instrumentation, and set or clear the tracing hook."""
+
+        if not isinstance(enabled, bool):
+            raise TypeError("The 'enabled' argument must have a boolean value!")
+
+        if not (hook is None or callable(hook)):
+            raise TypeError("The 'hook' argument, if specified, must be a callable!")
+
+        self.enabled = enabled
+        self.hook = hook
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increment the named counter by the specified value."""
+
+        self._counters[name] += value
+
+    def span(self, name: str, **attributes) -> contextlib.AbstractContextManager:
+        """Time the operation performed within the block, recording it under its name;
+        if a tracing hook has been set, the hook is called with the span's name and its
+        attributes, and must return a context manager which is entered for the block,
+        such as an OpenTelemetry tracer's start_as_current_span() method does; while the
+        instrumentation is disabled, a shared no-op context manager is returned."""
+
+        if self.enabled is False:
+            return self._disabled
+
+        return self._span(name, attributes)
+
+    @contextlib.contextmanager
+    def _span(self, name: str, attributes: dict[str, object]):
+        started: float = time.perf_counter()
+
+        try:
+            if self.hook is None:
+                yield
+            else:
+                with self.hook(name, attributes=attributes):
+                    yield
+        finally:
+            timing = self._timings.setdefault(name, {"calls": 0, "seconds": 0.0})
+            timing["calls"] += 1
+            timing["seconds"] += time.perf_counter() - started
+
+    def stats(self, reset: bool = False) -> dict[str, dict]:
+        """Return a copy of the counters and timings, optionally resetting them."""
+
+        stats: dict[str, dict] = {
+            "counters": dict(self._counters),
+            "timings": {name: dict(timing) for name, timing in self._timings.items()},
+        }
+
+        if reset is True:
+            self.reset()
+
+        return stats
+
+    def reset(self) -> None:
+        """Reset the counters and timings."""
+
+        self._counters = dict.fromkeys(self.counters, 0)
+        self._timings = {}
+
+
+# The library's instrumentation, shared by all models
+instrumentation: Instrumentation = Instrumentation()
+
+
+def instrument(enabled: bool = True, hook: callable = None) -> None:
+    """Enable or disable the library's instrumentation, optionally setting the hook that
+    timed spans are forwarded to, such as an OpenTelemetry tracer's
+    start_as_current_span() method."""
+
+    instrumentation.configure(enabled=enabled, hook=hook)
+
+
+def stats(reset: bool = False) -> dict[str, dict]:
+    """Return the library's operation counters and timings, optionally resetting them,
+    such as after handling each request."""
+
+    return instrumentation.stats(reset=reset)
+
+
+__all__ = [
+    "Instrumentation",
+    "instrumentation",
+    "instrument",
+    "stats",
+]
@@ -1,12 +1,18 @@
 from semanticpy.types.attributed import Attributed
 from semanticpy.types.dictionary import readonlydict
 from semanticpy.types.namespace import Namespace
+from semanticpy.types.placeholder import Placeholder
+from semanticpy.types.propertyspec import PropertySpec
+from semanticpy.types.violation import Violation
 from semanticpy.types.node import Node, Nodes
 
 __all__ = [
     "Attributed",
     "readonlydict",
     "Namespace",
+    "Placeholder",
+    "PropertySpec",
+    "Violation",
     "Node",
     "Nodes",
 ]
@@ -1,8 +1,25 @@
 from semanticpy.logging import logger
 from semanticpy.types.attributed import Attributed
+from semanticpy.types.placeholder import Placeholder
 
 logger = logger.getChild(__name__)
 
 
 class Namespace(Attributed):
-    pass
+    """Namespace data type class which materializes any lazily materialized entries
+    held as placeholders when they are accessed by attribute, by key or via get()"""
+
+    def __getattr__(self, key: str) -> object:
+        if isinstance(value := super().__getattr__(key), Placeholder):
+            value = value.resolve()
+
+        return value
+
+    def get(self, key: object, default: object = None, resolve: bool = True) -> object:
+        """Return the named entry, or the default, where any placeholder entries will be
+        materialized unless the 'resolve' argument has been set to False."""
+
+        if resolve is True:
+            return super().get(key, default)
+
+        return self._items.get(key, default)
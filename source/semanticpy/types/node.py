@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import io
+import itertools
 import json
+import weakref
+
+from typing import Iterable
 
 from semanticpy.logging import logger
-from semanticpy.enumerations import OverwriteMode, AppendingMode
+from semanticpy.enumerations import OverwriteMode, AppendingMode, ValidationMode
 from semanticpy.errors import SemanticPyError
+from semanticpy.codec import Codec, JSONCodec
+from semanticpy.instrumentation import instrumentation
 
 
 class Node(object):
@@ -31,6 +39,10 @@ class Node(object):
         "_multiple",
         "_sorting",
         "_annotations",
+        "_fingerprinted",
+        "_serialized",
+        "_generated",
+        "_parents",
     ]
     _aliases = {
         "ident": "id",
@@ -38,12 +50,28 @@ class Node(object):
     }
     _overwrite_mode: OverwriteMode = None
     _appending_mode: AppendingMode = None
+    _validation_mode: ValidationMode = None
+    _deferred: bool = False
+    _fingerprinted: str = None
+    _serialized: dict[str, object] = None
+    _generated: int = None
+    _parents: list[weakref.ref] = None
+    # The model's generation, which is incremented when changes to the model, such as
+    # registering prefixes or extending the model, affect how nodes are serialized, so
+    # that the caches of nodes noted under earlier generations are discarded; it is held
+    # in a list so that it is shared by the model's classes
+    _generation: list[int] = [0]
+    _plans: dict[type | tuple, tuple] = {}
+    _codec: Codec = None
+    _default_codec: Codec = JSONCodec()
 
     @classmethod
     def configure(
         cls,
         overwrite: OverwriteMode | str = None,
         appending: AppendingMode | str = None,
+        codec: Codec | str = None,
+        validation: ValidationMode | str = None,
     ):
         """Supports configuring the Node and its subclasses with runtime options."""
 
@@ -73,6 +101,42 @@ class Node(object):
                     "The 'appending' argument, if specified, must reference an AppendingMode enumeration option or the string name of the desired option!"
                 )
 
+        if codec is None:
+            pass
+        else:
+            if isinstance(codec, str):
+                codec = Codec.named(codec)
+
+            if isinstance(codec, Codec):
+                cls._codec = codec
+            else:
+                raise TypeError(
+                    "The 'codec' argument, if specified, must reference a Codec instance or the string name of the desired codec!"
+                )
+
+        if validation is None:
+            pass
+        else:
+            if isinstance(validation, str):
+                validation = ValidationMode.reconcile(name=validation, caselessly=True)
+
+            if isinstance(validation, ValidationMode):
+                cls._validation_mode = validation
+
+                # Note the mode as a flag, as assignments check it, and accessing the
+                # enumeration's options is comparatively slow
+                cls._deferred = validation is ValidationMode.Deferred
+            else:
+                raise TypeError(
+                    "The 'validation' argument, if specified, must reference a ValidationMode enumeration option or the string name of the desired option!"
+                )
+
+    @classmethod
+    def _json(cls) -> Codec:
+        """Return the codec configured for the class, or the default codec."""
+
+        return cls._codec or cls._default_codec
+
     def __init__(self, data: dict[str, object] = None, **kwargs):
         # logger.debug("%s.__init__(data: %s)" % (self.__class__.__name__, data))
 
@@ -99,8 +163,6 @@ class Node(object):
         if not self._sorting:
             self._sorting = self._settings.get("properties", {}).get("sorting") or {}
 
-        self._annotations = {}
-
         for key, value in kwargs.items():
             self._data[key] = value
 
@@ -116,14 +178,25 @@ class Node(object):
     def __getattr__(self, name: str) -> object | None:
         value: object = None
 
+        # Special attributes only reach here if they have not been assigned on the node,
+        # so default to None without materializing the instance's attribute dictionary
         if isinstance(name, str) and name.startswith("_") and name in self._special:
-            if name in self.__dict__:
-                value = self.__dict__[name]
-        else:
-            if name in self._data:
-                value = self._data[name]
-            elif name in self._multiple:
-                self._data[name] = value = Nodes()
+            pass
+        elif name in self._data:
+            value = self._data[name]
+        elif name in self._multiple:
+            self._data[name] = value = Nodes()
+
+            # Adding the empty list changes the node's serialization, and the list may now
+            # be modified directly, so note the node as its owner
+            if not (
+                self._parents is None
+                and self._fingerprinted is None
+                and self._serialized is None
+            ):
+                self._invalidate()
+
+                value._own(self)
 
         # logger.debug("%s.__getattr__(name: %s) called => %s" % (self.__class__.__name__, name, value))
 
@@ -131,22 +204,49 @@ class Node(object):
 
     def __setattr__(self, name: str, value: object):
         logger.debug(
-            "%s.__setattr__(name: %s, value: %s)"
-            % (self.__class__.__name__, name, value)
+            "%s.__setattr__(name: %s, value: %s)",
+            self.__class__.__name__,
+            name,
+            value,
         )
 
         if name.startswith("_") and name in self._special:
             return super().__setattr__(name, value)
 
+        self._assign(name, value, name in self._multiple)
+
+    def _assign(self, name: str, value: object, multiple: bool):
+        """Store the value for the named property, appending it to the property's list
+        of values if the property supports multiple values, or assigning it otherwise,
+        subject to the configured appending and overwrite modes."""
+
+        if instrumentation.enabled:
+            instrumentation.count("assignments")
+
+        if not (
+            self._parents is None
+            and self._fingerprinted is None
+            and self._serialized is None
+        ):
+            self._invalidate()
+
         if name in self._data:
-            if name in self._multiple:
-                if self.__class__._appending_mode is AppendingMode.Unique:
-                    if not value in self._data[name]:
+            if multiple is True:
+                if self.__class__._appending_mode is None:
+                    self._data[name].append(value)
+                elif self.__class__._appending_mode is AppendingMode.Unique:
+                    if isinstance(value, Node) and isinstance(self._data[name], Nodes):
+                        if not self._data[name]._includes(value, owner=self):
+                            self._data[name].append(value)
+                    elif not value in self._data[name]:
                         self._data[name].append(value)
                 else:
                     self._data[name].append(value)
             else:
-                if self.__class__._overwrite_mode is OverwriteMode.Warning:
+                # The default mode, where no mode has been configured, allows overwrites
+                if self.__class__._overwrite_mode is None:
+                    self._data[name] = value
+                elif self.__class__._overwrite_mode is OverwriteMode.Warning:
                     logger.warning(
                         f"The '{self.__class__.__name__}' entity's '{name}' property has already been assigned to '{self._data[name]}', and will be overwritten with the newly provided value: '{value}'!"
                     )
@@ -165,17 +265,22 @@ class Node(object):
                 else:
                     self._data[name] = value
         else:
-            if name in self._multiple:
+            if multiple is True:
                 self._data[name] = Nodes([value])
             else:
                 self._data[name] = value
 
     def __delattr__(self, name: str):
-        logger.debug(
-            "%s.__delattr__(name: %s) called" % (self.__class__.__name__, name)
-        )
+        logger.debug("%s.__delattr__(name: %s) called", self.__class__.__name__, name)
 
         if name in self._data:
+            if not (
+                self._parents is None
+                and self._fingerprinted is None
+                and self._serialized is None
+            ):
+                self._invalidate()
+
             del self._data[name]
 
     def __getitem__(self, name: str) -> object | None:
@@ -185,52 +290,314 @@ class Node(object):
         return self.__setattr__(name, value)
 
     def equals(self, other: Node, strict: bool = False) -> bool:
-        """Support comparing Node instances for equality."""
+        """Support comparing Node instances for equality, by comparing their properties as
+        they would be serialized, under their canonical names, with aliased names such as
+        'ident' and 'label' resolved, and prefixed identifiers expanded; in strict mode,
+        both nodes must hold the same properties, otherwise only the properties held by
+        both nodes are compared, of which there must be at least one. Nested nodes are
+        compared recursively, and must hold the same properties as each other."""
 
         if not isinstance(other, Node):
             return NotImplemented
 
-        equal: bool = False
+        if other is self:
+            return True
 
-        sproperties = self.properties()
-        oproperties = other.properties()
+        if strict is True and not (
+            (fingerprint := self._cached("_fingerprinted")) is None
+            or (another := other._cached("_fingerprinted")) is None
+        ):
+            if not fingerprint == another:
+                return False
 
-        for name, value in oproperties.items():
-            if name in sproperties:
-                if sproperties[name] == value:
-                    equal = True
-                else:
-                    equal = False
-                    break
-            elif name in self._aliases and self._aliases[name] in sproperties:
-                if sproperties[self._aliases[name]] == value:
-                    equal = True
-                else:
-                    equal = False
-                    break
-            elif strict is True:
-                equal = False
-                break
-
-        if equal is True and strict is True:
-            for name, value in sproperties.items():
-                if name in oproperties:
-                    if oproperties[name] == value:
-                        equal = True
-                    else:
-                        equal = False
-                        break
-                elif name in self._aliases and self._aliases[name] in oproperties:
-                    if oproperties[self._aliases[name]] == value:
-                        equal = True
-                    else:
-                        equal = False
-                        break
-                elif strict is True:
-                    equal = False
-                    break
+        sproperties: dict[str, object] = self._comparable()
+        oproperties: dict[str, object] = other._comparable()
+
+        if strict is True:
+            if not sproperties.keys() == oproperties.keys():
+                return False
+
+            names = list(sproperties)
+        else:
+            names = [name for name in oproperties if name in sproperties]
+
+        if len(names) == 0:
+            return False
+
+        if "type" in names and not sproperties["type"] == oproperties["type"]:
+            return False
+
+        # Note the pairs of nodes being compared, so that cyclic references back to them
+        # are considered equal, rather than being compared again without end
+        compared: set[tuple[int, int]] = {(id(self), id(other))}
+
+        for name in names:
+            if not self._equivalent(sproperties[name], oproperties[name], compared):
+                return False
+
+        return True
+
+    def _comparable(self) -> dict[str, object]:
+        """Return the node's properties as they would be serialized, for comparison."""
+
+        return dict(self._canonical_items())
+
+    def _equivalent(
+        self,
+        value: object,
+        other: object,
+        compared: set[tuple[int, int]],
+    ) -> bool:
+        """Determine if two property values are equal as they would be serialized."""
+
+        if value is other:
+            return True
+
+        if isinstance(value, Node) and isinstance(other, Node):
+            if (id(value), id(other)) in compared:
+                return True
+
+            if not (
+                (fingerprint := value._cached("_fingerprinted")) is None
+                or (another := other._cached("_fingerprinted")) is None
+            ):
+                if not fingerprint == another:
+                    return False
+
+            compared.add((id(value), id(other)))
+
+            vproperties: dict[str, object] = value._comparable()
+            oproperties: dict[str, object] = other._comparable()
+
+            if not vproperties.keys() == oproperties.keys():
+                return False
+
+            if not vproperties.get("type") == oproperties.get("type"):
+                return False
+
+            for name, item in vproperties.items():
+                if not value._equivalent(item, oproperties[name], compared):
+                    return False
+
+            return True
+        elif isinstance(value, Node) or isinstance(other, Node):
+            return self._serialize(value) == self._serialize(other)
+        elif isinstance(value, dict) and isinstance(other, dict):
+            value = {
+                self._canonicalize(key): item
+                for key, item in value.items()
+                if not item is None
+            }
+
+            other = {
+                self._canonicalize(key): item
+                for key, item in other.items()
+                if not item is None
+            }
+
+            if not value.keys() == other.keys():
+                return False
 
-        return equal
+            for key, item in value.items():
+                if not self._equivalent(item, other[key], compared):
+                    return False
+
+            return True
+        elif isinstance(value, list) and isinstance(other, list):
+            value = [item for item in value if not item is None]
+            other = [item for item in other if not item is None]
+
+            if not len(value) == len(other):
+                return False
+
+            for item, another in zip(value, other):
+                if not self._equivalent(item, another, compared):
+                    return False
+
+            return True
+
+        return value == other
+
+    def fingerprint(self) -> str:
+        """Return a stable digest of the content of the node and of the nodes nested within
+        it, calculated over the node's canonicalized data, in which each nested node is
+        represented by its own fingerprint; nodes that are equal, as determined by
+        equals(strict=True), share the same fingerprint. Fingerprints are cached on each
+        node, and are discarded when properties are assigned to or deleted from the node
+        or from any of the nodes nested within it, or when its lists of nodes are
+        modified, and for all nodes when prefixes are registered or the model is
+        extended."""
+
+        return self._digest([])[0]
+
+    def _digest(self, stack: list[Node]) -> tuple[str, int]:
+        """Calculate the node's fingerprint, returning it along with the depth of the
+        shallowest node on the stack of the nodes being fingerprinted that the node or
+        its nested nodes refer back to, which is the node's own depth if none do."""
+
+        if not (fingerprint := self._cached("_fingerprinted")) is None:
+            return (fingerprint, len(stack))
+
+        depth: int = len(stack)
+
+        shallowest: int = depth
+
+        stack.append(self)
+
+        def _canonicalize(value: object) -> object:
+            nonlocal shallowest
+
+            if isinstance(value, Node):
+                # Note the node as a parent of the nested node, so that modifications to
+                # the nested node discard the fingerprints of the nodes it is nested in
+                value._link(self)
+
+                # Refer to any node that is still being fingerprinted, as found in cyclic
+                # graphs, by its position on the stack relative to the current node
+                for position, node in enumerate(stack):
+                    if node is value:
+                        shallowest = min(shallowest, position)
+
+                        return {"@cycle": depth - position}
+
+                digest, reached = value._digest(stack)
+
+                shallowest = min(shallowest, reached)
+
+                return {"@fingerprint": digest}
+            elif isinstance(value, dict):
+                return {
+                    self._canonicalize(key): _canonicalize(item)
+                    for key, item in value.items()
+                    if not item is None
+                }
+            elif isinstance(value, list):
+                if isinstance(value, Nodes):
+                    value._own(self)
+
+                return [_canonicalize(item) for item in value if not item is None]
+
+            return value
+
+        data: dict[str, object] = {
+            key: _canonicalize(value) for key, value in self._canonical_items()
+        }
+
+        stack.pop()
+
+        fingerprint = hashlib.blake2b(
+            json.dumps(
+                data,
+                sort_keys=True,
+                ensure_ascii=False,
+                default=str,
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+        # The fingerprint of a node whose nested nodes refer back to nodes above it, which
+        # are still being fingerprinted, depends on the node that fingerprinting started
+        # from, so is only cached for nodes which are not part of such a cycle
+        if shallowest >= depth:
+            self._cache("_fingerprinted", fingerprint)
+
+        return (fingerprint, shallowest)
+
+    def _canonical_items(self) -> list[tuple[str, object]]:
+        """Return the node's properties as they would be serialized, under their canonical
+        names, with any aliased names resolved, omitting any unassigned properties, for
+        fingerprinting and comparison."""
+
+        return [
+            (self._canonicalize(self._aliases.get(key, key)), value)
+            for key, value in self._data.items()
+            if not value is None
+        ]
+
+    def _link(self, parent: Node) -> None:
+        """Note the parent node that the node is nested within, via a weak reference."""
+
+        if self._parents is None:
+            object.__setattr__(self, "_parents", [])
+
+        for reference in self._parents:
+            if reference() is parent:
+                return
+
+        self._parents.append(weakref.ref(parent))
+
+    def _invalidate(self) -> None:
+        """Discard the cached fingerprint and serialization of the node, and those of the
+        nodes that it is nested within, along with the fingerprint indexes of their lists
+        of nodes, as these may hold the node, or nodes which it is nested within."""
+
+        invalidated: set[int] = set()
+
+        pending: list[Node] = [self]
+
+        while pending:
+            if id(node := pending.pop()) in invalidated:
+                continue
+
+            invalidated.add(id(node))
+
+            if not node._fingerprinted is None:
+                object.__setattr__(node, "_fingerprinted", None)
+
+            if not node._serialized is None:
+                object.__setattr__(node, "_serialized", None)
+
+            # The node's own lists only change through assignments that keep the index up
+            # to date, but the lists of its parents may hold the now modified node
+            if not node is self:
+                for value in node._data.values():
+                    if isinstance(value, Nodes):
+                        value._unindex()
+
+            for reference in node._parents or []:
+                if not (parent := reference()) is None:
+                    pending.append(parent)
+
+    def _cached(self, name: str) -> object | None:
+        """Return the node's named cache, being its cached fingerprint or serialization, if
+        it was cached under the model's current generation, otherwise discarding the
+        node's caches, which were cached under an earlier generation of the model."""
+
+        if (value := getattr(self, name)) is None:
+            return None
+
+        if self._generated == self._generation[0]:
+            return value
+
+        object.__setattr__(self, "_fingerprinted", None)
+        object.__setattr__(self, "_serialized", None)
+
+        return None
+
+    def _cache(self, name: str, value: object) -> None:
+        """Cache the value as the node's named cache, noting the model's generation, and
+        discarding any caches noted under an earlier generation of the model."""
+
+        if not self._generated == (generation := self._generation[0]):
+            object.__setattr__(self, "_fingerprinted", None)
+            object.__setattr__(self, "_serialized", None)
+            object.__setattr__(self, "_generated", generation)
+
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict:
+        """Support copying and pickling nodes, omitting the node's cached fingerprint and
+        serialization, and the references to its parent nodes, which do not apply to
+        copies of the node."""
+
+        state: dict[str, object] = self.__dict__.copy()
+
+        state.pop("_fingerprinted", None)
+        state.pop("_serialized", None)
+        state.pop("_generated", None)
+        state.pop("_parents", None)
+
+        return state
 
     @property
     def type(self) -> str:
@@ -257,6 +624,8 @@ class Node(object):
         if not isinstance(data, dict):
             raise TypeError("The data must be defined as a dictionary!")
 
+        self._invalidate()
+
         self._data = data
 
     @property
@@ -291,7 +660,11 @@ class Node(object):
         for name, value in kwargs.items():
             annotations[name] = value
 
-        self._annotations.update(annotations)
+        # The annotations dictionary is only allocated once the node is first annotated
+        if self._annotations is None:
+            self._annotations = annotations
+        else:
+            self._annotations.update(annotations)
 
         return self
 
@@ -303,7 +676,7 @@ class Node(object):
         elif not len(name := name.strip()) > 0:
             raise ValueError("The 'name' argument must have a non-empty string value!")
 
-        if name in self._annotations:
+        if self._annotations and name in self._annotations:
             return self._annotations[name]
 
         return default
@@ -311,7 +684,7 @@ class Node(object):
     def annotations(self) -> dict[str, object]:
         """Support retrieving a copy of all named annotations associated with the node"""
 
-        return dict(self._annotations)
+        return dict(self._annotations or {})
 
     def _canonicalize(self, name: str) -> str:
         """Given a property name, return the canonical version of the property name."""
@@ -332,10 +705,69 @@ class Node(object):
         else:
             return name
 
+    def _plan(
+        self, sorting: list[str] | dict[str, int] = None
+    ) -> tuple[dict[str, str], dict[str, int], frozenset[str], frozenset[str]]:
+        """Return the serialization plan for the node's class, comprising the canonical
+        output names of its properties, which are noted as they are first serialized, the
+        sort positions of the canonical names, the names of the properties which are
+        hidden, and the names of the properties holding identifiers which may need their
+        prefixes expanding; plans are compiled once for each class, and once for each
+        class and custom sorting, as these only differ in their sort positions."""
+
+        if (plan := self._plans.get(self.__class__)) is None:
+            plan = self._plans[self.__class__] = self._serialization()
+
+        if sorting is None:
+            return plan
+
+        if isinstance(sorting, list):
+            key = (self.__class__, list, tuple(sorting))
+        elif isinstance(sorting, dict):
+            key = (self.__class__, dict, tuple(sorting.items()))
+        else:
+            raise TypeError(
+                "The `sorting` parameter must be provided as a list or dictionary!"
+            )
+
+        if (custom := self._plans.get(key)) is None:
+            custom = self._plans[key] = (
+                plan[0],
+                self._positions(sorting),
+                plan[2],
+                plan[3],
+            )
+
+        return custom
+
+    def _serialization(
+        self,
+    ) -> tuple[dict[str, str], dict[str, int], frozenset[str], frozenset[str]]:
+        """Compile the serialization plan for the node's class, as returned by _plan()."""
+
+        return ({}, self._positions(self._sorting), frozenset(), frozenset())
+
+    def _positions(self, sorting: list[str] | dict[str, int]) -> dict[str, int]:
+        """Return the sort positions of the canonical property names for the sorting."""
+
+        if isinstance(sorting, list):
+            keys = {key: index for (index, key) in enumerate(sorting, start=0)}
+        elif isinstance(sorting, dict):
+            keys = sorting
+        else:
+            raise TypeError(
+                "The `sorting` parameter must be provided as a list or dictionary!"
+            )
+
+        return {self._canonicalize(key): index for key, index in keys.items()}
+
     def _serialize(
         self,
         source: object = None,
         sorting: list[str] | dict[str, int] = None,
+        nested: bool = True,
+        cached: bool = False,
+        compact_iris: bool = False,
     ) -> object:
         data: object = None
 
@@ -343,22 +775,67 @@ class Node(object):
             source = self
 
         if isinstance(source, Node):
-            data = source._serialize(source.data, sorting=sorting)
+            # Leave nested nodes in place if requested, for streaming encoders to serialize
+            # as they are reached
+            if nested is False:
+                return source
+
+            # Reuse the node's cached serialization if requested, noting the node that it
+            # is nested within, so that modifications to the node discard both caches
+            if cached is True:
+                if not source is self:
+                    source._link(self)
+
+                if not (data := source._cached("_serialized")) is None:
+                    return data
 
-            if isinstance(data, dict):
-                data = source._sort(data, sorting=sorting)
+            if instrumentation.enabled:
+                instrumentation.count("serializations")
+
+            data = source._serialize(
+                source._data,
+                sorting=sorting,
+                cached=cached,
+                compact_iris=compact_iris,
+            )
+
+            if cached is True:
+                source._cache("_serialized", data)
         elif isinstance(source, dict):
-            data = {}
+            names, positions, hidden, identifiers = self._plan(sorting)
 
-            for key in source:
-                value = source[key]
+            data = {}
 
+            for key, value in source.items():
                 if value is None:
                     continue
 
-                data[self._canonicalize(key)] = self._serialize(value, sorting=sorting)
+                if (name := names.get(key)) is None:
+                    name = names[key] = self._canonicalize(key)
+
+                if name in hidden:
+                    continue
 
-            data = self._sort(data, sorting=sorting) if data else data
+                if key in identifiers:
+                    if compact_iris is True:
+                        value = self._compact(value)
+                    else:
+                        value = self._expand(value)
+                elif cached is True and isinstance(value, Nodes):
+                    value._own(self)
+
+                data[name] = self._serialize(
+                    value,
+                    sorting=sorting,
+                    nested=nested,
+                    cached=cached,
+                    compact_iris=compact_iris,
+                )
+
+            if len(data) > 1:
+                data = dict(
+                    sorted(data.items(), key=lambda item: positions.get(item[0], -1))
+                )
         elif isinstance(source, list):
             data = []
 
@@ -366,7 +843,15 @@ class Node(object):
                 if value is None:
                     continue
 
-                data.append(self._serialize(value, sorting=sorting))
+                data.append(
+                    self._serialize(
+                        value,
+                        sorting=sorting,
+                        nested=nested,
+                        cached=cached,
+                        compact_iris=compact_iris,
+                    )
+                )
         else:
             data = source
 
@@ -377,23 +862,13 @@ class Node(object):
         dictionary: dict,
         sorting: list[str] | dict[str, int] = None,
     ) -> dict[str, object]:
-        if sorting is None:
-            sorting = self._sorting
-
-        if isinstance(sorting, list):
-            keys = {key: index for (index, key) in enumerate(sorting, start=0)}
-        elif isinstance(sorting, dict):
-            keys = sorting
-        else:
-            raise TypeError(
-                "The `sorting` parameter must be provided as a list or dictionary!"
-            )
-
-        keys = {self._canonicalize(key): index for key, index in keys.items()}
+        positions: dict[str, int] = self._plan(sorting)[1]
 
         sort: dict[str, object] = {}
 
-        for key, value in sorted(dictionary.items(), key=lambda x: keys.get(x[0], -1)):
+        for key, value in sorted(
+            dictionary.items(), key=lambda x: positions.get(x[0], -1)
+        ):
             sort[key] = value
 
         return sort
@@ -406,10 +881,44 @@ class Node(object):
         callback: callable = None,
         attribute: str = None,
         unpack: bool = False,
+        nested: bool = True,
+        cached: bool = False,
+        compact_iris: bool = False,
     ) -> dict[str, object]:
+        """Return a dictionary representation of the node's properties; if the 'cached'
+        argument is set to True, the serializations of the node and its nested nodes are
+        cached on the nodes and reused until they are modified, so the returned values
+        are shared, and must not be modified; caching only applies to serializations in
+        the default sort order, without a callback, as callbacks modify the values, and
+        with full IRIs; if the 'compact_iris' argument is set to True, IRIs starting with
+        the URI of a registered prefix are compacted into prefixed IRIs."""
+
+        if not isinstance(compact_iris, bool):
+            raise TypeError("The 'compact_iris' argument must have a boolean value!")
+
         properties: dict[str, object] = {}
 
-        if isinstance(serialized := self._serialize(self.data, sorting=sorting), dict):
+        if (
+            cached is True
+            and sorting is None
+            and nested is True
+            and callback is None
+            and compact_iris is False
+        ):
+            serialized = self._serialize(self, cached=True)
+        else:
+            # Count the node, as its nested nodes are counted as they are serialized
+            if instrumentation.enabled:
+                instrumentation.count("serializations")
+
+            serialized = self._serialize(
+                self._data,
+                sorting=sorting,
+                nested=nested,
+                compact_iris=compact_iris,
+            )
+
+        if isinstance(serialized, dict):
             properties = serialized
 
             if prepend is None:
@@ -507,28 +1016,156 @@ class Node(object):
         sorting: list[str] | dict[str, int] = None,
         callback: callable = None,
         attribute: str = None,
+        compact_iris: bool = False,
     ) -> str:
         logger.debug(
-            "%s.json(compact: %s, indent: %d, sorting: %s, callback: %s, attribute: %s)"
-            % (self.__class__.__name__, compact, indent, sorting, callback, attribute)
+            "%s.json(compact: %s, indent: %s, sorting: %s, callback: %s, attribute: %s, compact_iris: %s)",
+            self.__class__.__name__,
+            compact,
+            indent,
+            sorting,
+            callback,
+            attribute,
+            compact_iris,
         )
 
         if compact is True:
             indent = None
 
-        properties = (
-            self.properties(
-                sorting=sorting,
-                callback=callback,
-                attribute=attribute,
+        with instrumentation.span("json", type=self.__class__.__name__):
+            properties = (
+                self.properties(
+                    sorting=sorting,
+                    callback=callback,
+                    attribute=attribute,
+                    cached=True,
+                    compact_iris=compact_iris,
+                )
+                or {}
             )
-            or {}
-        )
 
-        return json.dumps(
-            properties, indent=indent, ensure_ascii=False, sort_keys=False
+            return self._json().dumps(properties, indent=indent)
+
+    def dump(
+        self,
+        handle: object,
+        compact: bool = False,
+        indent: int = 4,
+        sorting: list[str] | dict[str, int] = None,
+        callback: callable = None,
+        attribute: str = None,
+        compact_iris: bool = False,
+    ) -> None:
+        """Write the JSON representation of the node, as generated by json(), to the
+        file-like handle, which may be opened in text or binary mode; with a streaming
+        codec, such as the default, nested nodes are serialized as the encoder reaches
+        them and the encoded chunks are written as they are produced, rather than first
+        assembling the node's serialized properties and the JSON string in memory."""
+
+        logger.debug(
+            "%s.dump(handle: %s, compact: %s, indent: %s, sorting: %s, callback: %s, attribute: %s, compact_iris: %s)",
+            self.__class__.__name__,
+            handle,
+            compact,
+            indent,
+            sorting,
+            callback,
+            attribute,
+            compact_iris,
         )
 
+        if not callable(getattr(handle, "write", None)):
+            raise TypeError(
+                "The 'handle' argument must reference a file-like object with a write() method!"
+            )
+
+        if compact is True:
+            indent = None
+
+        binary: bool = isinstance(handle, (io.RawIOBase, io.BufferedIOBase))
+
+        codec: Codec = self._json()
+
+        def default(value: object) -> object:
+            if isinstance(value, Node):
+                # Reuse the node's cached serialization, if any, but do not populate the
+                # cache, as this would hold the serialized document in memory
+                if sorting is None and compact_iris is False:
+                    if not (serialized := value._cached("_serialized")) is None:
+                        return serialized
+
+                if instrumentation.enabled:
+                    instrumentation.count("serializations")
+
+                return value._serialize(
+                    value._data,
+                    sorting=sorting,
+                    nested=False,
+                    compact_iris=compact_iris,
+                )
+
+            return codec.default(value)
+
+        with instrumentation.span("dump", type=self.__class__.__name__):
+            # The callback is applied to the fully serialized properties, so these must be
+            # assembled first, as they must be for codecs that do not support streaming
+            if codec.streaming is True and not callable(callback):
+                chunks = codec.iterencode(
+                    self.properties(
+                        sorting=sorting,
+                        nested=compact_iris is False
+                        and not self._cached("_serialized") is None,
+                        cached=True,
+                        compact_iris=compact_iris,
+                    )
+                    or {},
+                    indent=indent,
+                    default=default,
+                )
+            else:
+                chunks = [
+                    codec.dumps(
+                        self.properties(
+                            sorting=sorting,
+                            callback=callback,
+                            attribute=attribute,
+                            compact_iris=compact_iris,
+                        )
+                        or {},
+                        indent=indent,
+                    )
+                ]
+
+            # Gather the encoder's many small chunks, writing them in larger blocks
+            buffer: list[str] = []
+            buffered: int = 0
+
+            for chunk in itertools.chain(chunks, [None]):
+                if not chunk is None:
+                    buffer.append(chunk)
+                    buffered += len(chunk)
+
+                    if buffered < 65536:
+                        continue
+                elif not buffer:
+                    break
+
+                block: str | bytes = "".join(buffer)
+
+                if binary is True or instrumentation.enabled:
+                    encoded: bytes = block.encode("utf-8")
+
+                    if instrumentation.enabled:
+                        instrumentation.count("bytes", len(encoded))
+
+                    if binary is True:
+                        block = encoded
+
+                handle.write(block)
+
+                buffer = []
+                buffered = 0
+
     def print(self):
         if properties := self.properties():
 
@@ -572,6 +1209,17 @@ class Node(object):
 class Nodes(list):
     """The Nodes class holds a list of Node entities and supports filtering."""
 
+    # The list only holds the index of its nodes' fingerprints, the model generation that
+    # the index was built under, and a reference to the node holding it, so needs no
+    # attribute dict
+    __slots__ = ("_fingerprints", "_indexed", "_generated", "_owner")
+
+    def __getstate__(self) -> None:
+        """Support copying and pickling lists of nodes, omitting the fingerprint index and
+        the reference to the node holding the list, which do not apply to copies."""
+
+        return None
+
     def __contains__(self, item: object, strict: bool = True) -> bool:
         """Determines if the list contains the specified item or not."""
 
@@ -585,6 +1233,124 @@ class Nodes(list):
         else:
             return super().__contains__(item)
 
+    def _includes(self, item: Node, owner: Node = None) -> bool:
+        """Determine if the list contains a node equal to the item, as __contains__ does,
+        via an index of the fingerprints of the list's nodes, so that only the item needs
+        to be fingerprinted, rather than compared against each node in turn; the index is
+        built on first use, extended with any nodes appended since, and discarded when
+        nodes are otherwise added, replaced or removed, or when any of its nodes are
+        modified, for which the node holding the list must be specified as the owner; as
+        fingerprints change when prefixes are registered or the model is extended, the
+        index is rebuilt once the model's generation has changed."""
+
+        generation: int = item._generation[0]
+
+        if (index := getattr(self, "_fingerprints", None)) is None or not (
+            getattr(self, "_generated", None) == generation
+        ):
+            index = self._fingerprints = {}
+            self._indexed = 0
+            self._generated = generation
+
+        if self._indexed < len(self):
+            for position in range(self._indexed, len(self)):
+                if isinstance(node := self[position], Node):
+                    index.setdefault(node.fingerprint(), []).append(node)
+
+                    if not owner is None:
+                        node._link(owner)
+
+            self._indexed = len(self)
+
+        for node in index.get(item.fingerprint(), []):
+            if node is item or node.equals(item, strict=True):
+                return True
+
+        return False
+
+    def _unindex(self) -> None:
+        """Discard the index of the list's node fingerprints, if any."""
+
+        self._fingerprints = None
+
+    def _own(self, owner: Node) -> None:
+        """Note the node holding the list, via a weak reference, so that modifying the
+        list discards the node's cached fingerprint and serialization."""
+
+        self._owner = weakref.ref(owner)
+
+    def _modified(self, unindex: bool = True) -> None:
+        """Discard the cached fingerprint and serialization of the node holding the list,
+        if known, and the list's fingerprint index, unless nodes are only being added to
+        the end of the list or reordered, which the index accounts for."""
+
+        if unindex is True:
+            self._unindex()
+
+        if not (owner := getattr(self, "_owner", None)) is None:
+            if not (node := owner()) is None:
+                node._invalidate()
+
+    def append(self, value: object):
+        self._modified(unindex=False)
+
+        return super().append(value)
+
+    def extend(self, values: Iterable[object]):
+        self._modified(unindex=False)
+
+        return super().extend(values)
+
+    def __iadd__(self, values: Iterable[object]) -> Nodes:
+        self._modified(unindex=False)
+
+        return super().__iadd__(values)
+
+    def __setitem__(self, index: int | slice, value: object):
+        self._modified()
+
+        return super().__setitem__(index, value)
+
+    def __delitem__(self, index: int | slice):
+        self._modified()
+
+        return super().__delitem__(index)
+
+    def __imul__(self, value: int) -> Nodes:
+        self._modified()
+
+        return super().__imul__(value)
+
+    def insert(self, index: int, value: object):
+        self._modified()
+
+        return super().insert(index, value)
+
+    def remove(self, value: object):
+        self._modified()
+
+        return super().remove(value)
+
+    def pop(self, index: int = -1) -> object:
+        self._modified()
+
+        return super().pop(index)
+
+    def clear(self):
+        self._modified()
+
+        return super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._modified(unindex=False)
+
+        return super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._modified(unindex=False)
+
+        return super().reverse()
+
     def unpack(self, property: str) -> Nodes[Node]:
         """Unpack a nested property into a new Nodes instance."""
 
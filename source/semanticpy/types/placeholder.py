@@ -0,0 +1,71 @@
+from semanticpy.logging import logger
+
+logger = logger.getChild(__name__)
+
+
+class Placeholder(object):
+    """Placeholder data type class which stands in for a lazily materialized class; the
+    class is materialized via the resolver the first time the placeholder is used"""
+
+    __slots__ = ("_key", "_name", "_type", "_resolver", "_resolved")
+
+    # Placeholders stand in for entities that do not have entity-assignable properties
+    _property = None
+
+    def __init__(
+        self,
+        key: str,
+        resolver: callable,
+        name: str = None,
+        typed: str = None,
+    ):
+        if not isinstance(key, str):
+            raise TypeError("The 'key' argument must have a string value!")
+
+        if not callable(resolver):
+            raise TypeError("The 'resolver' argument must reference a callable!")
+
+        self._key: str = key
+        self._name: str = name
+        self._type: str = typed
+        self._resolver: callable = resolver
+        self._resolved: type = None
+
+    def __repr__(self) -> str:
+        return f"<Placeholder({self._key})>"
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> object:
+        return self.resolve()(*args, **kwargs)
+
+    def __instancecheck__(self, instance: object) -> bool:
+        return isinstance(instance, self.resolve())
+
+    def __subclasscheck__(self, subclass: type) -> bool:
+        return issubclass(subclass, self.resolve())
+
+    def __mro_entries__(self, bases: tuple) -> tuple[type]:
+        return (self.resolve(),)
+
+    @property
+    def resolved(self) -> bool:
+        """Determine if the placeholder's class has been materialized or not."""
+
+        return self._resolved is not None
+
+    def resolve(self) -> type:
+        """Materialize the placeholder's class, if needed, returning the class."""
+
+        if self._resolved is None:
+            logger.debug("%r.resolve() materializing class", self)
+
+            if not isinstance(resolved := self._resolver(self._key), type):
+                raise TypeError(
+                    "The resolver for '%s' did not return a class!" % (self._key)
+                )
+
+            self._resolved = resolved
+
+        return self._resolved
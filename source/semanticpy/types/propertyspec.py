@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from semanticpy.logging import logger
+from collections.abc import Mapping
+from typing import Iterator
+
+logger = logger.getChild(__name__)
+
+
+class PropertySpec(Mapping):
+    """Immutable property specification data type class; specifications are interned so
+    that every entity class defining or inheriting an identical property specification
+    shares the same instance; specifications support read-only dictionary-style access
+    to those fields which have been assigned a value; the documentation fields, such as
+    'label' and 'scope_note', are retained alongside the fields used by the model."""
+
+    __slots__ = (
+        "accepted",
+        "individual",
+        "range",
+        "domain",
+        "sorting",
+        "hidden",
+        "canonical",
+        "namespace",
+        "alias",
+        "name",
+        "label",
+        "inverse",
+        "scope_note",
+        "subclasses",
+        "_key",
+        "_hash",
+    )
+
+    _fields: tuple[str] = __slots__[0:-2]
+
+    _interned: dict[tuple, PropertySpec] = {}
+
+    def __new__(
+        cls,
+        accepted: bool = True,
+        individual: bool = False,
+        range: str | list[str] | type = None,
+        domain: str = None,
+        sorting: int = 10000,
+        hidden: bool = None,
+        canonical: str = None,
+        namespace: str = None,
+        alias: str = None,
+        name: str = None,
+        label: str = None,
+        inverse: str = None,
+        scope_note: str = None,
+        subclasses: str | list[str] = None,
+    ) -> PropertySpec:
+        # Ranges may be specified as lists, which are held as tuples so that they can be
+        # hashed, and so that the specification cannot be modified after its creation
+        if isinstance(range, list):
+            range = tuple(range)
+
+        if isinstance(subclasses, list):
+            subclasses = tuple(subclasses)
+
+        key: tuple = (
+            accepted,
+            individual,
+            range,
+            domain,
+            sorting,
+            hidden,
+            canonical,
+            namespace,
+            alias,
+            name,
+            label,
+            inverse,
+            scope_note,
+            subclasses,
+        )
+
+        if (spec := cls._interned.get(key)) is None:
+            spec = super().__new__(cls)
+
+            for field, value in zip(cls._fields, key):
+                object.__setattr__(spec, field, value)
+
+            object.__setattr__(spec, "_key", key)
+            object.__setattr__(spec, "_hash", hash(key))
+
+            cls._interned[key] = spec
+
+        return spec
+
+    @classmethod
+    def create(cls, properties: dict[str, object]) -> PropertySpec:
+        """Create or obtain the interned specification for the provided dictionary; any
+        keys which are not specification fields are ignored."""
+
+        if isinstance(properties, PropertySpec):
+            return properties
+
+        if not isinstance(properties, dict):
+            raise TypeError("The 'properties' argument must have a dictionary value!")
+
+        return cls(
+            **{
+                field: value
+                for field, value in properties.items()
+                if field in cls._fields and value is not None
+            }
+        )
+
+    def __repr__(self) -> str:
+        return "<PropertySpec(%s)>" % (
+            ", ".join(["%s=%r" % (field, value) for field, value in self.items()])
+        )
+
+    def __setattr__(self, name: str, value: object):
+        raise RuntimeError(
+            "This property specification is read-only, cannot set '%s'!" % (name)
+        )
+
+    def __delattr__(self, name: str):
+        raise RuntimeError(
+            "This property specification is read-only, cannot delete '%s'!" % (name)
+        )
+
+    def __getitem__(self, name: str) -> object:
+        if name in self._fields and not (value := getattr(self, name)) is None:
+            return value
+
+        raise KeyError(name)
+
+    def get(self, name: str, default: object = None) -> object:
+        # Implemented directly, as the Mapping mixin's get() is comparatively slow
+        if name in self._fields and not (value := getattr(self, name)) is None:
+            return value
+
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self._fields:
+            if not getattr(self, field) is None:
+                yield field
+
+    def __bool__(self) -> bool:
+        # Specifications always hold at least the 'accepted' field, so are never empty
+        return True
+
+    def __len__(self) -> int:
+        return len([field for field in self])
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        elif isinstance(other, PropertySpec):
+            return self._key == other._key
+
+        return super().__eq__(other)
+
+    def __reduce__(self) -> tuple:
+        # Unpickled and copied specifications are interned just as any other would be
+        return (self.__class__, self._key)
+
+    def replace(self, **fields) -> PropertySpec:
+        """Obtain the interned specification with the specified field values replaced."""
+
+        for field in fields:
+            if not field in self._fields:
+                raise KeyError(
+                    "The '%s' field is not a property specification field!" % (field)
+                )
+
+        return self.__class__(
+            **{
+                **{field: getattr(self, field) for field in self._fields},
+                **fields,
+            }
+        )
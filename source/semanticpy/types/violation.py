@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from semanticpy.logging import logger
+from semanticpy.enumerations import ViolationType
+
+logger = logger.getChild(__name__)
+
+
+class Violation(object):
+    """Violation data type class which notes a property value that fails validation, the
+    type of the violation, and the path to the property from the validated entity, such
+    as 'identified_by[0].content'"""
+
+    __slots__ = ("_kind", "_path", "_entity", "_property", "_value", "_message")
+
+    def __init__(
+        self,
+        kind: ViolationType,
+        path: str,
+        entity: str,
+        property: str,
+        value: object,
+        message: str,
+    ):
+        if not isinstance(kind, ViolationType):
+            raise TypeError(
+                "The 'kind' argument must reference a ViolationType enumeration option!"
+            )
+
+        if not isinstance(path, str):
+            raise TypeError("The 'path' argument must have a string value!")
+
+        if not isinstance(entity, str):
+            raise TypeError("The 'entity' argument must have a string value!")
+
+        if not isinstance(property, str):
+            raise TypeError("The 'property' argument must have a string value!")
+
+        if not isinstance(message, str):
+            raise TypeError("The 'message' argument must have a string value!")
+
+        self._kind: ViolationType = kind
+        self._path: str = path
+        self._entity: str = entity
+        self._property: str = property
+        self._value: object = value
+        self._message: str = message
+
+    def __repr__(self) -> str:
+        return f"<Violation({self._kind.name}: {self._path})>"
+
+    def __str__(self) -> str:
+        return f"{self._path}: {self._message}"
+
+    @property
+    def kind(self) -> ViolationType:
+        """The type of the violation."""
+
+        return self._kind
+
+    @property
+    def path(self) -> str:
+        """The path to the property from the validated entity."""
+
+        return self._path
+
+    @property
+    def entity(self) -> str:
+        """The name of the entity class holding the property."""
+
+        return self._entity
+
+    @property
+    def value(self) -> object:
+        """The value that failed validation."""
+
+        return self._value
+
+    @property
+    def message(self) -> str:
+        """The description of the violation."""
+
+        return self._message
+
+    # As this property shadows the built-in property decorator within the class body, it
+    # must be defined after the other properties
+    @property
+    def property(self) -> str:
+        """The name of the property."""
+
+        return self._property
@@ -0,0 +1,83 @@
+import datetime
+import pytest
+
+from semanticpy import Model, ModelRegistry
+from semanticpy.codec import Codec, JSONCodec, OrjsonCodec
+
+
+def test_codec_named():
+    """Test obtaining codecs by name."""
+
+    assert isinstance(Codec.named("json"), JSONCodec)
+
+    assert "json" in Codec.available()
+
+    with pytest.raises(ValueError):
+        Codec.named("unknown")
+
+    with pytest.raises(TypeError):
+        Model.configure(codec=123)
+
+
+def test_codec_datetime_encoding(factory: callable):
+    """Test that date-time values assigned to 'xsd:dateTime' properties are encoded."""
+
+    model = factory(profile="linked-art", globals={})
+
+    timespan = model.TimeSpan()
+
+    timespan.begin_of_the_begin = datetime.datetime(2026, 1, 1, 0, 0, 0)
+
+    timespan.end_of_the_end = "2026-12-31T23:59:59"
+
+    serialized = timespan.json(compact=True)
+
+    assert '"begin_of_the_begin": "2026-01-01T00:00:00"' in serialized
+    assert '"end_of_the_end": "2026-12-31T23:59:59"' in serialized
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_backends(name: str, path: callable, data: callable):
+    """Test loading and serializing the example records via each available codec, which
+    may be configured per registry, without affecting other models."""
+
+    if not name in Codec.available():
+        pytest.skip("The '%s' codec backend is not installed!" % (name))
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.configure(codec=name)
+
+    assert registry.model._json().name == name
+    assert Model._json().name == "json"
+
+    artefact = registry.open(path("examples/object.json"))
+
+    assert isinstance(artefact, registry.HumanMadeObject)
+
+    expected = JSONCodec().loads(data("examples/object.json"))
+
+    assert Codec.named(name).loads(artefact.json(indent=2)) == expected
+    assert Codec.named(name).loads(artefact.json(compact=True)) == expected
+
+    timespan = registry.TimeSpan()
+
+    timespan.begin_of_the_begin = datetime.datetime(2026, 1, 1, 12, 30, 0)
+
+    assert JSONCodec().loads(timespan.json(compact=True)) == {
+        "@context": "https://linked.art/ns/v1/linked-art.json",
+        "type": "TimeSpan",
+        "begin_of_the_begin": "2026-01-01T12:30:00",
+    }
+
+
+def test_codec_orjson_indentation():
+    """Test that the orjson codec falls back to the json module for indents other than
+    the two space indent that orjson supports, so output matches the default codec."""
+
+    pytest.importorskip("orjson")
+
+    value = {"one": [1, 2, {"three": "3"}], "four": "ünicode"}
+
+    assert OrjsonCodec().dumps(value, indent=2) == JSONCodec().dumps(value, indent=2)
+    assert OrjsonCodec().dumps(value, indent=4) == JSONCodec().dumps(value, indent=4)
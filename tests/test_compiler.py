@@ -0,0 +1,113 @@
+import importlib.util
+import pytest
+import semanticpy
+
+from semanticpy.__main__ import main
+from semanticpy.compiler import PRIMITIVES, generate
+
+
+def snapshot(entities: semanticpy.Namespace) -> dict[str, dict]:
+    """Assemble a comparable summary of the model's entity classes."""
+
+    return {
+        name: dict(
+            properties=dict(entity._properties),
+            multiple=entity._multiple,
+            sorting=entity._sorting,
+            hidden=entity._hidden,
+            mro=[superclass.__name__ for superclass in entity.__mro__],
+            type=entity._type,
+            name=entity._name,
+            context=entity._context,
+        )
+        for name, entity in entities.items()
+    }
+
+
+def module(path: str, name: str = "linked_art_model") -> object:
+    """Import the generated model module from the specified path."""
+
+    specification = importlib.util.spec_from_file_location(name, path)
+
+    imported = importlib.util.module_from_spec(specification)
+
+    specification.loader.exec_module(imported)
+
+    return imported
+
+
+def test_compiler_command(tmp_path, capsys):
+    """Test the `semanticpy compile-profile` command line interface."""
+
+    output = tmp_path / "sample_model.py"
+
+    assert main(["compile-profile", "sample", "-o", str(output)]) == 0
+
+    assert output.read_text() == generate(profile="sample")
+
+    assert main(["compile-profile", "sample"]) == 0
+
+    assert capsys.readouterr().out == generate(profile="sample")
+
+    with pytest.raises(SystemExit) as exception:
+        main(["compile-profile", "missing-profile"])
+
+    assert exception.value.code == 1
+
+
+def test_compiler_generated_module(tmp_path, path: callable):
+    """Test that the classes of a generated model module match those of factory()."""
+
+    semanticpy.Model.teardown()
+
+    expected = snapshot(semanticpy.Model.factory(profile="linked-art", globals={}))
+
+    semanticpy.Model.teardown()
+
+    output = tmp_path / "linked_art_model.py"
+
+    output.write_text(generate(profile="linked-art"))
+
+    generated = module(str(output))
+
+    model = generated.factory(globals={})
+
+    assert snapshot(model) == expected
+
+    # Properties inherited by the classes share the same specification instances
+    assert (
+        model.HumanMadeObject._properties["identified_by"]
+        is model.Person._properties["identified_by"]
+    )
+
+    # The range types of the model's properties have been precomputed
+    assert semanticpy.Model._range_memo["crm:E55_Type"] == (model.Type,)
+
+    # Records can be loaded into and serialized from the generated classes
+    artefact = semanticpy.Model.open(path("examples/object.json"))
+
+    assert isinstance(artefact, generated.HumanMadeObject)
+
+    with open(path("examples/object.json")) as handle:
+        assert artefact.json(indent=2) == handle.read()
+
+    # The classes may be registered again after the model has been torn down
+    semanticpy.Model.teardown()
+
+    assert generated.factory(globals={}).HumanMadeObject is generated.HumanMadeObject
+
+    semanticpy.Model.teardown()
+
+
+def test_compiler_primitives():
+    """Test that the primitive ranges known to the compiler are those of the Model."""
+
+    assert PRIMITIVES.keys() == semanticpy.Model._primitives.keys()
+
+    assert PRIMITIVES["xsd:anyURI"] == ("str",)
+    assert PRIMITIVES["xsd:dateTime"] == ("str", "datetime.datetime")
+
+    for range, types in PRIMITIVES.items():
+        typed = semanticpy.Model._find_type(range=range)
+
+        assert len(types) == len(typed if isinstance(typed, tuple) else (typed,))
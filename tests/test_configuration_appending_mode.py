@@ -1,4 +1,4 @@
-from semanticpy import Model, AppendingMode, Nodes
+from semanticpy import Model, ModelRegistry, AppendingMode, Nodes
 
 
 def test_appending_mode_always():
@@ -132,3 +132,121 @@ def test_appending_mode_unique():
 
     # Tear down the model, removing it from the current scope and reset configuration
     Model.teardown()
+
+
+def test_appending_mode_unique_index():
+    """Test that unique appends are checked via the index of the nodes' fingerprints,
+    and that the index remains accurate as the list of nodes is modified."""
+
+    # Instantiate the model with the desired profile
+    model = Model.factory(profile="linked-art")
+
+    Model.configure(appending=AppendingMode.Unique)
+
+    object = model.HumanMadeObject()
+
+    # Append a number of distinct types, each of which is appended
+    for index in range(50):
+        object.classified_as = model.Type(ident="aat:%d" % (300000000 + index))
+
+    assert len(object.classified_as) == 50
+
+    # Appending equal types, whether appended first or last, is ignored
+    object.classified_as = model.Type(ident="aat:300000000")
+    object.classified_as = model.Type(ident="aat:300000049")
+
+    assert len(object.classified_as) == 50
+
+    # Nodes that are equal apart from their property order share the same fingerprint
+    first = model.Name(content="Name")
+    first.classified_as = model.Type(ident="aat:300404670")
+
+    second = model.Name()
+    second.classified_as = model.Type(ident="aat:300404670")
+    second.content = "Name"
+
+    assert first.fingerprint() == second.fingerprint()
+    assert not first.fingerprint() == model.Name(content="Other").fingerprint()
+
+    # Once a node is removed, an equal node may be appended once again
+    removed = object.classified_as.pop(0)
+
+    assert len(object.classified_as) == 49
+
+    object.classified_as = model.Type(ident=removed.id)
+
+    assert len(object.classified_as) == 50
+
+    object.classified_as = model.Type(ident=removed.id)
+
+    assert len(object.classified_as) == 50
+
+    # Nodes added to the list directly are also accounted for
+    object.classified_as.append(model.Type(ident="aat:300000050"))
+    object.classified_as.insert(0, model.Type(ident="aat:300000051"))
+
+    object.classified_as = model.Type(ident="aat:300000050")
+    object.classified_as = model.Type(ident="aat:300000051")
+
+    assert len(object.classified_as) == 52
+
+    # A node modified after being appended is no longer matched by its prior values
+    object.classified_as[1].id = "aat:300000052"
+
+    object.classified_as = model.Type(ident="aat:300000001")
+
+    assert len(object.classified_as) == 53
+
+    # Tear down the model, removing it from the current scope and reset configuration
+    Model.teardown()
+
+
+def test_appending_mode_unique_index_model_changes():
+    """Test that the index of the nodes' fingerprints used for unique appends is rebuilt
+    once prefixes are registered or the model is extended, as these change how nodes
+    are serialized, and thus their fingerprints."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.configure(appending=AppendingMode.Unique)
+
+    object = registry.HumanMadeObject()
+
+    object.classified_as = registry.Type(ident="aat:300033618")
+    object.classified_as = registry.Type(ident="http://vocab.getty.edu/aat/300033618")
+
+    assert len(object.classified_as) == 2
+
+    # Once the prefix is registered, both types are equal to the expanded type
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    object.classified_as = registry.Type(ident="http://vocab.getty.edu/aat/300033618")
+    object.classified_as = registry.Type(ident="aat:300033618")
+
+    assert len(object.classified_as) == 2
+
+    object.classified_as = registry.Type(ident="aat:300404670")
+
+    assert len(object.classified_as) == 3
+
+    # Once the model is extended, names with the newly canonical property are matched
+    object.identified_by = registry.Name(content="Example")
+    object.identified_by = registry.Name(content="Other")
+
+    class Flagged(registry.model):
+        pass
+
+    registry.extend(
+        Flagged,
+        properties={
+            "content": {
+                "individual": True,
+                "range": "xsd:string",
+                "canonical": "value",
+            },
+        },
+    )
+
+    object.identified_by = registry.Name(content="Example")
+
+    assert len(object.identified_by) == 2
@@ -0,0 +1,112 @@
+import gzip
+import json
+import pytest
+
+import semanticpy.export
+
+from semanticpy import ModelRegistry
+
+
+def test_export_jsonl(tmp_path):
+    """Test that records are exported to a JSON Lines file in their original order, by
+    the current process or by worker processes, optionally gzip-compressed, and that
+    the export's throughput statistics are returned."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    class Site(registry.model):
+        _properties = {
+            "located": {
+                "individual": True,
+                "range": "xsd:anyURI",
+            },
+        }
+
+    registry.extend(Site)
+
+    def records():
+        for index in range(250):
+            if index % 2:
+                record = registry.HumanMadeObject(
+                    ident="https://data.example.org/object/%d" % (index)
+                )
+                record.identified_by = registry.Name(content="Object %d" % (index))
+            else:
+                record = Site(ident="https://data.example.org/place/%d" % (index))
+                record.located = "https://data.example.org/place/0"
+
+            yield record
+
+    expected: list[str] = [record.json(compact=True) for record in records()]
+
+    for workers, compress in [(1, False), (3, False), (3, True)]:
+        filepath = tmp_path / ("records-%d-%s.jsonl" % (workers, compress))
+
+        stats = semanticpy.export.jsonl(
+            records(),
+            str(filepath),
+            workers=workers,
+            compress=compress,
+            batch=16,
+        )
+
+        if compress is True:
+            with gzip.open(filepath, "rt", encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        else:
+            lines = filepath.read_text(encoding="utf-8").splitlines()
+
+        assert lines == expected
+
+        assert stats["records"] == 250
+        assert stats["workers"] == workers
+        assert stats["bytes"] == sum(len(line) + 1 for line in expected)
+        assert stats["written"] == filepath.stat().st_size
+        assert stats["records_per_second"] > 0
+
+    # The lines hold the records' JSON, and the records' IRIs may be compacted
+    registry.prefix("ex", "https://data.example.org/")
+
+    filepath = tmp_path / "records.jsonl"
+
+    semanticpy.export.jsonl(records(), str(filepath), workers=2, compact_iris=True)
+
+    lines = filepath.read_text(encoding="utf-8").splitlines()
+
+    assert json.loads(lines[0])["located"] == "ex:place/0"
+    assert json.loads(lines[1])["id"] == "ex:object/1"
+
+    # Existing files are only overwritten if requested
+    with pytest.raises(ValueError):
+        semanticpy.export.jsonl(records(), str(filepath))
+
+    stats = semanticpy.export.jsonl([], str(filepath), overwrite=True)
+
+    assert stats["records"] == 0
+    assert filepath.read_text() == ""
+
+    # Records of different models, whose entity classes share names, may be exported
+    other = ModelRegistry(profile="sample")
+
+    mixed = [
+        registry.Type(ident="https://data.example.org/type/1"),
+        other.Type(ident="https://data.example.org/type/2"),
+    ]
+
+    semanticpy.export.jsonl(mixed, str(filepath), workers=2, overwrite=True)
+
+    assert filepath.read_text().splitlines() == [
+        record.json(compact=True) for record in mixed
+    ]
+
+    with pytest.raises(TypeError):
+        semanticpy.export.jsonl(["record"], str(filepath), overwrite=True)
+
+    with pytest.raises(TypeError):
+        semanticpy.export.jsonl([], str(filepath), overwrite=True, workers=0)
+
+    with pytest.raises(TypeError):
+        semanticpy.export.jsonl([], str(filepath), overwrite=True, compress=10)
+
+    # A failed export leaves neither a partial nor a temporary file
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
@@ -0,0 +1,97 @@
+import pytest
+
+from semanticpy import ModelRegistry
+
+
+def test_extending():
+    """Test extending a model with several subclasses and model-wide properties at once
+    within an extending() block, where the properties are applied when the block exits.
+    """
+
+    registry = ModelRegistry(profile="linked-art")
+
+    # Assign a property so that an assignment plan is compiled for the entity class
+    artefact = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+    artefact._label = "Example Object"
+
+    assert registry.model._assignments
+
+    class Retired(registry.model):
+        _properties = {
+            "reason": {
+                "individual": True,
+                "range": "xsd:string",
+            },
+        }
+
+    class Flagged(registry.model):
+        pass
+
+    with registry.extending():
+        registry.extend(
+            Retired,
+            properties=dict(
+                _retired=dict(
+                    alias="retired",
+                    canonical="_retired",
+                    individual=True,
+                    range=Retired,
+                ),
+            ),
+            typed=False,
+        )
+
+        # Nested blocks defer applying the properties until the outermost block exits
+        with registry.extending():
+            registry.extend(
+                Flagged,
+                properties=dict(
+                    _flags=dict(individual=False, range="xsd:string", sorting=9000),
+                ),
+            )
+
+        # Ensure the properties have not been applied to the entity classes yet
+        assert not "_retired" in registry.HumanMadeObject._properties
+        assert not "_flags" in registry.HumanMadeObject._properties
+
+    # Ensure the properties have been applied to every entity class, including those
+    # registered within the block, and that the assignment plans have been discarded
+    for entity in [registry.HumanMadeObject, registry.Person, Retired, Flagged]:
+        assert entity._properties["_retired"]["range"] is Retired
+        assert entity._properties["retired"]["alias"] == "_retired"
+        assert "_flags" in entity._multiple
+        assert entity._sorting["_flags"] == 9000
+
+    assert not registry.model._assignments
+
+    artefact._retired = Retired(reason="Deaccessioned")
+    artefact._flags = "reviewed"
+    artefact._flags = "published"
+
+    assert artefact._flags == ["reviewed", "published"]
+
+    with pytest.raises(TypeError):
+        artefact._retired = "Deaccessioned"
+
+
+def test_extending_with_exception():
+    """Test that the extensions registered within an extending() block before an error
+    was raised are still applied to the model's entity classes."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    class Annotated(registry.model):
+        pass
+
+    with pytest.raises(ValueError):
+        with registry.extending():
+            registry.extend(
+                Annotated,
+                properties=dict(_annotation=dict(individual=True)),
+            )
+
+            raise ValueError("Extension failed!")
+
+    assert "_annotation" in registry.HumanMadeObject._properties
+    assert registry.model._batching == 0
+    assert not registry.model._batched
@@ -0,0 +1,129 @@
+import copy
+
+from semanticpy import ModelRegistry
+
+
+def test_fingerprint():
+    """Test that fingerprints are stable regardless of the order in which properties are
+    assigned, are cached, and are recalculated when a nested node is modified."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    def build(reverse: bool = False):
+        artefact = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+
+        name = registry.Name(content="Example")
+        kind = registry.Type(ident="http://vocab.getty.edu/aat/300404670")
+
+        assignments = [("identified_by", name), ("classified_as", kind)]
+
+        for property, value in reversed(assignments) if reverse else assignments:
+            setattr(artefact, property, value)
+
+        return artefact, name
+
+    artefact, name = build()
+    reordered, _ = build(reverse=True)
+
+    assert isinstance(fingerprint := artefact.fingerprint(), str)
+    assert len(fingerprint) == 32
+
+    assert reordered.fingerprint() == fingerprint
+
+    # The fingerprints of the node and its nested nodes are cached
+    assert artefact._fingerprinted == fingerprint
+    assert name._fingerprinted == name.fingerprint()
+
+    # Modifying a nested node discards the cached fingerprints of the nodes above it
+    name.content = "Changed"
+
+    assert name._fingerprinted is None
+    assert artefact._fingerprinted is None
+
+    assert artefact.fingerprint() != fingerprint
+    assert artefact.fingerprint() != reordered.fingerprint()
+
+    # Deleting the modified property restores equality with a node lacking it
+    del name.content
+    del reordered.identified_by[0].content
+
+    assert artefact.fingerprint() == reordered.fingerprint()
+
+    # Nodes which are not equal do not share fingerprints
+    assert registry.Name(content="A").fingerprint() != registry.Name().fingerprint()
+
+    # Prefixed identifiers are fingerprinted in their expanded form, as serialized
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    assert (
+        registry.Type(ident="aat:300404670").fingerprint()
+        == registry.Type(ident="http://vocab.getty.edu/aat/300404670").fingerprint()
+    )
+
+
+def test_fingerprint_model_changes():
+    """Test that cached fingerprints are discarded when changes to the model affect how
+    nodes are serialized, such as registering prefixes or extending the model."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    prefixed = registry.Type(ident="aat:300404670")
+    expanded = registry.Type(ident="http://vocab.getty.edu/aat/300404670")
+
+    fingerprint: str = prefixed.fingerprint()
+
+    assert not fingerprint == expanded.fingerprint()
+    assert not prefixed.equals(expanded, strict=True)
+
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    assert not prefixed.fingerprint() == fingerprint
+    assert prefixed.fingerprint() == expanded.fingerprint()
+    assert prefixed.equals(expanded, strict=True)
+
+    name = registry.Name(content="Example")
+
+    fingerprint = name.fingerprint()
+
+    class Flagged(registry.model):
+        pass
+
+    registry.extend(
+        Flagged,
+        properties={
+            "content": {
+                "individual": True,
+                "range": "xsd:string",
+                "canonical": "value",
+            },
+        },
+    )
+
+    assert not name.fingerprint() == fingerprint
+
+
+def test_fingerprint_cycles_and_copies():
+    """Test that cyclic graphs can be fingerprinted, and that copies of nodes do not
+    share the cached fingerprints or parent references of the copied nodes."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    artefact = registry.HumanMadeObject()
+    name = registry.Name(content="Example")
+
+    artefact.identified_by = name
+    name.identified_by = name
+
+    assert artefact.fingerprint() == artefact.fingerprint()
+    assert name.fingerprint() == name.fingerprint()
+
+    copied = copy.deepcopy(artefact)
+
+    assert copied._fingerprinted is None
+    assert copied._parents is None
+
+    assert copied.fingerprint() == artefact.fingerprint()
+
+    copied.identified_by[0].content = "Changed"
+
+    assert copied.fingerprint() != artefact.fingerprint()
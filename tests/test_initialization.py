@@ -1,7 +1,11 @@
+import datetime
+import json
 import pytest
 import logging
 import semanticpy
 
+from semanticpy.types import Placeholder
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,3 +78,314 @@ def test_teardown():
         assert isinstance(obj, HumanMadeObject)
     except NameError as exception:
         assert str(exception) == "name 'HumanMadeObject' is not defined"
+
+
+def test_initialization_with_profile_cache(tmp_path):
+    """Test initializing the model with the compiled profile cache enabled."""
+
+    # Ensure the model is initialized from the profile rather than any existing classes
+    semanticpy.Model.teardown()
+
+    # Initialize the model with caching enabled, which compiles the profile and saves it
+    semanticpy.Model.factory(profile="linked-art", cache=str(tmp_path))
+
+    # Ensure that a single cache file, keyed on the profile and version, was written
+    assert len(caches := list(tmp_path.glob("linked-art-*.pickle"))) == 1
+    assert semanticpy.__version__ in caches[0].name
+
+    properties = semanticpy.Model.entity("HumanMadeObject")._properties
+
+    semanticpy.Model.teardown()
+
+    # Initialize the model again, which now rebuilds the classes from the cache
+    model = semanticpy.Model.factory(profile="linked-art", cache=str(tmp_path))
+
+    assert len(list(tmp_path.glob("linked-art-*.pickle"))) == 1
+
+    assert model.HumanMadeObject._properties == properties
+    assert model.HumanMadeObject._name == "crm:E22_Human-Made_Object"
+    assert issubclass(model.HumanMadeObject, model.PhysicalObject)
+
+    semanticpy.Model.teardown()
+
+
+def test_initialization_with_invalid_profile_cache(tmp_path):
+    """Test that an unreadable compiled profile cache is ignored and replaced."""
+
+    semanticpy.Model.teardown()
+
+    semanticpy.Model.factory(profile="linked-art", cache=str(tmp_path))
+
+    # Corrupt the cache file, which should then be ignored and rewritten on next use
+    (cache := list(tmp_path.glob("linked-art-*.pickle"))[0]).write_bytes(b"invalid")
+
+    semanticpy.Model.teardown()
+
+    model = semanticpy.Model.factory(profile="linked-art", cache=str(tmp_path))
+
+    assert hasattr(model, "HumanMadeObject")
+
+    assert cache.read_bytes() != b"invalid"
+
+    semanticpy.Model.teardown()
+
+
+def test_initialization_lazily():
+    """Test initializing the model in lazy mode, where entity classes are materialized
+    from placeholders when they are first used rather than up-front by the factory."""
+
+    semanticpy.Model.teardown()
+
+    scope: dict[str, object] = {}
+
+    model = semanticpy.Model.factory(profile="linked-art", globals=scope, lazy=True)
+
+    # Ensure that the namespace and scope initially only hold placeholders
+    assert isinstance(model.get("HumanMadeObject", resolve=False), Placeholder)
+    assert isinstance(scope["HumanMadeObject"], Placeholder)
+    assert isinstance(model.get("PhysicalObject", resolve=False), Placeholder)
+
+    # Create an instance via the placeholder held in the scope, materializing the class
+    artefact = scope["HumanMadeObject"](ident="https://data.example.org/object/1")
+
+    # Ensure that the class and its superclasses have been materialized and replaced
+    assert isinstance(model.get("HumanMadeObject", resolve=False), type)
+    assert isinstance(scope["HumanMadeObject"], type)
+    assert isinstance(model.get("PhysicalObject", resolve=False), type)
+    assert isinstance(artefact, scope["HumanMadeObject"])
+
+    # Ensure that entity classes are materialized when they are needed for a range check
+    assert isinstance(model.get("Type", resolve=False), Placeholder)
+
+    with pytest.raises(TypeError):
+        artefact.classified_as = "http://vocab.getty.edu/aat/300133025"
+
+    assert isinstance(model.get("Type", resolve=False), type)
+
+    # Ensure that unrelated entity classes remain as placeholders
+    assert isinstance(model.get("Person", resolve=False), Placeholder)
+
+    semanticpy.Model.teardown(globals=scope)
+
+    assert len(scope) == 0
+
+
+def test_initialization_inherited_properties():
+    """Test that inherited property specifications are validated once and are shared by
+    each of the entity classes that inherit the property, rather than being copied."""
+
+    model = semanticpy.Model.factory(profile="linked-art", globals={})
+
+    # The 'classified_as' property is defined on CRMEntity and inherited by all classes
+    assert (
+        model.HumanMadeObject._properties["classified_as"]
+        is model.Type._properties["classified_as"]
+    )
+
+    # The alias of an inherited property maps to the same property specification
+    assert (
+        model.LinguisticObject._properties["c_part"]
+        is model.PropositionalObject._properties["conceptual_part"]
+    )
+
+    assert "alias" not in model.AuthorityDocument._properties["conceptual_part"]
+    assert "c_part" in model.AuthorityDocument._multiple
+
+
+def test_initialization_with_cyclic_profile(tmp_path):
+    """Test that a profile whose entities inherit from each other cyclically fails."""
+
+    profile = tmp_path / "cyclic.json"
+
+    profile.write_text(
+        json.dumps(
+            {
+                "context": "https://schemas.example.org/v1/cyclic.json",
+                "properties": {"id": {"individual": True}},
+                "entities": {
+                    "A": {"id": "ex:A", "superclasses": "B"},
+                    "B": {"id": "ex:B", "superclasses": ["A"]},
+                },
+            }
+        )
+    )
+
+    with pytest.raises(semanticpy.SemanticPyError) as exception:
+        semanticpy.Model.factory(profile=str(profile), globals={})
+
+    assert "inherits from itself via: A > B > A" in str(exception.value)
+
+
+def test_initialization_range_index(tmp_path):
+    """Test that entity classes are indexed for range resolution by their IRI, their type
+    code and their synonyms, and that memoized range types are cleared on extension."""
+
+    # Tear down any model factored by earlier tests, as the first entity to be indexed
+    # under a reference, such as a type code, is the entity that the reference resolves to
+    semanticpy.Model.teardown()
+
+    profile = tmp_path / "ranged.json"
+
+    profile.write_text(
+        json.dumps(
+            {
+                "context": "https://schemas.example.org/v1/ranged.json",
+                "properties": {"id": {"individual": True}},
+                "entities": {
+                    "Entity": {"type": "E1", "id": "ex:E1_Entity"},
+                    "Group": {
+                        "type": "E74",
+                        "id": "ex:E74_Group",
+                        "superclasses": "Entity",
+                        "synonym": "Collective",
+                    },
+                },
+            }
+        )
+    )
+
+    model = semanticpy.Model.factory(profile=str(profile), globals={})
+
+    assert semanticpy.Model._find_type(range="ex:E74_Group") is model.Group
+    assert semanticpy.Model._find_type(range="E74") is model.Group
+    assert semanticpy.Model._find_type(range="Collective") is model.Group
+    assert semanticpy.Model._find_type(range=model.Group) is model.Group
+    assert semanticpy.Model._find_type(range="ex:E99_Unknown") is None
+
+    assert semanticpy.Model._range_types(
+        range=["ex:E1_Entity", "xsd:dateTime"], property="example"
+    ) == (model.Entity, str, datetime.datetime)
+
+    assert ("ex:E1_Entity", "xsd:dateTime") in semanticpy.Model._range_memo
+
+    with pytest.raises(ValueError) as exception:
+        semanticpy.Model._range_types(range="ex:E99_Unknown", property="example")
+
+    assert "cannot be reconciled to a known range type" in str(exception.value)
+
+    class Extension(semanticpy.Model):
+        pass
+
+    semanticpy.Model.extend(Extension)
+
+    assert semanticpy.Model._range_memo == {}
+
+    assert semanticpy.Model._find_type(range=Extension) is Extension
+    assert semanticpy.Model._find_type(range="Extension") is Extension
+
+    semanticpy.Model.teardown()
+
+    assert semanticpy.Model._ranges == {}
+
+
+def test_initialization_with_profile_slice(path):
+    """Test initializing the model from a slice of the profile's entities, where only the
+    selected entities, their superclasses and the entities referenced by the ranges of
+    their properties are built, and where excluded entities are unknown by default."""
+
+    semanticpy.Model.teardown()
+
+    scope: dict[str, object] = {}
+
+    model = semanticpy.Model.factory(
+        profile="linked-art",
+        globals=scope,
+        entities=["Name", "Identifier"],
+    )
+
+    # Ensure that the selected entities, their superclasses, and range entities are built
+    assert isinstance(model.Name, type)
+    assert isinstance(model.Appellation, type)
+    assert isinstance(model.Type, type)
+    assert isinstance(scope["Identifier"], type)
+
+    # Ensure that excluded entities are not added to the namespace or globals scope
+    assert not "HumanMadeObject" in model
+    assert not "HumanMadeObject" in scope
+
+    name = model.Name(content="Example")
+    name.classified_as = model.Type(ident="http://vocab.getty.edu/aat/300404670")
+
+    # Ensure that excluded entity types raise a clear error when they are met
+    with pytest.raises(semanticpy.SemanticPyError) as exception:
+        semanticpy.Model.open(path("examples/object.json"))
+
+    assert "excluded from the model" in str(exception.value)
+
+    semanticpy.Model.teardown(globals=scope)
+
+    assert len(scope) == 0
+
+
+def test_initialization_with_profile_slice_range_checks():
+    """Test that checking a property's range against an entity that was excluded from the
+    slice of the profile builds the entity's class without registering it, so that the
+    excluded entity remains unknown, unless it is later built on demand."""
+
+    semanticpy.Model.teardown()
+
+    scope: dict[str, object] = {}
+
+    model = semanticpy.Model.factory(
+        profile="linked-art",
+        globals=scope,
+        entities=["Name"],
+        unknown=semanticpy.UnknownMode.Error,
+    )
+
+    assert not "HumanMadeObject" in model
+
+    (typed,) = semanticpy.Model._range_types("HumanMadeObject", "example")
+
+    assert isinstance(typed, type) and typed.__name__ == "HumanMadeObject"
+
+    # Ensure that the class built for the range check was not registered with the model
+    assert not "HumanMadeObject" in model
+    assert not "HumanMadeObject" in scope
+
+    with pytest.raises(semanticpy.SemanticPyError) as exception:
+        semanticpy.Model.entity("HumanMadeObject")
+
+    assert "excluded from the model" in str(exception.value)
+
+    # Ensure that building the entity on demand registers the class built for the check
+    semanticpy.Model._unknown_mode = semanticpy.UnknownMode.Build
+
+    assert semanticpy.Model.entity("HumanMadeObject") is typed
+    assert model.HumanMadeObject is typed
+    assert scope["HumanMadeObject"] is typed
+
+    semanticpy.Model.teardown(globals=scope)
+
+    assert semanticpy.Model._detached == {}
+
+
+def test_initialization_with_profile_slice_building_unknown(path):
+    """Test initializing the model from a slice of the profile's entities, where excluded
+    entities are built on demand when they are met, as per the configured unknown mode.
+    """
+
+    semanticpy.Model.teardown()
+
+    model = semanticpy.Model.factory(
+        profile="linked-art",
+        globals={},
+        entities=["Name"],
+        unknown=semanticpy.UnknownMode.Build,
+    )
+
+    assert not "HumanMadeObject" in model
+
+    artefact = semanticpy.Model.open(path("examples/object.json"))
+
+    # Ensure that the excluded entities met while loading the data have been built
+    assert isinstance(artefact, model.HumanMadeObject)
+    assert "Production" in model
+
+    # Ensure that entities that were not met remain excluded
+    assert not "Person" in model
+
+    with pytest.raises(semanticpy.SemanticPyError):
+        semanticpy.Model.factory(profile="linked-art", globals={}, entities=["Unknown"])
+
+    semanticpy.Model.teardown()
@@ -0,0 +1,76 @@
+import contextlib
+import pytest
+
+import semanticpy
+
+from semanticpy import ModelRegistry
+from semanticpy.instrumentation import instrumentation
+
+
+def test_instrumentation(path: callable, tmp_path):
+    """Test that the instrumentation only gathers counters and timings while enabled,
+    that the gathered statistics can be reset, and that spans reach the tracing hook."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    spans: list[tuple[str, dict]] = []
+
+    @contextlib.contextmanager
+    def hook(name: str, attributes: dict = None):
+        spans.append((name, attributes))
+        yield
+
+    try:
+        # While disabled, which is the default, no statistics are gathered
+        assert instrumentation.enabled is False
+
+        semanticpy.stats(reset=True)
+
+        record = registry.open(path("examples/object.json"))
+        record.json()
+
+        stats = semanticpy.stats()
+
+        assert set(stats["counters"].values()) == {0}
+        assert stats["timings"] == {}
+
+        semanticpy.instrument(hook=hook)
+
+        record = registry.open(path("examples/object.json"))
+        record.save(str(tmp_path / "object.json"))
+
+        stats = semanticpy.stats(reset=True)
+
+        assert stats["counters"]["assignments"] > 0
+        assert stats["counters"]["validations"] > 0
+        assert stats["counters"]["creations"] == 10
+        assert stats["counters"]["serializations"] == 11
+        assert stats["counters"]["bytes"] == (tmp_path / "object.json").stat().st_size
+
+        assert [name for name in stats["timings"]] == ["load", "dump", "save"]
+
+        for timing in stats["timings"].values():
+            assert timing["calls"] == 1
+            assert timing["seconds"] > 0
+
+        # The spans were forwarded to the hook, in the order that they were entered
+        assert spans == [
+            ("load", {"type": "HumanMadeObject"}),
+            ("save", {"type": "HumanMadeObject"}),
+            ("dump", {"type": "HumanMadeObject"}),
+        ]
+
+        # Once reset, the counters and timings start over
+        stats = semanticpy.stats()
+
+        assert set(stats["counters"].values()) == {0}
+        assert stats["timings"] == {}
+
+        with pytest.raises(TypeError):
+            semanticpy.instrument(enabled="yes")
+
+        with pytest.raises(TypeError):
+            semanticpy.instrument(hook="hook")
+    finally:
+        semanticpy.instrument(enabled=False)
+        semanticpy.stats(reset=True)
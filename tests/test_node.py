@@ -122,6 +122,72 @@ def test_node_equality_strict():
     assert not node2.equals(node1, strict=True)  # not equal as node1.three cannot match
 
 
+def test_node_equality_structural():
+    """Test that Node equality compares the nodes' data structurally, resolving aliased
+    property names, comparing nested nodes in full, and supporting cyclic references."""
+
+    # Aliased property names are compared as their canonical names
+    node1 = Node(data=dict(ident="https://example.org/1", label="One"))
+    node2 = Node(data=dict(id="https://example.org/1", _label="One"))
+
+    assert node1.equals(node2, strict=True)
+    assert node2.equals(node1, strict=True)
+
+    # Unassigned properties are not compared, as they are not serialized
+    node3 = Node(data=dict(id="https://example.org/1", _label="One", other=None))
+
+    assert node3.equals(node2, strict=True)
+
+    # Nested nodes must be equal in full, even when not comparing strictly
+    node1.part = Node(data=dict(one=1, nested=dict(two=2)))
+    node2.part = Node(data=dict(one=1, nested=dict(two=2)))
+
+    assert node1.equals(node2)
+
+    node2.part.nested = dict(two=2, three=3)
+
+    assert not node1.equals(node2)
+    assert not node2.equals(node1)
+
+    # Nodes referring back to themselves are compared without recursing without end
+    node1.part.loop = node1.part
+    node2.part.loop = node2.part
+    node2.part.nested = dict(two=2)
+
+    assert node1.equals(node2, strict=True)
+
+    node2.part.loop = node2
+
+    assert not node1.equals(node2, strict=True)
+
+    # A node is always equal to itself
+    assert node1.equals(node1, strict=True)
+
+    assert node1.equals("node") is NotImplemented
+
+
+def test_node_equality_entities():
+    """Test that entity equality expands prefixed identifiers and compares types."""
+
+    registry = semanticpy.ModelRegistry(profile="linked-art")
+
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    prefixed = registry.Type(ident="aat:300133025", label="Works of Art")
+    expanded = registry.Type(ident="http://vocab.getty.edu/aat/300133025")
+
+    assert prefixed.equals(expanded)
+    assert expanded.equals(prefixed)
+    assert not prefixed.equals(expanded, strict=True)
+
+    expanded._label = "Works of Art"
+
+    assert prefixed.equals(expanded, strict=True)
+
+    # Entities of different types are not equal, even if their other properties are
+    assert not registry.Material(ident="aat:300133025").equals(expanded)
+
+
 def test_node_merge(data: callable):
     """Test Node merging."""
 
@@ -330,6 +396,29 @@ def test_node_annotate_via_keyword_arguments(data: callable):
     assert annotations == dict(a=123, b=456.789)
 
 
+def test_node_annotations_allocated_lazily():
+    """Test that a Node only allocates its annotations once it is first annotated."""
+
+    # Create a test Node instance
+    node = Node()
+
+    # Before being annotated the node holds no annotations dictionary of its own
+    assert node._annotations is None
+    assert node.annotations() == {}
+    assert node.annotation("a", default=1) == 1
+
+    # Once annotated the node allocates its annotations dictionary
+    node.annotate(a=123)
+
+    assert isinstance(node._annotations, dict)
+    assert node.annotation("a") == 123
+
+    # The returned annotations are a copy, so modifying them does not affect the node
+    node.annotations()["b"] = 456
+
+    assert node.annotations() == dict(a=123)
+
+
 def test_node_properties(data: callable):
     """Test obtaining a Node's properties as a dictionary representation."""
 
@@ -0,0 +1,107 @@
+import copy
+import pickle
+import pytest
+
+import semanticpy
+from semanticpy.types import PropertySpec
+
+
+def test_propertyspec_initialisation():
+    """Test PropertySpec class initialisation and its dictionary-style access."""
+
+    spec = PropertySpec.create(
+        {
+            "individual": True,
+            "range": "xsd:string",
+            "label": "label",
+            "scope_note": None,
+            "example": "ignored",
+        }
+    )
+
+    assert isinstance(spec, PropertySpec)
+
+    assert spec == {
+        "accepted": True,
+        "individual": True,
+        "range": "xsd:string",
+        "sorting": 10000,
+        "label": "label",
+    }
+
+    assert spec["range"] == "xsd:string"
+    assert spec["label"] == "label"
+    assert spec.get("hidden") is None
+    assert not "scope_note" in spec
+    assert not "example" in spec
+
+    with pytest.raises(KeyError):
+        spec["scope_note"]
+
+
+def test_propertyspec_interning():
+    """Test that identical PropertySpec instances are interned and shared."""
+
+    spec = PropertySpec(individual=True, range=["xsd:string", "xsd:dateTime"])
+
+    assert spec is PropertySpec.create(
+        {"individual": True, "range": ["xsd:string", "xsd:dateTime"]}
+    )
+
+    assert spec["range"] == ("xsd:string", "xsd:dateTime")
+
+    assert spec is copy.copy(spec)
+    assert spec is pickle.loads(pickle.dumps(spec))
+
+    assert spec.replace(alias="other") is PropertySpec(
+        individual=True, range=("xsd:string", "xsd:dateTime"), alias="other"
+    )
+
+    assert not spec.replace(alias="other") is spec
+
+
+def test_propertyspec_immutability():
+    """Test that PropertySpec instances cannot be modified."""
+
+    spec = PropertySpec(individual=True)
+
+    with pytest.raises(RuntimeError):
+        spec.individual = False
+
+    with pytest.raises(RuntimeError):
+        del spec.individual
+
+    with pytest.raises(TypeError):
+        spec["individual"] = False
+
+    with pytest.raises(KeyError):
+        spec.replace(example="example")
+
+
+def test_propertyspec_shared_by_model_entities():
+    """Test that model entity classes share interned PropertySpec instances."""
+
+    model = semanticpy.Model.factory(profile="linked-art", globals={})
+
+    specs = {
+        id(props)
+        for name, entity in model.items()
+        for props in entity._properties.values()
+    }
+
+    assert len(specs) < len(model) * 10
+
+    assert isinstance(
+        props := model.HumanMadeObject._properties["identified_by"], PropertySpec
+    )
+
+    assert props is model.Person._properties["identified_by"]
+
+    # The property() method returns a mutable dictionary copy of the specification
+    assert isinstance(info := model.HumanMadeObject().property("identified_by"), dict)
+    assert info == props
+
+    # The documentation fields of the profile's properties are retained
+    assert info["label"] == "is identified by"
+    assert info["inverse"] == "crm:P1i_identifies"
+    assert info["scope_note"]
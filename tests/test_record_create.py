@@ -1,4 +1,5 @@
 import logging
+import pytest
 import semanticpy
 
 logger = logging.getLogger(__name__)
@@ -100,3 +101,98 @@ def test_record_create(factory: callable, data: callable):
     assert isinstance(content, str)
 
     assert content == serialised
+
+
+def test_record_create_assignment_plan(factory: callable):
+    """Test that property assignments are planned per class, and that planned property
+    assignments apply the same range validation as the initial assignment did."""
+
+    model = factory(profile="linked-art", globals={})
+
+    hmo = model.HumanMadeObject(ident="https://data.example.org/object/1")
+
+    hmo.classified_as = model.Type(ident="aat:300133025", label="Works of Art")
+
+    plan = semanticpy.Model._assignments[model.HumanMadeObject]
+
+    assert plan["classified_as"] == (
+        "classified_as",
+        (model.Type,),
+        True,
+    )
+
+    # The planned assignment validates the type of the assigned value
+    with pytest.raises(TypeError) as exception:
+        hmo.classified_as = "Works of Art"
+
+    assert "must be of type" in str(exception.value)
+
+    hmo.classified_as = model.Type(ident="aat:300033618", label="Paintings")
+
+    assert len(hmo.classified_as) == 2
+
+    # Extending the model clears the assignment plans as properties may have changed
+    class Annotation(semanticpy.Model):
+        pass
+
+    semanticpy.Model.extend(Annotation)
+
+    assert not model.HumanMadeObject in semanticpy.Model._assignments
+
+    hmo._label = "Example Object #1"
+
+    assert semanticpy.Model._assignments[model.HumanMadeObject]["_label"] == (
+        "_label",
+        (str,),
+        False,
+    )
+
+    semanticpy.Model.teardown()
+
+
+def test_record_create_construction_plan(factory: callable):
+    """Test that entity instances are constructed via their class' construction plan,
+    and that they are constructed just as they would be without the plan."""
+
+    model = factory(profile="linked-art", globals={})
+
+    name = model.Name(ident="https://data.example.org/name/1", content="Example")
+
+    assert semanticpy.Model._constructions[model.Name] == (
+        {},
+        {
+            "type": ("type", False),
+            "id": ("id", False),
+            "_label": ("_label", False),
+        },
+    )
+
+    assert name.type == "Name"
+    assert name.id == "https://data.example.org/name/1"
+    assert name._label is None
+    assert name.content == "Example"
+
+    # The node's property metadata is held on the class rather than on each instance
+    assert sorted(vars(name)) == ["_data"]
+
+    assert name.json(compact=True) == (
+        '{"@context": "https://linked.art/ns/v1/linked-art.json", '
+        '"id": "https://data.example.org/name/1", "type": "Name", "content": "Example"}'
+    )
+
+    # The essential properties are still validated when the instance is constructed
+    with pytest.raises(TypeError):
+        model.Name(ident=1)
+
+    with pytest.raises(TypeError):
+        model.Name(label=["Example"])
+
+    # Extending the model clears the construction plans as properties may have changed
+    class Annotation(semanticpy.Model):
+        pass
+
+    semanticpy.Model.extend(Annotation)
+
+    assert not model.Name in semanticpy.Model._constructions
+
+    semanticpy.Model.teardown()
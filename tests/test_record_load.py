@@ -1,8 +1,9 @@
 import logging
+import pytest
 
 import semanticpy
 
-from semanticpy import Model, Node, Nodes
+from semanticpy import Model, Node, Nodes, ViolationType
 
 logger = logging.getLogger(__name__)
 
@@ -509,3 +510,50 @@ def test_record_load_with_extended(factory: callable, data: callable, path: call
         ident="http://vocab.getty.edu/aat/300014078",
         label="Canvas (Textile Material)",
     ).equals(artefact.made_of[2])
+
+
+def test_record_load_trusted(factory: callable, data: callable, path: callable):
+    """Test loading a record in trusted mode, which stores the record's values without
+    validating each assignment, and validating the loaded record afterwards."""
+
+    model = factory(profile="linked-art")
+
+    artefact = Model.open(path("examples/object.json"))
+
+    trusted = Model.open(path("examples/object.json"), trusted=True)
+
+    # Nested entities are still mapped to their entity classes by their type
+    assert isinstance(trusted, model.HumanMadeObject)
+    assert isinstance(trusted.identified_by, Nodes)
+    assert isinstance(trusted.identified_by[0], model.Name)
+    assert isinstance(trusted.classified_as[0], model.Type)
+
+    # The record loaded in trusted mode is identical to the validated record
+    assert trusted.json(indent=2) == artefact.json(indent=2)
+    assert trusted.validate() == []
+
+    # Records may also be created in trusted mode from their dictionary or JSON forms
+    created = Model.create(data=artefact.properties(), trusted=True)
+    assert created.json(indent=2) == artefact.json(indent=2)
+
+    created = model.HumanMadeObject(json=artefact.json(), trusted=True)
+    assert created.json(indent=2) == artefact.json(indent=2)
+
+    # Values that would not pass validation are stored in trusted mode, but are then
+    # reported by validate()
+    invalid = artefact.properties()
+    invalid["identified_by"][0]["content"] = 123
+    invalid["unknown"] = "value"
+
+    created = Model.create(data=invalid, trusted=True)
+    assert created.identified_by[0].content == 123
+
+    assert [violation.kind for violation in created.validate()] == [
+        ViolationType.Range,
+        ViolationType.Acceptance,
+    ]
+
+    with pytest.raises(TypeError):
+        Model.open(path("examples/object.json"), trusted="yes")
+
+    semanticpy.Model.teardown()
@@ -1,6 +1,9 @@
+import datetime
+import io
 import logging
+import pytest
 
-from semanticpy import Model, Node
+from semanticpy import Model, ModelRegistry, Node
 
 logger = logging.getLogger(__name__)
 
@@ -106,3 +109,338 @@ def test_record_save_with_extended(factory: callable, data: callable, path: call
 
     # Ensure that the contents of the saved file match the pre-saved example file
     assert contents == data("examples/saved-extended.json")
+
+
+def test_record_dump(path: callable):
+    """Test that dump() writes the same JSON as json() generates, to text and binary
+    handles, in both its compact and indented forms, and with sorting and callbacks."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    artefact = registry.open(path("examples/object.json"))
+
+    # Include a prefixed identifier, which is expanded when serialized, a date-time value
+    # encoded by the codec's default hook, and non-ASCII characters
+    artefact.classified_as = registry.Type(ident="aat:300404670", label="Œuvre d’art")
+    artefact.produced_by = production = registry.Production()
+    production.timespan = timespan = registry.TimeSpan()
+    timespan.begin_of_the_begin = datetime.datetime(2020, 1, 2, 3, 4, 5)
+
+    for arguments in [
+        dict(),
+        dict(indent=2),
+        dict(compact=True),
+        dict(sorting=["type", "id"]),
+        dict(callback=lambda key, value, container: value.upper(), attribute="content"),
+    ]:
+        expected: str = artefact.json(**arguments)
+
+        artefact.dump(handle := io.StringIO(), **arguments)
+
+        assert handle.getvalue() == expected
+
+        artefact.dump(handle := io.BytesIO(), **arguments)
+
+        assert handle.getvalue() == expected.encode("utf-8")
+
+    # Cyclic references cannot be serialized
+    production.used_specific_object = artefact
+
+    with pytest.raises(ValueError):
+        artefact.dump(io.StringIO())
+
+    with pytest.raises(TypeError):
+        artefact.dump("/tmp/object.json")
+
+
+def test_record_serialization_plan():
+    """Test that serialization plans are compiled once for each entity class and custom
+    sorting, and are discarded when the model is extended."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    artefact = registry.HumanMadeObject(ident="aat:300133025", label="Example")
+
+    assert artefact.properties() == {
+        "@context": "https://linked.art/ns/v1/linked-art.json",
+        "id": "http://vocab.getty.edu/aat/300133025",
+        "type": "HumanMadeObject",
+        "_label": "Example",
+    }
+
+    plans: dict = registry.model._plans
+
+    names, positions, hidden, identifiers = plans[registry.HumanMadeObject]
+
+    assert names == {"id": "id", "type": "type", "_label": "_label"}
+    assert identifiers == {"id"}
+
+    # Custom sortings are compiled once, and share the class plan's names
+    for index in range(2):
+        assert list(artefact.properties(sorting=["_label", "type", "id"])) == [
+            "@context",
+            "_label",
+            "type",
+            "id",
+        ]
+
+    custom = [key for key in plans if isinstance(key, tuple)]
+
+    assert len(custom) == 1
+    assert plans[custom[0]][0] is names
+
+    with pytest.raises(TypeError):
+        artefact.properties(sorting="_label")
+
+    # Extending the model discards the plans, so that hidden properties are omitted
+    class Retired(registry.model):
+        _properties = {
+            "reason": {
+                "individual": True,
+                "range": "xsd:string",
+            },
+        }
+
+    registry.extend(Retired, typed=False)
+
+    assert plans == {}
+
+    retired = Retired()
+    retired.reason = "Example"
+
+    assert retired.properties() == {
+        "@context": "https://linked.art/ns/v1/linked-art.json",
+        "reason": "Example",
+    }
+
+
+def test_record_serialization_cache():
+    """Test that json() caches the serializations of the record's nodes, and rebuilds
+    only those of the modified nodes and the nodes they are nested within."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    artefact = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+    artefact.identified_by = name = registry.Name(content="Example")
+    artefact.identified_by = other = registry.Name(content="Other")
+    artefact.classified_as = kind = registry.Type(ident="http://example.org/type")
+
+    expected: str = artefact.json()
+
+    assert artefact.json() == expected
+
+    assert isinstance(cached := other._serialized, dict)
+    assert isinstance(kind._serialized, dict)
+
+    # Modifying a nested node only discards the caches of the node and its parents
+    name.content = "Changed"
+
+    assert name._serialized is None
+    assert artefact._serialized is None
+    assert other._serialized is cached
+    assert kind._serialized is not None
+
+    assert artefact.json() == expected.replace('"Example"', '"Changed"')
+    assert other._serialized is cached
+
+    # Modifying a list of nodes directly discards the caches of the node holding it
+    artefact.identified_by.append(registry.Name(content="Appended"))
+
+    assert artefact._serialized is None
+    assert "Appended" in artefact.json()
+
+    artefact.identified_by.pop()
+
+    assert not "Appended" in artefact.json()
+
+    # Callbacks, which modify the serialized values, do not affect the caches
+    artefact.json(
+        callback=lambda key, value, container: "Replaced", attribute="content"
+    )
+
+    assert artefact.json() == expected.replace('"Example"', '"Changed"')
+
+    # Deleting properties discards the caches
+    del kind.id
+
+    assert not "http://example.org/type" in artefact.json()
+
+    assert (
+        artefact.json()
+        == registry.HumanMadeObject(json=artefact.json(), trusted=True).json()
+    )
+
+
+def test_record_serialization_cache_model_changes():
+    """Test that the cached serializations of nodes are discarded when changes to the
+    model affect how nodes are serialized, such as registering prefixes, or extending
+    the model, after the nodes were first serialized."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    artefact = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+    artefact.classified_as = registry.Type(ident="aat:300033618")
+    artefact.identified_by = registry.Name(content="Example")
+
+    assert '"aat:300033618"' in artefact.json()
+
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+
+    assert '"http://vocab.getty.edu/aat/300033618"' in artefact.json()
+    assert not '"aat:300033618"' in artefact.json()
+
+    class Flagged(registry.model):
+        pass
+
+    registry.extend(
+        Flagged,
+        properties={
+            "content": {
+                "individual": True,
+                "range": "xsd:string",
+                "canonical": "value",
+            },
+        },
+    )
+
+    assert '"value": "Example"' in artefact.json()
+
+    class Noted(registry.model):
+        pass
+
+    with registry.extending():
+        registry.extend(
+            Noted,
+            properties={
+                "content": {
+                    "individual": True,
+                    "range": "xsd:string",
+                    "canonical": "content",
+                },
+            },
+        )
+
+        # Within the block, the cached serializations still reflect the model
+        assert '"value": "Example"' in artefact.json()
+
+    assert '"content": "Example"' in artefact.json()
+
+    assert artefact.json() == registry.HumanMadeObject(json=artefact.json()).json()
+
+
+def test_record_prefix_expansion():
+    """Test that prefixed IRIs are expanded when serialized, for identifiers and for the
+    values of properties whose ranges are IRI types, and that expansions are memoized.
+    """
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+    registry.prefix("tgn:", "http://vocab.getty.edu/tgn/")
+
+    class Place(registry.model):
+        _properties = {
+            "located": {
+                "individual": True,
+                "range": "xsd:anyURI",
+            },
+            "nearby": {
+                "individual": False,
+                "range": "xsd:anyURI",
+            },
+        }
+
+    registry.extend(Place)
+
+    place = Place(ident="tgn:7011781")
+    place.located = "tgn:1000080"
+    place.nearby = "tgn:7008038"
+    place.nearby = "https://example.org/place/1"
+    place.nearby = "unknown:1"
+
+    properties: dict = place.properties()
+
+    assert properties["id"] == "http://vocab.getty.edu/tgn/7011781"
+    assert properties["located"] == "http://vocab.getty.edu/tgn/1000080"
+    assert properties["nearby"] == [
+        "http://vocab.getty.edu/tgn/7008038",
+        "https://example.org/place/1",
+        "unknown:1",
+    ]
+
+    # Only the expanded IRIs are memoized, and recurring IRIs share the same string
+    assert "tgn:1000080" in registry.model._expansions
+    assert not "https://example.org/place/1" in registry.model._expansions
+
+    other = Place(ident="tgn:7011781")
+
+    assert other.properties()["id"] is place.properties()["id"]
+
+    # Properties whose ranges are not IRI types are not expanded
+    name = registry.Name(ident="aat:300404670", content="aat:300404670")
+
+    assert name.properties()["id"] == "http://vocab.getty.edu/aat/300404670"
+    assert name.properties()["content"] == "aat:300404670"
+
+
+def test_record_prefix_compaction(path: callable, tmp_path):
+    """Test that IRIs are compacted into prefixed IRIs, using the prefix of the longest
+    matching namespace, when serialized and when loaded, if requested."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.prefix("getty", "http://vocab.getty.edu/")
+    registry.prefix("aat", "http://vocab.getty.edu/aat/")
+    registry.prefix("ex", "https://data.example.org/")
+
+    record = registry.open(path("examples/object.json"))
+
+    expanded: str = record.json()
+
+    properties: dict = record.properties(compact_iris=True)
+
+    assert properties["@context"] == "https://linked.art/ns/v1/linked-art.json"
+    assert properties["id"] == "ex:object/1"
+    assert properties["classified_as"][0]["id"] == "aat:300133025"
+
+    # Compacting IRIs does not affect, or make use of, the cached serializations
+    compacted: str = record.json(compact_iris=True)
+
+    assert '"aat:300133025"' in compacted
+    assert record.json() == expanded
+
+    handle = io.StringIO()
+    record.dump(handle, compact_iris=True)
+
+    assert handle.getvalue() == compacted
+
+    record.save(str(tmp_path / "object.json"), compact_iris=True)
+
+    assert (tmp_path / "object.json").read_text() == compacted
+
+    # Documents with compacted or expanded IRIs can be loaded with compacted IRIs, which
+    # are expanded again when serialized
+    for filepath in [path("examples/object.json"), str(tmp_path / "object.json")]:
+        loaded = registry.open(filepath, compact_iris=True)
+
+        assert loaded.id == "ex:object/1"
+        assert loaded.classified_as[0].id == "aat:300133025"
+
+        assert loaded.json() == expanded
+        assert loaded.json(compact_iris=True) == compacted
+
+    # IRIs without a registered namespace, or values that are not IRIs, are left as-is
+    name = registry.Name(ident="https://example.org/name/1", content="https://a.b/c")
+
+    assert name.properties(compact_iris=True)["id"] == "https://example.org/name/1"
+    assert name.properties(compact_iris=True)["content"] == "https://a.b/c"
+
+    with pytest.raises(TypeError):
+        record.json(compact_iris="yes")
+
+    with pytest.raises(TypeError):
+        registry.open(path("examples/object.json"), compact_iris="yes")
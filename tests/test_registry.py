@@ -0,0 +1,101 @@
+import pytest
+
+from semanticpy import Model, ModelRegistry, OverwriteMode
+
+
+def test_registry_independence(path: callable):
+    """Test that model registries built from different profiles are independent of one
+    another, and of the models built via the Model class itself."""
+
+    Model.teardown()
+
+    linkedart = ModelRegistry(profile="linked-art")
+    sample = ModelRegistry(profile="sample")
+
+    assert len(Model._entities) == 0
+
+    assert "HumanMadeObject" in linkedart
+    assert not "HumanMadeObject" in sample
+
+    # Each registry holds its own entity classes, which descend from its model class
+    assert issubclass(linkedart.Type, linkedart.model)
+    assert not issubclass(linkedart.Type, sample.model)
+    assert not linkedart.Type is sample.Type
+
+    entity = sample.Entity(ident="https://data.example.org/entity/1")
+
+    entity.classified_as = sample.Type(ident="https://data.example.org/type/1")
+
+    # The classes of one registry are not accepted within another registry's model
+    with pytest.raises(TypeError):
+        entity.classified_as = linkedart.Type(ident="https://data.example.org/type/2")
+
+    with pytest.raises(AttributeError):
+        sample.HumanMadeObject
+
+    artefact = linkedart.open(path("examples/object.json"))
+
+    assert isinstance(artefact, linkedart.HumanMadeObject)
+
+    with open(path("examples/object.json")) as handle:
+        assert artefact.json(indent=2) == handle.read()
+
+    # Registries may be configured independently
+    linkedart.prefix("aat", "http://vocab.getty.edu/aat/")
+    linkedart.configure(overwrite=OverwriteMode.Error)
+
+    assert linkedart.model._prefixes == {"aat": "http://vocab.getty.edu/aat/"}
+    assert sample.model._prefixes == {}
+
+    assert linkedart.HumanMadeObject._overwrite_mode is OverwriteMode.Error
+    assert sample.Entity._overwrite_mode is None
+    assert Model._overwrite_mode is None
+
+    linkedart.teardown()
+
+    assert len(linkedart.entities) == 0
+    assert len(sample.entities) == 2
+
+
+def test_registry_extend():
+    """Test that extending a registry's model does not affect any other models."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    other = ModelRegistry(profile="linked-art")
+
+    class Retired(registry.model):
+        _properties = {
+            "reason": {
+                "individual": True,
+                "range": "xsd:string",
+            },
+        }
+
+    registry.extend(
+        Retired,
+        properties=dict(
+            _retired=dict(
+                alias="retired",
+                canonical="_retired",
+                individual=True,
+                range=Retired,
+            ),
+        ),
+        typed=False,
+    )
+
+    assert "_retired" in registry.HumanMadeObject._properties
+    assert not "_retired" in other.HumanMadeObject._properties
+
+    assert registry.entity("Retired") is Retired
+    assert other.entity("Retired") is None
+
+    assert not "_retired" in Model._canonical
+
+    # Subclasses must descend from the registry's own model class
+    class Unrelated(Model):
+        pass
+
+    with pytest.raises(TypeError):
+        registry.extend(Unrelated)
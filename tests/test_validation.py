@@ -0,0 +1,114 @@
+import pytest
+
+from semanticpy import (
+    ModelRegistry,
+    SemanticPyError,
+    ValidationMode,
+    Violation,
+    ViolationType,
+)
+
+
+def test_validation_deferred():
+    """Test assembling a record in the deferred validation mode, where assignments are
+    not validated as they are made, and validating the whole record afterwards."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    registry.configure(validation=ValidationMode.Deferred)
+
+    artefact = registry.HumanMadeObject(ident="https://data.example.org/object/1")
+    artefact._label = "Example Object"
+
+    # Valid assignments are stored as they would be in the immediate validation mode
+    artefact.identified_by = name = registry.Name(content="Example")
+    artefact.classified_as = registry.Type(ident="http://vocab.getty.edu/aat/300404670")
+
+    assert artefact.validate() == []
+
+    # Invalid assignments, which would raise errors in the immediate validation mode,
+    # are stored, and then reported together by validate() along with their paths
+    artefact.classified_as = "not a type"
+    name.content = registry.Type()
+    artefact.unknown = "value"
+
+    # Nested entities reached by several paths, or cyclically, are validated once
+    name.identified_by = name
+
+    # A property that accepts a single value may be assigned several values
+    artefact._label = ["First", "Second"]
+
+    violations = artefact.validate()
+
+    assert all(isinstance(violation, Violation) for violation in violations)
+
+    assert [(violation.kind, violation.path) for violation in violations] == [
+        (ViolationType.Cardinality, "_label"),
+        (ViolationType.Range, "identified_by[0].content"),
+        (ViolationType.Range, "classified_as[1]"),
+        (ViolationType.Acceptance, "unknown"),
+    ]
+
+    assert violations[1].entity == "Name"
+    assert violations[1].property == "content"
+    assert isinstance(violations[1].value, registry.Type)
+
+    assert violations[2].value == "not a type"
+
+    with pytest.raises(SemanticPyError) as error:
+        artefact.validate(raises=True)
+
+    assert "4 violation(s)" in str(error.value)
+    assert " - unknown: " in str(error.value)
+
+    # In the immediate validation mode, invalid assignments raise errors once again
+    registry.configure(validation="immediate")
+
+    with pytest.raises(TypeError):
+        artefact.classified_as = "not a type"
+
+    with pytest.raises(TypeError):
+        registry.configure(validation=True)
+
+    with pytest.raises(TypeError):
+        artefact.validate(raises="yes")
+
+
+def test_validation_trusted_cardinality():
+    """Test that a property accepting a single value which holds several values in a
+    document loaded in trusted mode keeps all of its values, so that validate() reports
+    the cardinality violation, rather than only keeping its last value."""
+
+    registry = ModelRegistry(profile="linked-art")
+
+    artefact = registry.HumanMadeObject(
+        data={
+            "id": "https://data.example.org/object/1",
+            "type": "HumanMadeObject",
+            "_label": ["First", "Second"],
+            "identified_by": [
+                {"type": "Name", "content": ["Example", "Other"]},
+            ],
+        },
+        trusted=True,
+    )
+
+    assert artefact._label == ["First", "Second"]
+
+    violations = artefact.validate()
+
+    assert [(violation.kind, violation.path) for violation in violations] == [
+        (ViolationType.Cardinality, "_label"),
+        (ViolationType.Cardinality, "identified_by[0].content"),
+    ]
+
+    assert violations[0].value == ["First", "Second"]
+
+    # A single value held within a list is stored as the property's value
+    artefact = registry.HumanMadeObject(
+        data={"type": "HumanMadeObject", "_label": ["First"]},
+        trusted=True,
+    )
+
+    assert artefact._label == "First"
+    assert artefact.validate() == []